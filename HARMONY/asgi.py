@@ -3,6 +3,10 @@ ASGI config for HARMONY project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve it with uvicorn workers under gunicorn:
+
+    gunicorn HARMONY.asgi:application -k uvicorn_worker.UvicornWorker
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
@@ -12,5 +16,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'HARMONY.settings')
+os.environ.setdefault('SERVE_ASGI', 'True')
 
 application = get_asgi_application()
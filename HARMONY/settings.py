@@ -5,6 +5,7 @@ Django settings for HARMONY project
 from pathlib import Path
 import os
 import sys
+import tempfile
 import dj_database_url
 from dotenv import load_dotenv
 
@@ -88,12 +89,15 @@ INSTALLED_APPS = [
 # MIDDLEWARE
 # --------------------------------------------------
 MIDDLEWARE = [
+    "app.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "app.middleware.StaticFilesMiddleware",  # WhiteNoise, async capable
+    "app.middleware.RequestProfilingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "app.middleware.RateLimitMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -104,6 +108,10 @@ MIDDLEWARE = [
 # --------------------------------------------------
 ROOT_URLCONF = "HARMONY.urls"
 WSGI_APPLICATION = "HARMONY.wsgi.application"
+ASGI_APPLICATION = "HARMONY.asgi.application"
+
+# Set by HARMONY/asgi.py when serving under uvicorn workers
+SERVE_ASGI = os.environ.get("SERVE_ASGI", "False") == "True"
 
 # --------------------------------------------------
 # TEMPLATES
@@ -112,13 +120,25 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Compiled templates are kept per worker; gunicorn.conf.py fills
+            # the cache at boot (app/warmup.py). runserver clears
+            # it whenever a template changes.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "app.fragments.fragment_cache",
             ],
         },
     },
@@ -133,7 +153,6 @@ if DATABASE_URL:
     DATABASES = {
         "default": dj_database_url.config(
             default=DATABASE_URL,
-            conn_max_age=600,
             ssl_require=True,
         )
     }
@@ -149,11 +168,66 @@ else:
         }
     }
 
+# Connection reuse, applied to both configs above.
+#
+# DB_POOL=True (default) keeps a psycopg pool in every worker process.
+# Each process holds DB_POOL_MIN_SIZE..DB_POOL_MAX_SIZE connections, so the
+# server sees up to WEB_CONCURRENCY x DB_POOL_MAX_SIZE of them; keep that
+# (plus migrations, shells and cron jobs) under the Postgres plan's
+# connection limit. A sync gunicorn worker runs one request at a time and
+# needs 1-2; uvicorn (ASGI) workers run requests concurrently and want
+# more, e.g. WEB_CONCURRENCY=4 with max 5 stays at 20.
+#
+# DB_POOL=False falls back to one persistent connection per thread
+# (CONN_MAX_AGE), which is the same as a pool of one for sync workers.
+# Either way reused connections are checked before a request uses them.
+DB_POOL = os.environ.get("DB_POOL", "True") == "True"
+DB_POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE", "5" if SERVE_ASGI else "2"))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "10"))  # wait for a free connection
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", "600"))
+
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+if DB_POOL:
+    # Pooling and persistent connections are mutually exclusive
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": DB_POOL_MIN_SIZE,
+        "max_size": DB_POOL_MAX_SIZE,
+        "timeout": DB_POOL_TIMEOUT,
+    }
+else:
+    # Async views must not keep persistent connections (one per
+    # thread would pile up); ASGI mode opens them per request
+    DATABASES["default"]["CONN_MAX_AGE"] = 0 if SERVE_ASGI else DB_CONN_MAX_AGE
+
 # --------------------------------------------------
 # AUTH PASSWORD
 # --------------------------------------------------
 AUTH_PASSWORD_VALIDATORS = []
 
+# Hasher for new passwords: "scrypt" (default), "argon2" (needs argon2-cffi)
+# or "pbkdf2". Hashes made by the others still verify and are rehashed with
+# this one on the user's next login.
+PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "scrypt")
+_PASSWORD_HASHERS = {
+    "scrypt": "app.hashers.TunedScryptPasswordHasher",
+    "argon2": "app.hashers.TunedArgon2PasswordHasher",
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + ["django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher"]
+
+# Costs (app/hashers.py); scrypt uses about 128 * work factor * block size bytes
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.environ.get("PASSWORD_SCRYPT_WORK_FACTOR", str(2 ** 14)))
+PASSWORD_SCRYPT_BLOCK_SIZE = int(os.environ.get("PASSWORD_SCRYPT_BLOCK_SIZE", "8"))
+PASSWORD_SCRYPT_PARALLELISM = int(os.environ.get("PASSWORD_SCRYPT_PARALLELISM", "1"))
+# Argon2id memory cost is in KiB
+PASSWORD_ARGON2_TIME_COST = int(os.environ.get("PASSWORD_ARGON2_TIME_COST", "2"))
+PASSWORD_ARGON2_MEMORY_COST = int(os.environ.get("PASSWORD_ARGON2_MEMORY_COST", "19456"))
+PASSWORD_ARGON2_PARALLELISM = int(os.environ.get("PASSWORD_ARGON2_PARALLELISM", "1"))
+
 # --------------------------------------------------
 # INTERNATIONALIZATION
 # --------------------------------------------------
@@ -175,9 +249,55 @@ STATICFILES_FINDERS = [
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
 ]
 
-STATICFILES_STORAGE = (
-    "whitenoise.storage.CompressedManifestStaticFilesStorage"
-)
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        # Minifies, bundles and makes WebP copies before WhiteNoise hashes
+        # and compresses (gzip + Brotli); see app/static_pipeline.py
+        "BACKEND": "app.static_pipeline.OptimizedStaticFilesStorage",
+    },
+}
+
+# One stylesheet and one script per page, rendered with {% bundle %}
+# (app/templatetags/static_assets.py). Order matters: it is the cascade
+# and execution order the pages had with separate tags.
+ADMIN_CSS = [
+    "admin", "dashboard", "category", "tribe", "material", "insmaterial", "instrument", "feedback",
+    "testimonial", "tutorial", "instructor", "principle", "sound", "ContactPage", "Offering",
+    "Importance", "Audience", "Member", "InsImage", "Technique", "Significance", "FunFact",
+    "ConstructionStep", "Footer", "HomePage", "History", "Appointment", "site3dcontent", "InsLink", "3D",
+    "data_table",
+]
+# Styles of the panels admin_main includes, in include order
+ADMIN_PANEL_CSS = [
+    "admin_3DModel", "admin_3dContent", "admin_Instrument", "admin_InstrumentImage", "admin_History",
+    "admin_InsLink", "admin_Category", "admin_Tribe", "admin_sound", "admin_Material", "admin_Construction",
+    "admin_Principle", "admin_Instructor", "admin_Tutorial", "admin_PlayingGuide", "admin_Significance",
+    "admin_FunFact", "admin_HomePage", "admin_Offering", "admin_TargetAudience", "admin_TeamMember",
+    "admin_CulturalImportance", "admin_contactPage", "admin_feedback", "admin_testimonial",
+    "admin_Appointment", "admin_Footer",
+]
+STATIC_BUNDLES = {
+    "bundles/front.css": ["css/login.css", "css/Front design/homeF.css"],
+    "bundles/front.js": ["js/frontpage.js", "js/lazy_media.js"],
+    "bundles/user.css": ["css/home/home.css", "css/home/profile.css", "css/home/Appointment.css"],
+    "bundles/user.js": ["js/navbar.js", "js/home/home.js", "js/home/inspage.js", "js/lazy_media.js"],
+    "bundles/admin.css": [f"css/admin/{name}.css" for name in ADMIN_CSS],
+    "bundles/admin-panels.css": [f"css/admin/panels/{name}.css" for name in ADMIN_PANEL_CSS],
+    "bundles/admin.js": [
+        "js/admin/sidenavbar.js", "js/admin/dashboard.js", "js/admin/modal_crud.js", "js/admin/autocomplete.js",
+        "js/admin/data_table.js", "js/admin/bulk_moderation.js", "js/admin/deletion_jobs.js",
+        "js/admin/panels/admin_3DModel.js", "js/admin/panels/admin_History.js",
+        "js/admin/panels/admin_InsLink.js", "js/admin/panels/admin_Instructor.js",
+        "js/admin/panels/admin_Tutorial.js",
+        "js/admin/panels/admin_feedback.js", "js/admin/panels/admin_testimonial.js",
+        "js/admin/panels/admin_Appointment.js",
+    ],
+    "bundles/instrument.css": ["css/instrumentdetailed.css"],
+    "bundles/instrument.js": ["js/instrumentdetailed.js"],
+}
 
 # --------------------------------------------------
 # MEDIA FILES (Cloudflare R2)
@@ -197,7 +317,7 @@ R2_CONFIGURED = all([
 if IS_PRODUCTION and R2_CONFIGURED:
     print("✅ Using Cloudflare R2 for media")
 
-    DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
+    STORAGES["default"] = {"BACKEND": "storages.backends.s3boto3.S3Boto3Storage"}
 
     AWS_ACCESS_KEY_ID = R2_ACCESS_KEY_ID
     AWS_SECRET_ACCESS_KEY = R2_SECRET_ACCESS_KEY
@@ -227,6 +347,197 @@ else:
     MEDIA_URL = "/media/"
     MEDIA_ROOT = BASE_DIR / "images"
 
+# --------------------------------------------------
+# MEDIA PROCESSING (offline ffmpeg jobs)
+# --------------------------------------------------
+FFMPEG_BINARY = os.environ.get("FFMPEG_BINARY", "ffmpeg")
+FFPROBE_BINARY = os.environ.get("FFPROBE_BINARY", "ffprobe")
+MEDIA_PROCESSING_TIMEOUT = int(os.environ.get("MEDIA_PROCESSING_TIMEOUT", "1800"))
+
+# Rungs above the source height are skipped; bitrates are in kbps
+VIDEO_RENDITION_LADDER = [
+    {"label": "1080p", "height": 1080, "video_bitrate": 5000, "audio_bitrate": 128},
+    {"label": "720p", "height": 720, "video_bitrate": 2800, "audio_bitrate": 128},
+    {"label": "480p", "height": 480, "video_bitrate": 1400, "audio_bitrate": 96},
+    {"label": "360p", "height": 360, "video_bitrate": 800, "audio_bitrate": 64},
+]
+VIDEO_HLS_SEGMENT_SECONDS = 6
+VIDEO_POSTER_HEIGHT = 720
+VIDEO_PREVIEW_SECONDS = 6
+VIDEO_PREVIEW_HEIGHT = 360
+
+AUDIO_LOUDNESS_TARGET = -16  # LUFS
+AUDIO_OPUS_BITRATE = 96
+AUDIO_AAC_BITRATE = 128
+AUDIO_WAVEFORM_PEAKS = 100
+
+# 3D models need the gltf-transform and screenshot-glb CLIs (npm)
+GLTF_TRANSFORM_BINARY = os.environ.get("GLTF_TRANSFORM_BINARY", "gltf-transform")
+GLB_SCREENSHOT_BINARY = os.environ.get("GLB_SCREENSHOT_BINARY", "screenshot-glb")
+MODEL_MAX_UPLOAD_MB = 50
+MODEL_TEXTURE_SIZE = 2048
+MODEL_LOD_TEXTURE_SIZE = 512
+MODEL_LOD_RATIO = 0.25
+MODEL_POSTER_SIZE = 1024
+
+# --------------------------------------------------
+# REQUEST PROFILING / LOGGING
+# --------------------------------------------------
+# Fraction of requests profiled (0 disables, 1 profiles everything)
+REQUEST_PROFILING_SAMPLE_RATE = float(
+    os.environ.get("REQUEST_PROFILING_SAMPLE_RATE", "1.0" if DEBUG else "0.1")
+)
+REQUEST_PROFILING_SLOW_MS = int(os.environ.get("REQUEST_PROFILING_SLOW_MS", "500"))
+REQUEST_PROFILING_DUPLICATE_THRESHOLD = 5  # same query this often = likely N+1
+REQUEST_PROFILING_BUFFER_SIZE = 50
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "simple": {"format": "%(asctime)s %(levelname)s %(name)s %(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "simple"},
+    },
+    "loggers": {
+        "app": {
+            "handlers": ["console"],
+            "level": os.environ.get("APP_LOG_LEVEL", "DEBUG" if DEBUG else "INFO"),
+        },
+    },
+}
+
+# --------------------------------------------------
+# METRICS (/metrics)
+# --------------------------------------------------
+# gunicorn.conf.py sets PROMETHEUS_MULTIPROC_DIR so workers share samples
+# Scrapers must send "Authorization: Bearer <token>" when this is set
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+# Without a token /metrics is only served in development
+METRICS_REQUIRE_TOKEN = IS_PRODUCTION
+
+if METRICS_REQUIRE_TOKEN and not METRICS_TOKEN:
+    print("⚠️ METRICS_TOKEN not set: /metrics is disabled")
+
+# Per-process cache that reports hits and misses to /metrics
+CACHES = {
+    "default": {
+        "BACKEND": "app.metrics.MetricsLocMemCache",
+        "LOCATION": "philharmonia",
+    },
+}
+
+# --------------------------------------------------
+# RATE LIMITING (app/ratelimit.py)
+# --------------------------------------------------
+# Buckets live in their own cache so all workers share them. Without Redis
+# they fall back to a per-process cache: every worker counts separately, so
+# WEB_CONCURRENCY workers let a client through up to that many times each
+# limit. Fine for development, set RATE_LIMIT_REDIS_URL in production.
+RATE_LIMIT_REDIS_URL = os.environ.get("RATE_LIMIT_REDIS_URL", "")
+CACHES["ratelimit"] = (
+    {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": RATE_LIMIT_REDIS_URL}
+    if RATE_LIMIT_REDIS_URL
+    else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "ratelimit"}
+)
+
+if IS_PRODUCTION and not RATE_LIMIT_REDIS_URL:
+    print(
+        "⚠️ RATE_LIMIT_REDIS_URL not set: rate limits are counted per worker, "
+        f"up to {os.environ.get('WEB_CONCURRENCY', '1')}x each limit"
+    )
+RATE_LIMIT_CACHE = "ratelimit"
+# Reverse proxies in front of gunicorn that append to X-Forwarded-For;
+# 0 uses REMOTE_ADDR
+RATE_LIMIT_PROXY_COUNT = int(os.environ.get("RATE_LIMIT_PROXY_COUNT", "1" if IS_PRODUCTION else "0"))
+# url name -> bursts of up to limit requests, refilled at limit per period
+# seconds, for each client (a token bucket, see app/ratelimit.py). key is
+# "ip" (default) or "user" (the logged-in user, else the IP); methods
+# defaults to POST only, so viewing the pages is never limited.
+RATE_LIMITS = {
+    "login": {"limit": 10, "period": 60},
+    "register": {"limit": 5, "period": 600},
+    "check_date_availability": {"limit": 30, "period": 60},
+    "increment_video_view": {"limit": 30, "period": 60},
+    "contact": {"limit": 5, "period": 600},
+    "User_contact": {"limit": 5, "period": 600, "key": "user"},
+    "post_forum_message": {"limit": 20, "period": 60, "key": "user"},
+}
+
+# --------------------------------------------------
+# TEMPLATE FRAGMENT CACHE
+# --------------------------------------------------
+# Navbar, footer and card partials are cached per content version
+# (app/fragments.py); the timeout only bounds staleness of data that does
+# not bump the version (instrument icons, testimonial authors)
+FRAGMENT_CACHE_SECONDS = int(os.environ.get("FRAGMENT_CACHE_SECONDS", "300"))
+CONTENT_VERSION_FILE = os.environ.get(
+    "CONTENT_VERSION_FILE", os.path.join(tempfile.gettempdir(), "philharmonia-content-version")
+)
+
+# --------------------------------------------------
+# ADMIN DASHBOARD STATS (app/dashboard.py)
+# --------------------------------------------------
+# Seconds the stat card counters are reused; also the cards' refresh interval
+DASHBOARD_STATS_CACHE_SECONDS = int(os.environ.get("DASHBOARD_STATS_CACHE_SECONDS", "30"))
+# PostgreSQL tables estimated to hold this many rows show the planner's
+# estimate instead of an exact COUNT(*); 0 always counts
+DASHBOARD_STATS_ESTIMATE_ABOVE = int(os.environ.get("DASHBOARD_STATS_ESTIMATE_ABOVE", "100000"))
+
+# --------------------------------------------------
+# ADMIN PANEL TABLES (app/tables.py)
+# --------------------------------------------------
+# Rows per page, and the most a client may ask for with ?limit=
+ADMIN_TABLE_PAGE_SIZE = int(os.environ.get("ADMIN_TABLE_PAGE_SIZE", "25"))
+ADMIN_TABLE_MAX_PAGE_SIZE = int(os.environ.get("ADMIN_TABLE_MAX_PAGE_SIZE", "100"))
+# Totals are counted up to this many rows and shown as "N+" above it
+ADMIN_TABLE_COUNT_LIMIT = int(os.environ.get("ADMIN_TABLE_COUNT_LIMIT", "10000"))
+
+# --------------------------------------------------
+# DJANGO ADMIN (/admin/, app/admin.py)
+# --------------------------------------------------
+# Unfiltered changelists of PostgreSQL tables estimated to hold this many
+# rows page with the planner's estimate instead of an exact COUNT(*)
+ADMIN_ESTIMATE_COUNT_ABOVE = int(os.environ.get("ADMIN_ESTIMATE_COUNT_ABOVE", "100000"))
+
+# --------------------------------------------------
+# DATA EXPORTS (app/exports.py)
+# --------------------------------------------------
+# Rows fetched per round trip of the export's server-side cursor
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", "2000"))
+
+# --------------------------------------------------
+# BULK MODERATION (app/moderation.py)
+# --------------------------------------------------
+# Most rows one moderate/<target>/ request may change
+MODERATION_MAX_IDS = int(os.environ.get("MODERATION_MAX_IDS", "500"))
+
+# --------------------------------------------------
+# CASCADE DELETES (app/deletion.py)
+# --------------------------------------------------
+# Rows deleted per statement (and per transaction)
+DELETION_CHUNK_SIZE = int(os.environ.get("DELETION_CHUNK_SIZE", "1000"))
+# Deletes of more rows than this, cascades included, run as background jobs
+DELETION_INLINE_LIMIT = int(os.environ.get("DELETION_INLINE_LIMIT", "2000"))
+# A running job with no progress for this long is taken over by run_deletion_jobs
+DELETION_STALE_SECONDS = int(os.environ.get("DELETION_STALE_SECONDS", "300"))
+
+# --------------------------------------------------
+# HEALTH CHECKS (/health/live/, /health/ready/)
+# --------------------------------------------------
+# Timeouts in seconds for each readiness dependency
+HEALTH_DATABASE_TIMEOUT = 2.0
+HEALTH_CACHE_TIMEOUT = 0.5
+HEALTH_STORAGE_TIMEOUT = 2.0
+# Seconds a readiness result is reused before the checks run again
+HEALTH_CACHE_SECONDS = 5
+# HEAD an object in media storage (R2) as part of readiness
+HEALTH_CHECK_STORAGE = os.environ.get(
+    "HEALTH_CHECK_STORAGE", "True" if IS_PRODUCTION and R2_CONFIGURED else "False"
+) == "True"
+HEALTH_STORAGE_PROBE_KEY = "health-check.txt"
+
 # --------------------------------------------------
 # DEFAULT PK
 # --------------------------------------------------
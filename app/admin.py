@@ -1,42 +1,322 @@
+"""
+Django admin (/admin/) for every model in the app.
+
+Changelists select the relations their columns and __str__ read
+(list_select_related), foreign keys are search boxes (autocomplete_fields,
+prefix searches where a PrefixIndex backs them) instead of <select>s of the
+whole table, and filters/date_hierarchy stick to small or indexed columns.
+No changelist runs COUNT(*) on the unfiltered table: show_full_result_count
+is off, and on PostgreSQL a table the planner estimates at
+ADMIN_ESTIMATE_COUNT_ABOVE rows or more is paged with that estimate.
+"""
+from django.conf import settings
 from django.contrib import admin
-from .models import CustomUser, InstrumentCategory, Region, Material, InstrumentMaterial ,Instrument, Feedback, Testimonial, VideoTutorial, GuidingPrinciples, PrincipleCard, DiscoverSection, Sound, ContactPage, ContactMessage, Offering, CulturalImportance, TargetAudience, TeamMember, SocialLink, InstrumentImage, TechniqueStep, ConstructionStep, CulturalSignificance, Funfact, HomePage, Tagline, SocialMediaLink, FooterSettings, InstrumentPage, PageSection, PerformanceAppointment,LessonAppointment, InstrumentForum, InstrumentMessage, Instrument3DModel, Site3DContent, InstrumentLink
-
-admin.site.register(CustomUser)
-admin.site.register(InstrumentCategory)
-admin.site.register(Region)
-admin.site.register(Material)
-admin.site.register(InstrumentMaterial)
-admin.site.register(Instrument)
-admin.site.register(Sound)
-admin.site.register(Feedback)
-admin.site.register(Testimonial)
-admin.site.register(VideoTutorial)
-admin.site.register(GuidingPrinciples)
-admin.site.register(PrincipleCard)
-admin.site.register(DiscoverSection)
-admin.site.register(ContactPage)
-admin.site.register(ContactMessage)
-admin.site.register(Offering)
-admin.site.register(CulturalImportance)
-admin.site.register(TargetAudience)
-admin.site.register(TeamMember)
-admin.site.register(SocialLink)
-admin.site.register(InstrumentImage)
-admin.site.register(TechniqueStep)
-admin.site.register(ConstructionStep)
-admin.site.register(CulturalSignificance)
-admin.site.register(Funfact)
-admin.site.register(Tagline)
-admin.site.register(HomePage)
-admin.site.register(SocialMediaLink)
-admin.site.register(FooterSettings)
-admin.site.register(InstrumentPage)
-admin.site.register(PageSection)
-admin.site.register(PerformanceAppointment)
-admin.site.register(LessonAppointment)
-admin.site.register(InstrumentForum)
-admin.site.register(InstrumentMessage)
-admin.site.register(Instrument3DModel)
-admin.site.register(Site3DContent)
-admin.site.register(InstrumentLink)
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from .fragments import bump_content_version
+from .models import CustomUser, InstrumentCategory, Region, Material, InstrumentMaterial ,Instrument, Feedback, Testimonial, VideoTutorial, GuidingPrinciples, PrincipleCard, DiscoverSection, Sound, ContactPage, ContactMessage, Offering, CulturalImportance, TargetAudience, TeamMember, SocialLink, InstrumentImage, TechniqueStep, ConstructionStep, CulturalSignificance, Funfact, HomePage, Tagline, SocialMediaLink, FooterSettings, InstrumentPage, PageSection, PerformanceAppointment,LessonAppointment, InstrumentForum, InstrumentMessage, Instrument3DModel, Site3DContent, InstrumentLink, VideoRendition, DeletionJob
+
+
+class EstimatedCountPaginator(Paginator):
+    """Uses pg_class.reltuples for the row count of a large, unfiltered table"""
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 until the table is first analyzed
+            if row and row[0] >= settings.ADMIN_ESTIMATE_COUNT_ABOVE:
+                return row[0]
+        return super().count
+
+
+class BaseAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+
+def set_field(field, value, description, bump=False):
+    """Bulk action setting one field on every selected row in one UPDATE"""
+    @admin.action(description=description)
+    def action(modeladmin, request, queryset):
+        updated = queryset.update(**{field: value})
+        if bump:
+            bump_content_version()  # update() sends no post_save
+        modeladmin.message_user(request, f'{updated} {modeladmin.model._meta.verbose_name_plural} updated.')
+    action.__name__ = f'set_{field}_{str(value).lower()}'
+    return action
+
+
+# Users and content
+@admin.register(CustomUser)
+class CustomUserAdmin(BaseAdmin):
+    list_display = ['username', 'email', 'first_name', 'last_name', 'role', 'is_active', 'date_joined']
+    list_filter = ['role', 'is_active', 'is_staff']
+    search_fields = ['^username', '^email']  # user_username_prefix_idx, user_email_prefix_idx
+    ordering = ['username']
+    actions = [set_field('is_active', True, 'Activate selected users'),
+               set_field('is_active', False, 'Deactivate selected users')]
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'user_permissions':
+            # Permission.__str__ reads its content type
+            kwargs['queryset'] = db_field.remote_field.model.objects.select_related('content_type')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
+
+@admin.register(InstrumentCategory)
+class InstrumentCategoryAdmin(BaseAdmin):
+    list_display = ['name', 'icon']
+    search_fields = ['name']
+
+
+@admin.register(Region)
+class RegionAdmin(BaseAdmin):
+    list_display = ['name']
+    search_fields = ['name']
+
+
+@admin.register(Material)
+class MaterialAdmin(BaseAdmin):
+    list_display = ['name']
+    search_fields = ['name']
+
+
+@admin.register(Instrument)
+class InstrumentAdmin(BaseAdmin):
+    list_display = ['name', 'category', 'region', 'province', 'views', 'date_added']
+    list_select_related = ['category', 'region']
+    list_filter = ['category', 'region']
+    search_fields = ['^name']  # instrument_name_prefix_idx
+    date_hierarchy = 'date_added'  # instrument_added_idx
+    autocomplete_fields = ['category', 'region']
+
+
+@admin.register(InstrumentMaterial)
+class InstrumentMaterialAdmin(BaseAdmin):
+    list_display = ['instrument']
+    list_select_related = ['instrument']
+    autocomplete_fields = ['instrument', 'materials']
+
+
+@admin.register(Sound)
+class SoundAdmin(BaseAdmin):
+    list_display = ['title', 'instrument']
+    list_select_related = ['instrument']
+    autocomplete_fields = ['instrument']
+
+
+@admin.register(InstrumentImage)
+class InstrumentImageAdmin(BaseAdmin):
+    list_display = ['instrument', 'view_type', 'created_at']
+    list_select_related = ['instrument']
+    list_filter = ['view_type']
+    autocomplete_fields = ['instrument']
+
+
+@admin.register(ConstructionStep)
+class ConstructionStepAdmin(BaseAdmin):
+    list_display = ['title', 'instrument', 'order']
+    list_select_related = ['instrument']
+    autocomplete_fields = ['instrument']
+
+
+@admin.register(CulturalSignificance)
+class CulturalSignificanceAdmin(BaseAdmin):
+    list_display = ['instrument', 'created_at']
+    list_select_related = ['instrument']
+    autocomplete_fields = ['instrument']
+
+
+@admin.register(Funfact)
+class FunfactAdmin(BaseAdmin):
+    list_display = ['instrument', 'created_at']
+    list_select_related = ['instrument']
+    autocomplete_fields = ['instrument']
+
+
+@admin.register(Instrument3DModel)
+class Instrument3DModelAdmin(BaseAdmin):
+    list_display = ['instrument', 'date_uploaded']
+    list_select_related = ['instrument']
+    autocomplete_fields = ['instrument']
+
+
+@admin.register(InstrumentLink)
+class InstrumentLinkAdmin(BaseAdmin):
+    list_display = ['title', 'instrument', 'link_type', 'is_primary_source', 'date_added']
+    list_select_related = ['instrument']
+    list_filter = ['link_type', 'is_primary_source']
+    autocomplete_fields = ['instrument']
+    actions = [set_field('is_primary_source', True, 'Mark selected links as primary sources'),
+               set_field('is_primary_source', False, 'Unmark selected links as primary sources')]
+
+
+@admin.register(InstrumentPage)
+class InstrumentPageAdmin(BaseAdmin):
+    list_display = ['title', 'instrument', 'order']
+    list_select_related = ['instrument']
+    search_fields = ['^title']  # page_title_prefix_idx
+    autocomplete_fields = ['instrument']
+
+
+@admin.register(PageSection)
+class PageSectionAdmin(BaseAdmin):
+    list_display = ['__str__', 'section_type', 'order']
+    list_select_related = ['page']
+    list_filter = ['section_type']
+    autocomplete_fields = ['page']
+
+
+# Tutorials
+@admin.register(VideoTutorial)
+class VideoTutorialAdmin(BaseAdmin):
+    list_display = ['title', 'instrument', 'views', 'uploaded_at']
+    list_select_related = ['instrument']
+    search_fields = ['^title']
+    autocomplete_fields = ['instrument']
+
+
+@admin.register(TechniqueStep)
+class TechniqueStepAdmin(BaseAdmin):
+    list_display = ['__str__', 'step_number']
+    list_select_related = ['video_tutorial']
+    autocomplete_fields = ['video_tutorial']
+
+
+@admin.register(VideoRendition)
+class VideoRenditionAdmin(BaseAdmin):
+    list_display = ['__str__', 'kind', 'created_at']
+    list_select_related = ['video_tutorial']
+    list_filter = ['kind']
+    autocomplete_fields = ['video_tutorial']
+
+
+# User submissions
+@admin.register(Feedback)
+class FeedbackAdmin(BaseAdmin):
+    list_display = ['user', 'instrument', 'is_suggestion', 'date_submitted']
+    list_select_related = ['user', 'instrument']
+    list_filter = ['is_suggestion']
+    autocomplete_fields = ['user', 'instrument']
+
+
+@admin.register(Testimonial)
+class TestimonialAdmin(BaseAdmin):
+    list_display = ['user', 'rating', 'approved', 'date_submitted']
+    list_select_related = ['user']
+    list_filter = ['approved', 'rating']
+    date_hierarchy = 'date_submitted'  # testimonial_submitted_idx
+    autocomplete_fields = ['user']
+    actions = [set_field('approved', True, 'Approve selected testimonials', bump=True),
+               set_field('approved', False, 'Unapprove selected testimonials', bump=True)]
+
+
+@admin.register(ContactMessage)
+class ContactMessageAdmin(BaseAdmin):
+    list_display = ['subject', 'name', 'email', 'user', 'is_read', 'submitted_at']
+    list_select_related = ['user']
+    list_filter = ['is_read', 'subject']
+    date_hierarchy = 'submitted_at'  # contact_received_idx
+    autocomplete_fields = ['user']
+    actions = [set_field('is_read', True, 'Mark selected messages as read'),
+               set_field('is_read', False, 'Mark selected messages as unread')]
+
+
+@admin.register(PerformanceAppointment)
+class PerformanceAppointmentAdmin(BaseAdmin):
+    list_display = ['event_name', 'user', 'event_type', 'event_date', 'status', 'created_at']
+    list_select_related = ['user']
+    list_filter = ['status', 'event_type']
+    date_hierarchy = 'event_date'  # performance_date_idx
+    autocomplete_fields = ['user']
+
+
+@admin.register(LessonAppointment)
+class LessonAppointmentAdmin(BaseAdmin):
+    list_display = ['school_name', 'user', 'lesson_date', 'status', 'created_at']
+    list_select_related = ['user']
+    list_filter = ['status']
+    date_hierarchy = 'lesson_date'  # lesson_date_idx
+    autocomplete_fields = ['user']
+
+
+# Forums
+@admin.register(InstrumentForum)
+class InstrumentForumAdmin(BaseAdmin):
+    list_display = ['instrument', 'is_active', 'created_at']
+    list_select_related = ['instrument']
+    list_filter = ['is_active']
+    search_fields = ['^instrument__name']
+    autocomplete_fields = ['instrument']
+    actions = [set_field('is_active', True, 'Open selected forums'),
+               set_field('is_active', False, 'Close selected forums')]
+
+
+@admin.register(InstrumentMessage)
+class InstrumentMessageAdmin(BaseAdmin):
+    list_display = ['__str__', 'created_at']
+    list_select_related = ['author', 'forum__instrument']
+    autocomplete_fields = ['forum', 'author']
+
+
+# Site pages
+@admin.register(GuidingPrinciples)
+class GuidingPrinciplesAdmin(BaseAdmin):
+    search_fields = ['title']
+
+
+@admin.register(PrincipleCard)
+class PrincipleCardAdmin(BaseAdmin):
+    list_display = ['card_type', 'guiding_principles']
+    list_select_related = ['guiding_principles']
+    autocomplete_fields = ['guiding_principles']
+
+
+@admin.register(TeamMember)
+class TeamMemberAdmin(BaseAdmin):
+    list_display = ['name', 'title', 'created_at']
+    search_fields = ['name']
+
+
+@admin.register(SocialLink)
+class SocialLinkAdmin(BaseAdmin):
+    list_display = ['member', 'platform', 'url']
+    list_select_related = ['member']
+    autocomplete_fields = ['member']
+
+
+@admin.register(SocialMediaLink)
+class SocialMediaLinkAdmin(BaseAdmin):
+    list_display = ['platform', 'url', 'is_active']
+    list_filter = ['is_active']
+    actions = [set_field('is_active', True, 'Show selected links', bump=True),
+               set_field('is_active', False, 'Hide selected links', bump=True)]
+
+
+admin.site.register([
+    DiscoverSection, ContactPage, Offering, CulturalImportance, TargetAudience, Tagline, HomePage,
+    FooterSettings, Site3DContent,
+], BaseAdmin)
+
+
+@admin.register(DeletionJob)
+class DeletionJobAdmin(BaseAdmin):
+    # Jobs come from the delete views (app/deletion.py); this only shows their progress
+    list_display = ['label', 'status', 'deleted', 'total', 'created_by', 'created_at', 'finished_at']
+    list_select_related = ['created_by']
+    list_filter = ['status']
+    readonly_fields = ['label', 'model', 'lookup', 'status', 'total', 'deleted', 'error', 'created_by', 'finished_at']
 
+    def has_add_permission(self, request):
+        return False
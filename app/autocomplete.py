@@ -0,0 +1,51 @@
+"""
+Search-as-you-type choices for the admin forms' foreign key fields, so a
+form does not render every user, instrument or page into a <select>.
+
+Each source is a prefix search (field__istartswith, backed by a
+PrefixIndex) over one model, ordered by an indexed column and cut to a
+page of `limit` rows from `offset`; the cost of a lookup does not grow with
+the table. Results are [{"id": pk, "text": label}] plus "more" when there
+is a next page. static/js/admin/autocomplete.js drives the form widget.
+"""
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+MAX_QUERY_LENGTH = 100
+
+
+def sources():
+    from .models import CustomUser, Instrument, InstrumentPage
+
+    # Source name -> (ordered queryset, prefix-searched fields, label expression)
+    return {
+        'users': (CustomUser.objects.order_by('username'), ['username'], F('username')),
+        'instruments': (Instrument.objects.order_by('name'), ['name'], F('name')),
+        'pages': (
+            InstrumentPage.objects.order_by('instrument_id', 'order'),
+            ['title', 'instrument__name'],
+            Concat('instrument__name', Value('-'), 'title'),
+        ),
+    }
+
+
+def search(source, query='', limit=DEFAULT_LIMIT, offset=0):
+    """({"results": [...], "more": bool}) for the source, or None when there is no such source"""
+    try:
+        queryset, fields, label = sources()[source]
+    except KeyError:
+        return None
+    query = query.strip()[:MAX_QUERY_LENGTH]
+    if query:
+        condition = Q()
+        for field in fields:
+            condition |= Q(**{f'{field}__istartswith': query})
+        queryset = queryset.filter(condition)
+    # One row past the page says whether there is another
+    rows = list(queryset.annotate(label=label).values_list('pk', 'label')[offset:offset + limit + 1])
+    return {
+        'results': [{'id': pk, 'text': text} for pk, text in rows[:limit]],
+        'more': len(rows) > limit,
+    }
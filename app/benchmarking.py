@@ -0,0 +1,186 @@
+"""
+Shared helpers for the benchmark_urls, load_test, compare_server_modes and
+benchmark_startup management commands: latency statistics, an HTTP load
+driver, starting a local gunicorn and comparing a run against a stored
+baseline JSON.
+"""
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.db import connection
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'baseline.json'
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies_ms):
+    """p50/p95/p99/max of a list of latencies in milliseconds"""
+    return {
+        'count': len(latencies_ms),
+        'p50_ms': round(percentile(latencies_ms, 50), 2),
+        'p95_ms': round(percentile(latencies_ms, 95), 2),
+        'p99_ms': round(percentile(latencies_ms, 99), 2),
+        'max_ms': round(max(latencies_ms, default=0), 2),
+    }
+
+
+class QueryCounter:
+    """
+    Count queries through connection.execute_wrapper(). Unlike
+    CaptureQueriesContext it has no cap, so pages running thousands of
+    queries are counted correctly.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def fetch(base_url, path, headers, timeout):
+    """GET one path; returns (path, status or None on connection errors, latency ms)"""
+    request = urllib.request.Request(urljoin(base_url, path), headers=headers)
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, OSError):
+        status = None
+    return path, status, (time.perf_counter() - start) * 1000
+
+
+def drive_load(base_url, jobs, headers, concurrency, timeout):
+    """
+    Request every path in jobs from concurrency threads. Returns per-path
+    latency summaries with error counts, an overall '*' entry, and the
+    wall time in seconds.
+    """
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda path: fetch(base_url, path, headers, timeout), jobs))
+    elapsed = time.perf_counter() - started
+
+    latencies = defaultdict(list)
+    failures = defaultdict(int)
+    for path, status, ms in outcomes:
+        latencies[path].append(ms)
+        if status is None or status >= 500:
+            failures[path] += 1
+
+    results = {path: {**summarize(values), 'errors': failures[path]} for path, values in latencies.items()}
+    all_latencies = [ms for values in latencies.values() for ms in values]
+    results['*'] = {**summarize(all_latencies), 'errors': sum(failures.values())}
+    return results, elapsed
+
+
+def start_gunicorn(app, worker_class, workers, port, env=None):
+    """Start gunicorn for app on 127.0.0.1:port from the project directory (using gunicorn.conf.py)"""
+    env = {
+        **os.environ,
+        'PROMETHEUS_MULTIPROC_DIR': tempfile.mkdtemp(prefix='philharmonia-metrics-'),
+        **(env or {}),
+    }
+    command = [
+        sys.executable, '-m', 'gunicorn', app,
+        '-k', worker_class,
+        '-w', str(workers),
+        '-b', f'127.0.0.1:{port}',
+        '--log-level', 'warning',
+    ]
+    return subprocess.Popen(command, cwd=settings.BASE_DIR, env=env)
+
+
+def wait_until_up(base_url, headers, timeout=60):
+    """Poll /health/live/ until it answers; returns False on timeout"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            request = urllib.request.Request(urljoin(base_url, '/health/live/'), headers=headers)
+            with urllib.request.urlopen(request, timeout=2):
+                return True
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.1)
+    return False
+
+
+def load_baseline(path, section):
+    """Return one section ("urls" or "load") of a baseline file, or {} if it does not exist"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get(section, {})
+
+
+def baseline_database(path, section):
+    """The database (connection.vendor) a section of a baseline file was recorded on, None if unknown"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text()).get('databases', {}).get(section)
+
+
+def latency_comparable(path, section):
+    """
+    Whether this run's latencies can be held against the baseline's: a
+    baseline recorded on SQLite says nothing about PostgreSQL timings (and
+    the other way round). Statuses and query counts compare either way.
+    """
+    return baseline_database(path, section) in (None, connection.vendor)
+
+
+def save_baseline(path, section, results):
+    """Replace one section of a baseline file, keeping the others, noting the database it ran on"""
+    path = Path(path)
+    data = json.loads(path.read_text()) if path.exists() else {}
+    data[section] = results
+    data.setdefault('databases', {})[section] = connection.vendor
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+
+def compare(results, baseline, latency_tolerance, query_slack=0, latency=True):
+    """
+    List human readable regressions of results against baseline, both keyed
+    by URL. p95 may grow by latency_tolerance (0.5 = 50%) and query counts
+    by query_slack before a URL counts as regressed; latency=False leaves
+    p95 out (see latency_comparable).
+    """
+    regressions = []
+    for key, current in sorted(results.items()):
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        if 'queries' in previous and current.get('queries', 0) > previous['queries'] + query_slack:
+            regressions.append(f"{key}: {current['queries']} queries (baseline {previous['queries']})")
+        # Sub-millisecond baselines are noise, give them a floor
+        allowed = max(previous.get('p95_ms', 0), 5.0) * (1 + latency_tolerance)
+        if latency and current.get('p95_ms', 0) > allowed:
+            regressions.append(f"{key}: p95 {current['p95_ms']}ms (baseline {previous['p95_ms']}ms)")
+        if current.get('status') and previous.get('status') and current['status'] != previous['status']:
+            regressions.append(f"{key}: status {current['status']} (baseline {previous['status']})")
+    return regressions
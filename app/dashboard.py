@@ -0,0 +1,73 @@
+"""
+Counters for the admin dashboard stat cards.
+
+All counters come from one SQL statement of scalar subqueries instead of
+one query (or worse, one full table fetch) per card. On PostgreSQL a table
+whose planner estimate (pg_class.reltuples, kept up to date by autovacuum)
+is at or above DASHBOARD_STATS_ESTIMATE_ABOVE rows reports that estimate
+instead of a COUNT(*), which would scan the whole table. The result is
+cached for DASHBOARD_STATS_CACHE_SECONDS; the dashboard refreshes its
+cards from get_dashboard_stats at the same interval.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+CACHE_KEY = 'dashboard:stats'
+
+
+def counted_models():
+    from .models import (ContactMessage, CustomUser, Feedback, Funfact, Instrument, InstrumentCategory, Material,
+                         Region, Sound, TeamMember, Testimonial, VideoTutorial)
+
+    # Card key -> model, in dashboard order
+    return {
+        'users': CustomUser,
+        'feedbacks': Feedback,
+        'testimonials': Testimonial,
+        'contact_messages': ContactMessage,
+        'instruments': Instrument,
+        'categories': InstrumentCategory,
+        'materials': Material,
+        'regions': Region,
+        'sounds': Sound,
+        'tutorials': VideoTutorial,
+        'members': TeamMember,
+        'funfacts': Funfact,
+    }
+
+
+def stats_sql(threshold):
+    """(sql, params) selecting a count column per counted model"""
+    quote = connection.ops.quote_name
+    columns, params = [], []
+    for key, model in counted_models().items():
+        table = model._meta.db_table
+        count = f'(SELECT COUNT(*) FROM {quote(table)})'
+        if connection.vendor == 'postgresql' and threshold:
+            # reltuples is -1 for a table that was never analyzed, so it is counted;
+            # the COUNT(*) subplan only runs for the tables that need it
+            count = (
+                f'(SELECT CASE WHEN c.reltuples >= %s THEN c.reltuples::bigint ELSE {count} END '
+                f'FROM pg_class c WHERE c.oid = %s::regclass)'
+            )
+            params += [threshold, quote(table)]
+        columns.append(f'{count} AS {quote(key)}')
+    return 'SELECT ' + ', '.join(columns), params
+
+
+def compute_stats():
+    sql, params = stats_sql(settings.DASHBOARD_STATS_ESTIMATE_ABOVE)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    return dict(zip(counted_models(), (int(value) for value in row)))
+
+
+def dashboard_stats():
+    """{card key: row count}, from the cache when fresh"""
+    stats = cache.get(CACHE_KEY)
+    if stats is None:
+        stats = compute_stats()
+        cache.set(CACHE_KEY, stats, settings.DASHBOARD_STATS_CACHE_SECONDS)
+    return stats
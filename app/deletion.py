@@ -0,0 +1,237 @@
+"""
+Deletes that cascade to many rows: an instrument, a tutorial, a user, a
+forum's messages (views.DeleteInstrument, DeleteTutorial, delete_user,
+delete_all_forum_messages).
+
+QuerySet.delete() hands everything to Django's Collector, which loads every
+related row into memory to send signals before the first DELETE. plan()
+walks the same reverse relations, but into querysets: each dependent table
+is one step, deepest first, with the rows it selects by subquery. A step
+deletes DELETION_CHUNK_SIZE ids at a time, each chunk in its own
+transaction:
+- models without delete signals go with a raw DELETE ... WHERE id IN (...);
+- models with receivers (the content models, see signals.py) go through
+  QuerySet.delete() one chunk at a time, so the receivers still run;
+- SET_NULL relations are cleared with chunked UPDATEs.
+
+Up to DELETION_INLINE_LIMIT rows are deleted within the request. Larger
+deletes become a DeletionJob run on a background thread once the request
+commits, recording its progress on the row (see deletion_job_status);
+`manage.py run_deletion_jobs` resumes a job whose thread died.
+
+Files of deleted rows are recorded as PendingFileDeletion rows in the
+chunk's transaction and removed from storage afterwards on another thread,
+so a slow or failing storage never holds up or rolls back a delete. An HLS
+build is recorded as its directory: its segments have no rows of their own.
+"""
+import logging
+import posixpath
+import threading
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import connections, models, transaction
+from django.db.models import F, Q
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
+from django.utils import timezone
+
+from .media_processing import delete_storage_directory
+from .models import DeletionJob, PendingFileDeletion, VideoRendition
+
+logger = logging.getLogger(__name__)
+
+# on_delete handlers plan() turns into steps; others are left to the Collector
+HANDLED = (models.CASCADE, models.SET_NULL, models.DO_NOTHING)
+
+
+class Step:
+    def __init__(self, queryset, null=None, collect=False):
+        self.queryset = queryset
+        self.null = null                    # SET_NULL: the field to clear instead of deleting
+        self.collect = collect              # delete through the Collector (signals, other on_delete)
+
+
+def dependents(model):
+    """Relations pointing at model, as the Collector finds them (m2m through tables included)"""
+    return [
+        field for field in model._meta.get_fields(include_hidden=True)
+        if field.auto_created and not field.concrete and (field.one_to_one or field.one_to_many)
+    ]
+
+
+def has_delete_signals(model):
+    return any(signal.has_listeners(model) for signal in (pre_delete, post_delete, m2m_changed))
+
+
+def plan(queryset, seen=()):
+    """Steps deleting queryset and what cascades from it, dependents first"""
+    model = queryset.model
+    steps = []
+    collect = has_delete_signals(model) or bool(model._meta.parents) or model in seen
+    if model not in seen:
+        for relation in dependents(model):
+            related = relation.related_model._base_manager.filter(**{f'{relation.field.name}__in': queryset})
+            if relation.on_delete is models.CASCADE:
+                steps += plan(related, seen + (model,))
+            elif relation.on_delete is models.SET_NULL:
+                steps.append(Step(related, null=relation.field.name))
+            elif relation.on_delete not in HANDLED:
+                collect = True  # PROTECT, RESTRICT, SET_DEFAULT, SET()
+    steps.append(Step(queryset.order_by(), collect=collect))
+    return steps
+
+
+def count(steps):
+    return sum(step.queryset.count() for step in steps if step.null is None)
+
+
+def file_names(model, batch):
+    """Names of the files the rows of batch hold, without field defaults"""
+    fields = [field for field in model._meta.concrete_fields if isinstance(field, models.FileField)]
+    if not fields:
+        return []
+    defaults = {field.default for field in fields}
+    return [
+        name for row in batch.values_list(*[field.attname for field in fields])
+        for name in row if name and name not in defaults
+    ]
+
+
+def directory_names(model, batch):
+    """
+    Storage directories the rows of batch own whole: each HLS master
+    playlist sits at the top of the directory transcode_videos uploaded
+    the build to (images/videos/renditions/<tutorial>/<timestamp>), with
+    the variant playlists and segments below it.
+    """
+    if model is not VideoRendition:
+        return []
+    return sorted({
+        posixpath.dirname(name)
+        for tutorial_id, name in batch.filter(kind='hls').values_list('video_tutorial_id', 'file')
+        # never a directory other tutorials' files live in
+        if posixpath.dirname(posixpath.dirname(name)) == f'images/videos/renditions/{tutorial_id}'
+    })
+
+
+def run_step(step, progress=None):
+    model = step.queryset.model
+    while True:
+        ids = list(step.queryset.values_list('pk', flat=True)[:settings.DELETION_CHUNK_SIZE])
+        if not ids:
+            return
+        batch = model._base_manager.filter(pk__in=ids)
+        with transaction.atomic(using=batch.db):
+            if step.null:
+                batch.update(**{step.null: None})
+                continue
+            PendingFileDeletion.objects.bulk_create(
+                [PendingFileDeletion(name=name) for name in file_names(model, batch)]
+                + [PendingFileDeletion(name=name, directory=True) for name in directory_names(model, batch)]
+            )
+            if step.collect:
+                batch.delete()
+            else:
+                batch._raw_delete(batch.db)
+        if progress:
+            progress(len(ids))
+
+
+def run(steps, progress=None):
+    for step in steps:
+        run_step(step, progress)
+    transaction.on_commit(start_file_cleanup)
+
+
+def delete_cascade(model, lookup, label, user=None):
+    """
+    Delete the rows of model matching lookup and everything that cascades
+    from them. Small deletes run now and return None; larger ones return
+    the queued DeletionJob (an unfinished one for the same rows is reused).
+    """
+    steps = plan(model._base_manager.filter(**lookup))
+    total = count(steps)
+    if total <= settings.DELETION_INLINE_LIMIT:
+        run(steps)
+        return None
+    job = DeletionJob.objects.filter(
+        model=model._meta.label, lookup=lookup, status__in=['queued', 'running'],
+    ).first()
+    if job is None:
+        job = DeletionJob.objects.create(
+            label=label[:255], model=model._meta.label, lookup=lookup, total=total, created_by=user,
+        )
+    transaction.on_commit(lambda: start(run_job, job.pk))
+    return job
+
+
+# Background work
+def start(target, *args):
+    def work():
+        try:
+            target(*args)
+        except Exception:
+            logger.exception("%s%r failed", target.__name__, args)
+        finally:
+            # Threads do not share Django connections, close this one
+            connections.close_all()
+
+    thread = threading.Thread(target=work, daemon=True)
+    thread.start()
+    return thread
+
+
+def start_file_cleanup():
+    if PendingFileDeletion.objects.exists():
+        start(delete_pending_files)
+
+
+def claimable():
+    """Jobs nobody is working on: queued, or running without progress for DELETION_STALE_SECONDS"""
+    stale = timezone.now() - timedelta(seconds=settings.DELETION_STALE_SECONDS)
+    return DeletionJob.objects.filter(Q(status='queued') | Q(status='running', updated_at__lt=stale))
+
+
+def run_job(pk):
+    """Run or resume a DeletionJob unless another thread has it; chunks already deleted stay deleted"""
+    if not claimable().filter(pk=pk).update(status='running', updated_at=timezone.now()):
+        return False
+    job = DeletionJob.objects.get(pk=pk)
+    jobs = DeletionJob.objects.filter(pk=pk)
+
+    def progress(deleted):
+        jobs.update(deleted=F('deleted') + deleted, updated_at=timezone.now())
+
+    try:
+        run(plan(apps.get_model(job.model)._base_manager.filter(**job.lookup)), progress)
+    except Exception as e:
+        jobs.update(status='failed', error=f"{type(e).__name__}: {e}"[:1000], finished_at=timezone.now())
+        raise
+    jobs.update(status='done', error='', finished_at=timezone.now())
+    return True
+
+
+def delete_pending_files():
+    """Remove the recorded files and directories from storage; ones that fail stay recorded for the next run"""
+    removed = 0
+    last = 0
+    while True:
+        pending = list(PendingFileDeletion.objects.filter(pk__gt=last).order_by('pk')[:settings.DELETION_CHUNK_SIZE])
+        if not pending:
+            return removed
+        done = []
+        for entry in pending:
+            try:
+                if entry.directory:
+                    delete_storage_directory(entry.name)
+                else:
+                    default_storage.delete(entry.name)
+            except Exception:
+                logger.exception("Could not delete %s from storage", entry.name)
+                continue
+            done.append(entry.pk)
+        PendingFileDeletion.objects.filter(pk__in=done).delete()
+        removed += len(done)
+        last = pending[-1].pk
@@ -0,0 +1,158 @@
+"""
+CSV and JSON downloads of the tables admins used to copy out of the panels
+(export/<name>.<csv|json>, see views.export_data).
+
+Rows are read with values_list(), so only the exported columns are
+fetched and no model instances are built, through
+iterator(chunk_size=EXPORT_CHUNK_SIZE), which on PostgreSQL is a server-side
+cursor: the worker holds one chunk at a time however many rows there are.
+The response is a generator, so the header goes out before the query runs.
+Under ASGI (SERVE_ASGI) Django would collect a sync generator into one
+list before sending it, so there the chunks are handed over as an async
+iterator, each one produced on the request's sync thread.
+"""
+import csv
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import BadRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+# Lines written per chunk of the response
+BATCH = 500
+# A spreadsheet treats cells starting with these as formulas
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class Export:
+    def __init__(self, queryset, columns, filters=None):
+        self.queryset = queryset            # callable, so the models load lazily
+        self.columns = columns              # [(header, field path for values_list)]
+        self.filters = filters or {}        # {param: (lookup, converter)}
+
+
+def exports():
+    from .models import (ContactMessage, Feedback, InstrumentMessage, LessonAppointment, PerformanceAppointment,
+                         Testimonial, UserLogin)
+
+    status = {'status': ('status', str)}
+    return {
+        'performances': Export(PerformanceAppointment.objects.all, [
+            ('id', 'id'), ('user', 'user__username'), ('event_name', 'event_name'), ('event_type', 'event_type'),
+            ('location', 'event_location'), ('date', 'event_date'), ('time', 'event_time'), ('status', 'status'),
+            ('decline_reason', 'decline_reason'), ('message', 'message'), ('created_at', 'created_at'),
+        ], status),
+        'lessons': Export(LessonAppointment.objects.all, [
+            ('id', 'id'), ('user', 'user__username'), ('school_name', 'school_name'), ('class_size', 'class_size'),
+            ('location', 'location'), ('date', 'lesson_date'), ('time', 'lesson_time'), ('status', 'status'),
+            ('decline_reason', 'decline_reason'), ('message', 'message'), ('created_at', 'created_at'),
+        ], status),
+        'contact_messages': Export(ContactMessage.objects.all, [
+            ('id', 'id'), ('name', 'name'), ('email', 'email'), ('user', 'user__username'), ('subject', 'subject'),
+            ('message', 'message'), ('is_read', 'is_read'), ('submitted_at', 'submitted_at'),
+        ]),
+        'feedback': Export(Feedback.objects.all, [
+            ('id', 'id'), ('user', 'user__username'), ('instrument', 'instrument__name'),
+            ('is_suggestion', 'is_suggestion'), ('message', 'message'), ('date_submitted', 'date_submitted'),
+        ]),
+        'testimonials': Export(Testimonial.objects.all, [
+            ('id', 'id'), ('user', 'user__username'), ('rating', 'rating'), ('role', 'role'),
+            ('duration', 'duration'), ('approved', 'approved'), ('message', 'message'),
+            ('date_submitted', 'date_submitted'),
+        ]),
+        'logins': Export(UserLogin.objects.all, [
+            ('id', 'id'), ('user', 'user__username'), ('timestamp', 'timestamp'),
+        ]),
+        'forum_messages': Export(InstrumentMessage.objects.all, [
+            ('id', 'id'), ('instrument', 'forum__instrument__name'), ('author', 'author__username'),
+            ('content', 'content'), ('created_at', 'created_at'),
+        ], {'forum': ('forum_id', int)}),
+    }
+
+
+def rows(export, params):
+    """Lazy iterator of value tuples, in id order"""
+    queryset = export.queryset()
+    for param, (lookup, convert) in export.filters.items():
+        if params.get(param):
+            try:
+                queryset = queryset.filter(**{lookup: convert(params[param])})
+            except ValueError as e:
+                raise BadRequest(f'Invalid {param}') from e
+    fields = [field for header, field in export.columns]
+    return queryset.order_by('pk').values_list(*fields).iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+
+
+class Echo:
+    """csv.writer target that hands back each line instead of storing it"""
+    def write(self, value):
+        return value
+
+
+def csv_cell(value):
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(headers, values):
+    writer = csv.writer(Echo())
+    yield writer.writerow(headers)
+    lines = []
+    for row in values:
+        lines.append(writer.writerow([csv_cell(value) for value in row]))
+        if len(lines) == BATCH:
+            yield ''.join(lines)
+            lines = []
+    if lines:
+        yield ''.join(lines)
+
+
+def stream_json(headers, values):
+    yield '['
+    separator = '\n'
+    lines = []
+    for row in values:
+        lines.append(separator + json.dumps(dict(zip(headers, row)), cls=DjangoJSONEncoder))
+        separator = ',\n'
+        if len(lines) == BATCH:
+            yield ''.join(lines)
+            lines = []
+    yield ''.join(lines) + '\n]\n'
+
+
+async def aiterate(chunks):
+    """Async iterator over a sync one, which runs on the thread the ORM uses"""
+    chunks = iter(chunks)
+    done = object()
+    while (chunk := await sync_to_async(next, thread_sensitive=True)(chunks, done)) is not done:
+        yield chunk
+
+
+FORMATS = {
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+    'json': (stream_json, 'application/json'),
+}
+
+
+def export_response(request, name, fmt):
+    """StreamingHttpResponse for export/<name>.<fmt>, or None when there is no such export"""
+    export = exports().get(name)
+    if export is None or fmt not in FORMATS:
+        return None
+    stream, content_type = FORMATS[fmt]
+    headers = [header for header, field in export.columns]
+    content = stream(headers, rows(export, request.GET))
+    if settings.SERVE_ASGI:
+        content = aiterate(content)
+    response = StreamingHttpResponse(content, content_type=content_type)
+    filename = f'{name}-{timezone.localdate():%Y-%m-%d}.{fmt}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
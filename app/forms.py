@@ -15,7 +15,7 @@ class UserRegisterForm(UserCreationForm):
 
     def clean_email(self):
         email = self.cleaned_data.get('email')
-        if CustomUser.objects.filter(email=email).exists():
+        if CustomUser.objects.filter(email__iexact=email).exists():
             raise forms.ValidationError("This email is already in use. Please choose a different one.")
         return email
 
@@ -30,19 +30,14 @@ class UserLoginForm(AuthenticationForm):
         widget=forms.PasswordInput,
     )
 
-    # Override the default method to customize the error message
+    # clean() has already checked the password through authenticate(), once;
+    # this only customizes the error message for inactive accounts
     def confirm_login_allowed(self, user):
-        # Check the username and password manually to customize the error message
         if not user.is_active:
             raise forms.ValidationError(
                 "Please enter a correct username and password.",
                 code='invalid_login'
             )
-        if not user.check_password(self.cleaned_data['password']):
-            raise forms.ValidationError(
-                "Please enter a correct username and password.",
-                code='invalid_login'
-            )
         return super().confirm_login_allowed(user)  # Call the original method
 
 
@@ -58,7 +53,7 @@ class CustomUserForm(forms.ModelForm):
 
     def clean_email(self):
         email = self.cleaned_data.get('email')
-        if CustomUser.objects.filter(email=email).exclude(id=self.instance.id).exists():
+        if CustomUser.objects.filter(email__iexact=email).exclude(id=self.instance.id).exists():
             raise forms.ValidationError("This email is already in use. Please choose a different one.")
         return email
 
@@ -0,0 +1,54 @@
+"""
+Version stamp for the cached template fragments in app/templates/app/partials
+({% cache %} blocks for the navbar, footer, team, testimonial and principle
+cards).
+
+The stamp is part of every fragment key, so saving or deleting any model
+in CONTENT_MODELS retires all cached fragments at once (see signals.py).
+It is the mtime of a small file rather than a cache entry because the
+default cache is per process; every gunicorn worker on the machine sees
+the bump, not just the one that handled the save.
+"""
+import os
+import time
+
+from django.conf import settings
+
+
+def content_models():
+    from .models import (ContactPage, FooterSettings, GuidingPrinciples, HomePage, PrincipleCard, SocialLink,
+                         SocialMediaLink, TeamMember, Testimonial)
+
+    # Instrument and CustomUser are left out on purpose: instruments are
+    # saved on every detail view (view counter) and users on every login,
+    # which would empty the fragments constantly. Their bits of the
+    # fragments (footer icons, testimonial authors) refresh after
+    # FRAGMENT_CACHE_SECONDS instead.
+    return [
+        SocialMediaLink, FooterSettings, TeamMember, SocialLink, Testimonial, PrincipleCard,
+        GuidingPrinciples, HomePage, ContactPage,
+    ]
+
+
+def content_version():
+    try:
+        return os.stat(settings.CONTENT_VERSION_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def bump_content_version(**kwargs):
+    """Signal receiver (post_save/post_delete); also safe to call directly"""
+    path = settings.CONTENT_VERSION_FILE
+    with open(path, 'a'):
+        pass
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def fragment_cache(request):
+    """Context processor: key and timeout for the {% cache %} fragments"""
+    return {
+        'content_version': content_version(),
+        'fragment_cache_seconds': settings.FRAGMENT_CACHE_SECONDS,
+    }
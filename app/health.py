@@ -0,0 +1,102 @@
+"""
+Dependency checks for the readiness probe (/health/ready/).
+
+The checks run in parallel threads and each is abandoned once it overruns its
+timeout, so a hung database or bucket can never hang the probe. Results
+are kept for HEALTH_CACHE_SECONDS per process so frequent probes do not
+add load of their own.
+"""
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+
+_last_report = None
+_last_report_at = 0.0
+_report_lock = threading.Lock()
+
+
+def check_database():
+    connection = connections['default']
+    with transaction.atomic(), connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # Let the server give up too, not just the probe. Local to the
+            # transaction: a session setting would stay on the pooled
+            # connection and cancel later queries on it
+            cursor.execute("SELECT set_config('statement_timeout', %s, true)",
+                           [str(int(settings.HEALTH_DATABASE_TIMEOUT * 1000))])
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+
+
+def check_cache():
+    key = f"health:{uuid.uuid4().hex}"
+    cache.set(key, 1, 10)
+    found = cache.get(key)
+    cache.delete(key)
+    if found != 1:
+        raise RuntimeError("value written to the cache could not be read back")
+
+
+def check_storage():
+    # exists() is a HEAD request on S3/R2; a missing object is fine, errors are not
+    default_storage.exists(settings.HEALTH_STORAGE_PROBE_KEY)
+
+
+def _start(check):
+    outcome = {}
+
+    def target():
+        start = time.perf_counter()
+        try:
+            check()
+            outcome['ok'] = True
+        except Exception as e:
+            outcome['ok'] = False
+            outcome['error'] = f"{type(e).__name__}: {e}"[:200]
+        finally:
+            outcome['latency_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            # Threads do not share Django connections, close this one
+            connections.close_all()
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread, outcome
+
+
+def _finish(thread, outcome, deadline, timeout):
+    thread.join(max(0.0, deadline - time.monotonic()))
+    if thread.is_alive():
+        return {'ok': False, 'error': f"timed out after {timeout}s", 'latency_ms': round(timeout * 1000, 1)}
+    return outcome
+
+
+def readiness_report():
+    """Run (or reuse) the dependency checks and return the JSON report"""
+    global _last_report, _last_report_at
+    with _report_lock:
+        if _last_report is not None and time.monotonic() - _last_report_at < settings.HEALTH_CACHE_SECONDS:
+            return {**_last_report, 'cached': True}
+
+        checks = {
+            'database': (check_database, settings.HEALTH_DATABASE_TIMEOUT),
+            'cache': (check_cache, settings.HEALTH_CACHE_TIMEOUT),
+        }
+        if settings.HEALTH_CHECK_STORAGE:
+            checks['storage'] = (check_storage, settings.HEALTH_STORAGE_TIMEOUT)
+
+        # Checks run side by side, so the probe takes as long as the slowest one
+        now = time.monotonic()
+        running = {name: (*_start(check), now + timeout, timeout) for name, (check, timeout) in checks.items()}
+        results = {name: _finish(*job) for name, job in running.items()}
+        _last_report = {
+            'status': 'ready' if all(r['ok'] for r in results.values()) else 'unavailable',
+            'checks': results,
+            'timestamp': time.time(),
+        }
+        _last_report_at = time.monotonic()
+        return {**_last_report, 'cached': False}
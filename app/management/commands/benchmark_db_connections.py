@@ -0,0 +1,72 @@
+import copy
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.db.utils import ConnectionHandler
+
+from app.benchmarking import summarize
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the database cost of a request cycle with a fresh connection per request, "
+        "a persistent connection (CONN_MAX_AGE) and the psycopg pool, against the default "
+        "PostgreSQL database, and report the connection-setup latency each one saves."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help="Simulated requests per mode")
+
+    def handle(self, *args, **options):
+        base = settings.DATABASES['default']
+        if 'postgresql' not in base['ENGINE']:
+            raise CommandError("Connection setup is only worth measuring against PostgreSQL.")
+
+        plain = copy.deepcopy(base)
+        plain.setdefault('OPTIONS', {}).pop('pool', None)
+        modes = {
+            'fresh': {**plain, 'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False},
+            'persistent': {**plain, 'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True},
+            'pool': {
+                **plain,
+                'CONN_MAX_AGE': 0,
+                'CONN_HEALTH_CHECKS': True,
+                'OPTIONS': {**plain['OPTIONS'], 'pool': {'min_size': 1, 'max_size': 2}},
+            },
+        }
+
+        results = {}
+        for mode, settings_dict in modes.items():
+            # Pools are keyed by alias, so each mode gets its own
+            alias = f'bench_{mode}'
+            connection = ConnectionHandler({'default': plain, alias: settings_dict})[alias]
+            try:
+                latencies = [self.request_cycle(connection) for _ in range(options['requests'] + 1)][1:]
+            except ImproperlyConfigured as e:
+                self.stdout.write(f"  skip  {mode}: {e}")
+                continue
+            finally:
+                connection.close()
+                if hasattr(connection, 'close_pool'):
+                    connection.close_pool()
+            results[mode] = summarize(latencies)
+            results[mode]['mean_ms'] = round(sum(latencies) / len(latencies), 2)
+
+        fresh = results.get('fresh', {}).get('mean_ms')
+        for mode, r in results.items():
+            saved = f"  saves {fresh - r['mean_ms']:>6.2f}ms/request" if fresh is not None and mode != 'fresh' else ''
+            self.stdout.write(
+                f"  {mode:<10} mean {r['mean_ms']:>7.2f}ms  p50 {r['p50_ms']:>7.2f}ms  p95 {r['p95_ms']:>7.2f}ms{saved}"
+            )
+
+    def request_cycle(self, connection):
+        """What Django does around one request: close_old_connections, a query, close_old_connections"""
+        start = time.perf_counter()
+        connection.close_if_unusable_or_obsolete()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        connection.close_if_unusable_or_obsolete()
+        return (time.perf_counter() - start) * 1000
@@ -0,0 +1,74 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings
+
+USERNAME = 'login-benchmark'
+PASSWORD = 'login-benchmark-password'
+
+
+class Command(BaseCommand):
+    help = (
+        "Log in through POST /login/ with each password hasher and report wall and CPU time per "
+        "login next to the CPU time of a single hash, so repeated password checks show up as "
+        "'hashes per login' above 1. Uses a temporary user."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=20, help="Timed logins per hasher (after one warm-up)")
+        parser.add_argument(
+            '--hasher', action='append', dest='hashers',
+            help="Hasher path to time (repeatable; default: every entry of PASSWORD_HASHERS but the legacy SHA1 one)",
+        )
+
+    def handle(self, *args, **options):
+        hashers = options['hashers'] or [path for path in settings.PASSWORD_HASHERS if 'SHA1' not in path]
+        user = get_user_model().objects.create(username=USERNAME)
+        try:
+            for path in hashers:
+                # Preferred hasher, so logging in does not rehash into another one
+                with override_settings(PASSWORD_HASHERS=[path]):
+                    try:
+                        self.report(path, user, options['rounds'])
+                    except ValueError as e:
+                        # Argon2 without argon2-cffi installed
+                        self.stdout.write(f"{path}: skipped ({e})")
+        finally:
+            user.delete()
+
+    def report(self, path, user, rounds):
+        hasher = get_hasher()
+        user.password = make_password(PASSWORD)
+        user.save(update_fields=['password'])
+        encoded = user.password
+
+        hash_cpu = []
+        for _ in range(rounds):
+            start = time.process_time()
+            hasher.verify(PASSWORD, encoded)
+            hash_cpu.append((time.process_time() - start) * 1000)
+
+        wall, cpu = [], []
+        client = Client()
+        for i in range(rounds + 1):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            response = client.post('/login/', {'username': USERNAME, 'password': PASSWORD})
+            cpu_ms, wall_ms = (time.process_time() - cpu_start) * 1000, (time.perf_counter() - wall_start) * 1000
+            if not response.json().get('success'):
+                raise RuntimeError(f"Login failed: {response.content[:200]!r}")
+            client.logout()
+            if i:
+                wall.append(wall_ms)
+                cpu.append(cpu_ms)
+
+        one_hash = statistics.median(hash_cpu)
+        login_cpu = statistics.median(cpu)
+        self.stdout.write(
+            f"{hasher.algorithm:>8}: one hash {one_hash:7.1f}ms CPU | login p50 {statistics.median(wall):7.1f}ms wall, "
+            f"{login_cpu:7.1f}ms CPU (~{login_cpu / one_hash:.1f} hashes per login)  {path}"
+        )
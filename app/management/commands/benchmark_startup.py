@@ -0,0 +1,67 @@
+import signal
+import statistics
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.benchmarking import start_gunicorn, wait_until_up
+
+DEFAULT_PATHS = ['/', '/about/', '/video/', '/3dModel/']
+
+
+class Command(BaseCommand):
+    help = (
+        "Restart a local gunicorn with and without worker warm-up (WARM_WORKERS) and report "
+        "boot time and time-to-first-byte of the first and second request to each page."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help=f"Pages to time (default: {' '.join(DEFAULT_PATHS)})")
+        parser.add_argument('--rounds', type=int, default=5, help="Restarts per variant; medians are reported")
+        parser.add_argument('--port', type=int, default=8791)
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or DEFAULT_PATHS
+        base_url = f"http://127.0.0.1:{options['port']}"
+        host = next((h for h in settings.ALLOWED_HOSTS if h != '*'), 'localhost')
+        headers = {'User-Agent': 'philharmonia-startup-benchmark', 'Host': host}
+
+        for variant, warm in (('cold', 'False'), ('warm', 'True')):
+            boots, first, second = [], {p: [] for p in paths}, {p: [] for p in paths}
+            for _ in range(options['rounds']):
+                started = time.perf_counter()
+                server = start_gunicorn('HARMONY.wsgi:application', 'sync', 1, options['port'], {'WARM_WORKERS': warm})
+                try:
+                    if not wait_until_up(base_url, headers):
+                        raise CommandError(f"Server did not answer on {base_url}")
+                    boots.append((time.perf_counter() - started) * 1000)
+                    for path in paths:
+                        first[path].append(self.ttfb(base_url, path, headers))
+                        second[path].append(self.ttfb(base_url, path, headers))
+                finally:
+                    server.send_signal(signal.SIGTERM)
+                    server.wait(timeout=30)
+
+            self.stdout.write(f"{variant}: boot {statistics.median(boots):.0f}ms (until /health/live/ answers)")
+            for path in paths:
+                self.stdout.write(
+                    f"  first {statistics.median(first[path]):>8.1f}ms  "
+                    f"second {statistics.median(second[path]):>8.1f}ms  {path}"
+                )
+
+    def ttfb(self, base_url, path, headers):
+        """Milliseconds until the response headers arrive"""
+        request = urllib.request.Request(urljoin(base_url, path), headers=headers)
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                elapsed = (time.perf_counter() - start) * 1000
+                response.read()
+        except urllib.error.HTTPError as e:
+            elapsed = (time.perf_counter() - start) * 1000
+            e.read()
+        return elapsed
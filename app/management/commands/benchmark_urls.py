@@ -0,0 +1,196 @@
+import re
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import URLPattern
+from django.urls.resolvers import RoutePattern
+
+from app import urls as app_urls
+from app.benchmarking import (
+    DEFAULT_BASELINE, QueryCounter, baseline_database, compare, latency_comparable, load_baseline, save_baseline,
+    summarize,
+)
+from app.models import (
+    CustomUser, DeletionJob, InstrumentForum, InstrumentMessage, LessonAppointment, PerformanceAppointment, VideoTutorial,
+)
+
+# GET on these changes data, so they are never benchmarked
+UNSAFE_ROUTE = re.compile(r'delete|remove|set-admin|toggle|approve|status/|cancel|logout|update-|update_profile|/view/$', re.I)
+
+# These only answer POST (a GET gets a 400 or 405), there is nothing to benchmark
+POST_ONLY = {
+    'register/', 'login/', 'api/check-date-availability/', 'moderate/<str:target>/', 'admin_instrument/<int:pk>/messages/',
+}
+
+# Function views name their id argument instead of exposing a model
+KWARG_MODELS = {
+    'user_id': CustomUser,
+    'forum_id': InstrumentForum,
+    'message_id': InstrumentMessage,
+    'video_id': VideoTutorial,
+}
+ROUTE_MODELS = {
+    'performance': PerformanceAppointment,
+    'lesson': LessonAppointment,
+    'deletion_jobs': DeletionJob,
+}
+
+# Routes whose name does not tell who may see them (see role_for)
+ROUTE_ROLES = {
+    'get-user-info/': 'user',
+    'Appointment/create/': 'user',
+    # Admin dashboard data and tools
+    'get_chart_data/': 'admin',
+    'get_category_chart_data/': 'admin',
+    'get_login_chart_data/': 'admin',
+    'get_dashboard_stats/': 'admin',
+    'autocomplete/<str:source>/': 'admin',
+    'export/<str:name>.<str:fmt>': 'admin',
+    'moderate/<str:target>/': 'admin',
+    'deletion_jobs/<int:pk>/': 'admin',
+}
+
+# Values for the <str:...> arguments, per route
+STR_SAMPLES = {
+    'autocomplete/<str:source>/': {'source': 'instruments'},
+    'admin_table/<str:name>/': {'name': 'users'},
+    'export/<str:name>.<str:fmt>': {'name': 'performances', 'fmt': 'csv'},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every GET url in app/urls.py in-process, recording status, query count and latency, "
+        "and fail if any answers outside 2xx/3xx or regresses against the baseline JSON. Run seed_benchmark_data first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help="Timed requests per url (after one warm-up)")
+        parser.add_argument('--only', help="Regex; only benchmark routes matching it")
+        parser.add_argument('--admin', help="Username for admin pages (default: first admin)")
+        parser.add_argument('--user', help="Username for user pages (default: first non-admin user)")
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help="Baseline JSON path")
+        parser.add_argument('--save-baseline', action='store_true', help="Write this run as the new baseline")
+        parser.add_argument('--latency-tolerance', type=float, default=0.5, help="Allowed p95 growth (0.5 = 50%%)")
+        parser.add_argument('--query-slack', type=int, default=0, help="Allowed extra queries per url")
+
+    def handle(self, *args, **options):
+        clients = {
+            'anonymous': self.make_client(None),
+            'user': self.make_client(self.pick_user(options['user'], admin=False)),
+            'admin': self.make_client(self.pick_user(options['admin'], admin=True)),
+        }
+
+        results = {}
+        for route, pattern in self.routes(options['only']):
+            path = self.build_path(route, pattern)
+            if path is None:
+                self.stdout.write(f"  skip  {route} (no sample object)")
+                continue
+            role = self.role_for(route)
+            results[route] = self.measure(clients[role], path, options['repeat'])
+            results[route]['role'] = role
+            r = results[route]
+            self.stdout.write(f"  {r['status']}  {r['queries']:>4}q  p50 {r['p50_ms']:>8.1f}ms  p95 {r['p95_ms']:>8.1f}ms  {path}")
+
+        baseline = load_baseline(options['baseline'], 'urls')
+        latency = latency_comparable(options['baseline'], 'urls')
+        if not latency:
+            self.stdout.write(self.style.WARNING(
+                f"The baseline was recorded on {baseline_database(options['baseline'], 'urls')}, this run uses "
+                f"{connection.vendor}: comparing statuses and query counts only"
+            ))
+        # Every url must work, whatever the baseline says
+        errors = [f"{route}: status {r['status']}" for route, r in results.items() if not 200 <= r['status'] < 400]
+        regressions = errors + compare(results, baseline, options['latency_tolerance'], options['query_slack'], latency)
+
+        if options['save_baseline']:
+            save_baseline(options['baseline'], 'urls', results)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}"))
+
+        if regressions:
+            for line in regressions:
+                self.stderr.write(self.style.ERROR(line))
+            raise CommandError(f"{len(regressions)} regression(s)")
+        self.stdout.write(self.style.SUCCESS(f"{len(results)} urls, no regressions"))
+
+    def make_client(self, user):
+        host = next((h for h in settings.ALLOWED_HOSTS if h != '*'), 'localhost')
+        # Record broken views as a 500 instead of aborting the run
+        client = Client(raise_request_exception=False, HTTP_HOST=host)
+        if user is not None:
+            client.force_login(user)
+        return client
+
+    def pick_user(self, username, admin):
+        users = get_user_model().objects.order_by('pk')
+        if username:
+            return users.get(username=username)
+        user = users.filter(role='admin').first() if admin else users.exclude(role='admin').first()
+        if user is None:
+            raise CommandError("No users to log in with, run seed_benchmark_data first.")
+        return user
+
+    def routes(self, only):
+        for pattern in app_urls.urlpatterns:
+            # include()d apps (allauth) and the regex media route are not ours to benchmark
+            if not isinstance(pattern, URLPattern) or not isinstance(pattern.pattern, RoutePattern):
+                continue
+            route = str(pattern.pattern)
+            if UNSAFE_ROUTE.search(route) or route in POST_ONLY or (only and not re.search(only, route)):
+                continue
+            yield route, pattern
+
+    def role_for(self, route):
+        if route in ROUTE_ROLES:
+            return ROUTE_ROLES[route]
+        if 'admin' in route.lower():
+            return 'admin'
+        if route.lower().startswith('user_') or route.startswith('update_Profile'):
+            return 'user'
+        return 'anonymous'
+
+    def build_path(self, route, pattern):
+        """Fill each <int:...> in the route with the pk of a real row, <str:...> from STR_SAMPLES"""
+        path = '/' + route
+        for name in pattern.pattern.converters:
+            if name in STR_SAMPLES.get(route, {}):
+                path = re.sub(rf'<(\w+:)?{name}>', STR_SAMPLES[route][name], path)
+                continue
+            model = self.model_for(name, route, pattern)
+            pk = model.objects.order_by('pk').values_list('pk', flat=True).first() if model else None
+            if pk is None:
+                return None
+            path = re.sub(rf'<(\w+:)?{name}>', str(pk), path)
+        return path
+
+    def model_for(self, name, route, pattern):
+        if name in KWARG_MODELS:
+            return KWARG_MODELS[name]
+        view_class = getattr(pattern.callback, 'view_class', None)
+        model = getattr(view_class, 'model', None)
+        if model is None and getattr(view_class, 'queryset', None) is not None:
+            model = view_class.queryset.model
+        if model is None:
+            model = next((m for key, m in ROUTE_MODELS.items() if key in route.lower()), None)
+        return model
+
+    def measure(self, client, path, repeat):
+        # Production settings redirect plain http
+        secure = getattr(settings, 'SECURE_SSL_REDIRECT', False)
+        client.get(path, secure=secure)  # warm-up: template and url caches, lazy imports
+        latencies = []
+        for _ in range(repeat):
+            queries = QueryCounter()
+            with connection.execute_wrapper(queries):
+                start = time.perf_counter()
+                response = client.get(path, secure=secure)
+                if response.streaming:
+                    # Exports query while streaming, so read them to the end
+                    b''.join(response.streaming_content)
+                latencies.append((time.perf_counter() - start) * 1000)
+        return {'path': path, 'status': response.status_code, 'queries': queries.count, **summarize(latencies)}
@@ -0,0 +1,94 @@
+import signal
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.benchmarking import drive_load, start_gunicorn, wait_until_up
+
+# The I/O-bound JSON endpoints that are async views
+DEFAULT_PATHS = [
+    '/api/instruments/provinces-with-instruments/',
+    '/api/instruments/province/?province_name=Bench',
+    '/check-auth-status/',
+    '/health/live/',
+]
+
+MODES = {
+    'sync': ('HARMONY.wsgi:application', 'sync'),
+    'asgi': ('HARMONY.asgi:application', 'uvicorn_worker.UvicornWorker'),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Start gunicorn with sync workers and with uvicorn (ASGI) workers in turn, drive the same "
+        "concurrent load at each and report throughput, latency and total worker memory (Linux)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help="Paths to request in rotation (default: the async JSON endpoints)")
+        parser.add_argument('--modes', default='sync,asgi', help="Comma separated: sync, asgi")
+        parser.add_argument('--workers', type=int, default=2, help="Worker processes for every mode")
+        parser.add_argument('--sync-workers', type=int, help="Override --workers for sync mode (to match memory)")
+        parser.add_argument('--asgi-workers', type=int, help="Override --workers for asgi mode (to match memory)")
+        parser.add_argument('--concurrency', type=int, default=64, help="Parallel client connections")
+        parser.add_argument('--requests', type=int, default=2000, help="Total requests per mode")
+        parser.add_argument('--timeout', type=float, default=30.0, help="Per-request timeout in seconds")
+        parser.add_argument('--port', type=int, default=8790)
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or DEFAULT_PATHS
+        modes = [m.strip() for m in options['modes'].split(',') if m.strip()]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f"Unknown mode(s): {', '.join(sorted(unknown))}")
+
+        jobs = [paths[i % len(paths)] for i in range(options['requests'])]
+        base_url = f"http://127.0.0.1:{options['port']}"
+        host = next((h for h in settings.ALLOWED_HOSTS if h != '*'), 'localhost')
+        headers = {'User-Agent': 'philharmonia-load-test', 'Host': host}
+
+        rows = []
+        for mode in modes:
+            workers = options[f'{mode}_workers'] or options['workers']
+            app, worker_class = MODES[mode]
+            self.stdout.write(f"Starting {mode}: {app} -k {worker_class} -w {workers}")
+            server = start_gunicorn(app, worker_class, workers, options['port'])
+            try:
+                if not wait_until_up(base_url, headers):
+                    raise CommandError(f"Server did not answer on {base_url}")
+                drive_load(base_url, paths * 5, headers, 4, options['timeout'])  # warm-up
+                results, elapsed = drive_load(base_url, jobs, headers, options['concurrency'], options['timeout'])
+                rss_mb = self.worker_rss_mb(server.pid)
+            finally:
+                server.send_signal(signal.SIGTERM)
+                server.wait(timeout=30)
+
+            overall = results['*']
+            rows.append((mode, workers, len(jobs) / elapsed, overall, rss_mb))
+            self.stdout.write(
+                f"  {mode:<5} {workers} workers  {len(jobs) / elapsed:>8.1f} req/s  p50 {overall['p50_ms']:>7.1f}ms  "
+                f"p95 {overall['p95_ms']:>7.1f}ms  errors {overall['errors']:>4}  workers RSS {rss_mb:>7.1f} MB"
+            )
+
+        self.stdout.write("Throughput per 100 MB of worker memory:")
+        for mode, workers, rps, overall, rss_mb in rows:
+            per_100mb = rps / rss_mb * 100 if rss_mb else 0
+            self.stdout.write(f"  {mode:<5} {per_100mb:>8.1f} req/s")
+
+    def worker_rss_mb(self, master_pid):
+        """Resident memory of the gunicorn workers (children of master_pid) from /proc"""
+        total_kb = 0
+        for stat in Path('/proc').glob('[0-9]*/stat'):
+            try:
+                fields = stat.read_text().rsplit(')', 1)[1].split()
+                if int(fields[1]) != master_pid:
+                    continue
+                status = (stat.parent / 'status').read_text()
+            except (OSError, IndexError, ValueError):
+                continue
+            for line in status.splitlines():
+                if line.startswith('VmRSS:'):
+                    total_kb += int(line.split()[1])
+        return total_kb / 1024
@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+
+from app.benchmarking import (
+    DEFAULT_BASELINE, baseline_database, compare, drive_load, latency_comparable, load_baseline, save_baseline,
+)
+
+DEFAULT_PATHS = ['/', '/about/', '/video/', '/3dModel/', '/health/']
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive concurrent GET traffic at a running server (e.g. a local gunicorn) and report "
+        "throughput and latency percentiles, failing if p95 regresses against the baseline JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help=f"Paths to request in rotation (default: {' '.join(DEFAULT_PATHS)})")
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--concurrency', type=int, default=16, help="Parallel workers")
+        parser.add_argument('--requests', type=int, default=1000, help="Total requests to send")
+        parser.add_argument('--timeout', type=float, default=30.0, help="Per-request timeout in seconds")
+        parser.add_argument('--as-user', help="Send a session cookie for this username (server must share the database)")
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help="Baseline JSON path")
+        parser.add_argument('--save-baseline', action='store_true', help="Write this run as the new baseline")
+        parser.add_argument('--latency-tolerance', type=float, default=0.5, help="Allowed p95 growth (0.5 = 50%%)")
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or DEFAULT_PATHS
+        headers = {'User-Agent': 'philharmonia-load-test'}
+        if options['as_user']:
+            headers['Cookie'] = f"{settings.SESSION_COOKIE_NAME}={self.session_for(options['as_user'])}"
+
+        jobs = [paths[i % len(paths)] for i in range(options['requests'])]
+        self.stdout.write(
+            f"{len(jobs)} requests, {options['concurrency']} workers against {options['base_url']} ..."
+        )
+
+        results, elapsed = drive_load(options['base_url'], jobs, headers, options['concurrency'], options['timeout'])
+        for path in paths:
+            r = results[path]
+            self.stdout.write(
+                f"  p50 {r['p50_ms']:>8.1f}ms  p95 {r['p95_ms']:>8.1f}ms  p99 {r['p99_ms']:>8.1f}ms  "
+                f"errors {r['errors']:>4}  {path}"
+            )
+        self.stdout.write(f"Throughput {len(jobs) / elapsed:.1f} req/s, overall p95 {results['*']['p95_ms']}ms")
+
+        regressions = [f"{path}: {r['errors']} failed requests" for path, r in results.items() if path != '*' and r['errors']]
+        # The server is expected to run on the same settings, and so the same database, as this command
+        latency = latency_comparable(options['baseline'], 'load')
+        if latency:
+            regressions += compare(results, load_baseline(options['baseline'], 'load'), options['latency_tolerance'])
+        else:
+            self.stdout.write(self.style.WARNING(
+                f"The baseline was recorded on {baseline_database(options['baseline'], 'load')}, this run uses "
+                f"{connection.vendor}: not comparing latencies"
+            ))
+
+        if options['save_baseline']:
+            save_baseline(options['baseline'], 'load', results)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}"))
+
+        if regressions:
+            for line in regressions:
+                self.stderr.write(self.style.ERROR(line))
+            raise CommandError(f"{len(regressions)} regression(s)")
+
+    def session_for(self, username):
+        """Log in through the session backend and return the session key"""
+        try:
+            user = get_user_model().objects.get(username=username)
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"No user named {username}")
+        client = Client()
+        client.force_login(user)
+        return client.cookies[settings.SESSION_COOKIE_NAME].value
+
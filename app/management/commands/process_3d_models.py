@@ -0,0 +1,62 @@
+from django.core.files import File
+from django.core.management.base import BaseCommand
+
+from app.media_processing import MediaProcessingError, local_copy, process_model, work_directory
+from app.models import Instrument3DModel
+
+
+class Command(BaseCommand):
+    help = "Compress 3D model uploads, build a low-poly LOD and render a poster (needs gltf-transform and screenshot-glb)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--id', type=int, action='append', dest='ids', help="Only process this 3D model id (repeatable)")
+        parser.add_argument('--force', action='store_true', help="Reprocess models that are already up to date")
+        parser.add_argument('--limit', type=int, default=0, help="Stop after this many models")
+
+    def handle(self, *args, **options):
+        models = Instrument3DModel.objects.select_related('instrument').exclude(file='').exclude(file__isnull=True).order_by('pk')
+        if options['ids']:
+            models = models.filter(pk__in=options['ids'])
+
+        processed = failed = 0
+        for model in models.iterator():
+            if not options['force'] and model.is_processed:
+                continue
+            if options['limit'] and processed + failed >= options['limit']:
+                break
+
+            self.stdout.write(f"Processing #{model.pk} {model.instrument.name} ...")
+            try:
+                self.process(model)
+            except MediaProcessingError as e:
+                failed += 1
+                self.stderr.write(self.style.ERROR(f"  failed: {e}"))
+                continue
+            processed += 1
+            self.stdout.write(self.style.SUCCESS(
+                f"  {model.original_size:,} -> {model.optimized_size:,} bytes (LOD {model.lod_size:,})"
+            ))
+
+        self.stdout.write(f"{processed} processed, {failed} failed")
+
+    def process(self, model):
+        source_name = model.file.name
+        old_files = [f for f in (model.optimized_file, model.lod_file, model.poster) if f]
+
+        with local_copy(model.file) as source, work_directory() as output_dir:
+            result = process_model(source, output_dir)
+            for field, key in (('optimized_file', 'optimized'), ('lod_file', 'lod'), ('poster', 'poster')):
+                with open(result[key], 'rb') as fh:
+                    getattr(model, field).save(result[key].name, File(fh), save=False)
+            model.original_size = source.stat().st_size
+            model.optimized_size = result['optimized'].stat().st_size
+            model.lod_size = result['lod'].stat().st_size
+
+        model.processed_source = source_name
+        model.save(update_fields=[
+            'optimized_file', 'lod_file', 'poster',
+            'original_size', 'optimized_size', 'lod_size', 'processed_source',
+        ])
+
+        for old in old_files:
+            old.storage.delete(old.name)
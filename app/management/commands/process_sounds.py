@@ -0,0 +1,56 @@
+from django.core.files import File
+from django.core.management.base import BaseCommand
+from django.db.models import F, Q
+
+from app.media_processing import MediaProcessingError, local_copy, process_audio, work_directory
+from app.models import Sound
+
+
+class Command(BaseCommand):
+    help = "Normalise Sound uploads to Opus/AAC and store duration and waveform peaks (needs ffmpeg)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--id', type=int, action='append', dest='ids', help="Only process this sound id (repeatable)")
+        parser.add_argument('--force', action='store_true', help="Reprocess sounds that are already up to date")
+        parser.add_argument('--limit', type=int, default=0, help="Stop after this many sounds")
+
+    def handle(self, *args, **options):
+        sounds = Sound.objects.exclude(Q(sound_sample='') | Q(sound_sample__isnull=True)).order_by('pk')
+        if options['ids']:
+            sounds = sounds.filter(pk__in=options['ids'])
+        if not options['force']:
+            sounds = sounds.exclude(processed_source=F('sound_sample'))
+
+        processed = failed = 0
+        for sound in sounds.iterator():
+            if options['limit'] and processed + failed >= options['limit']:
+                break
+            self.stdout.write(f"Processing #{sound.pk} {sound.title or sound.sound_sample.name} ...")
+            try:
+                self.process(sound)
+            except MediaProcessingError as e:
+                failed += 1
+                self.stderr.write(self.style.ERROR(f"  failed: {e}"))
+                continue
+            processed += 1
+            self.stdout.write(self.style.SUCCESS(f"  done ({sound.duration_display()})"))
+
+        self.stdout.write(f"{processed} processed, {failed} failed")
+
+    def process(self, sound):
+        source_name = sound.sound_sample.name
+        old_files = [f for f in (sound.audio_opus, sound.audio_aac) if f]
+
+        with local_copy(sound.sound_sample) as source, work_directory() as output_dir:
+            result = process_audio(source, output_dir)
+            with open(result['opus'], 'rb') as opus, open(result['aac'], 'rb') as aac:
+                sound.audio_opus.save(result['opus'].name, File(opus), save=False)
+                sound.audio_aac.save(result['aac'].name, File(aac), save=False)
+
+        sound.duration = result['duration']
+        sound.peaks = result['peaks']
+        sound.processed_source = source_name
+        sound.save(update_fields=['audio_opus', 'audio_aac', 'duration', 'peaks', 'processed_source'])
+
+        for old in old_files:
+            old.storage.delete(old.name)
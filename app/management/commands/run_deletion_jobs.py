@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from app.deletion import claimable, delete_pending_files, run_job
+from app.models import DeletionJob
+
+
+class Command(BaseCommand):
+    help = ("Run queued deletion jobs, take over running ones with no recent progress, "
+            "and remove storage files left by earlier deletes (cron or after a deploy).")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retry-failed', action='store_true', help="Also rerun jobs that failed")
+
+    def handle(self, *args, **options):
+        if options['retry_failed']:
+            DeletionJob.objects.filter(status='failed').update(status='queued', error='', finished_at=None)
+
+        finished = failed = 0
+        for pk in claimable().order_by('created_at').values_list('pk', flat=True):
+            job = DeletionJob.objects.get(pk=pk)
+            self.stdout.write(f"Deleting {job.label} ({job.deleted} of {job.total} rows done) ...")
+            try:
+                if not run_job(pk):
+                    self.stdout.write("  taken by another worker")
+                    continue
+            except Exception as e:
+                failed += 1
+                self.stderr.write(self.style.ERROR(f"  failed: {e}"))
+                continue
+            finished += 1
+            self.stdout.write(self.style.SUCCESS("  done"))
+
+        removed = delete_pending_files()
+        self.stdout.write(f"{finished} jobs finished, {failed} failed, {removed} files removed")
@@ -0,0 +1,253 @@
+import random
+from datetime import time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from app.fragments import bump_content_version
+from app.models import (
+    ConstructionStep, ContactMessage, CulturalImportance, CulturalSignificance, CustomUser, DeletionJob, DiscoverSection,
+    Feedback, FooterSettings, Funfact, GuidingPrinciples, HomePage, Instrument, Instrument3DModel, InstrumentCategory,
+    InstrumentForum, InstrumentImage, InstrumentLink, InstrumentMaterial, InstrumentMessage, InstrumentPage,
+    LessonAppointment, Material, Offering, PageSection, PerformanceAppointment, PH_PROVINCES, PrincipleCard, Region,
+    Site3DContent, SocialLink, SocialMediaLink, Sound, Tagline, TargetAudience, TeamMember, Testimonial,
+    TechniqueStep, VideoTutorial,
+)
+
+# Everything this command creates is named with this prefix so --flush can find it again
+PREFIX = "Bench"
+
+WORDS = (
+    "gong bamboo kulintang agung kudyapi rondalla bandurria kubing tongatong gabbang "
+    "rhythm melody tradition ritual harvest festival ancestors village elders wedding "
+    "bronze brass wood carved tuned resonant deep bright ceremony dance community "
+    "played struck plucked blown heritage island mountain river province culture song"
+).split()
+
+
+class Command(BaseCommand):
+    help = "Fill the database with realistic bulk data for benchmark_urls and load_test."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--instruments', type=int, default=50)
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--messages', type=int, default=5000, help="Forum messages in total")
+        parser.add_argument('--appointments', type=int, default=500, help="Performance and lesson bookings each")
+        parser.add_argument('--seed', type=int, default=1, help="Random seed, so runs are repeatable")
+        parser.add_argument('--flush', action='store_true', help="Delete previously seeded data first")
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+
+        if options['flush']:
+            self.flush()
+        elif Instrument.objects.filter(name__startswith=PREFIX).exists():
+            raise CommandError("Benchmark data already exists, use --flush to recreate it.")
+
+        with transaction.atomic():
+            users, admin = self.create_users(options['users'])
+            instruments = self.create_instruments(options['instruments'])
+            self.create_pages(instruments)
+            self.create_media(instruments)
+            self.create_forums(instruments, users, options['messages'])
+            self.create_feedback(instruments, users)
+            self.create_appointments(users, options['appointments'])
+            self.create_site_content(instruments)
+        # bulk_create sends no post_save, so retire cached page fragments by hand
+        bump_content_version()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(instruments)} instruments, {len(users)} users and {options['messages']} messages. "
+            f"Log in as {admin.username} / {PREFIX.lower()} (admin) or {users[0].username} / {PREFIX.lower()}."
+        ))
+
+    def flush(self):
+        # Cascades take care of pages, sections, media, forums and messages
+        Instrument.objects.filter(name__startswith=PREFIX).delete()
+        InstrumentCategory.objects.filter(name__startswith=PREFIX).delete()
+        CustomUser.objects.filter(username__startswith=PREFIX.lower()).delete()
+        for model, field in [(Material, 'name'), (ContactMessage, 'name'), (TeamMember, 'name'),
+                             (Offering, 'title'), (CulturalImportance, 'title'), (TargetAudience, 'title'),
+                             (DeletionJob, 'label')]:
+            model.objects.filter(**{f'{field}__startswith': PREFIX}).delete()
+
+    def text(self, words):
+        return ' '.join(self.random.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+    def paragraphs(self, count, words=80):
+        return '\n\n'.join(self.text(words) for _ in range(count))
+
+    def create_users(self, count):
+        # One hash for everyone; hashing per user would dominate the run time
+        password = make_password(PREFIX.lower())
+        admin = CustomUser(username=f"{PREFIX.lower()}_admin", email="bench_admin@example.com", password=password, role='admin')
+        users = [
+            CustomUser(username=f"{PREFIX.lower()}_user{i}", email=f"bench_user{i}@example.com", password=password)
+            for i in range(count)
+        ]
+        CustomUser.objects.bulk_create([admin] + users)
+        return list(CustomUser.objects.filter(username__startswith=f"{PREFIX.lower()}_user").order_by('pk')), admin
+
+    def create_instruments(self, count):
+        categories = InstrumentCategory.objects.bulk_create([
+            InstrumentCategory(name=f"{PREFIX} {name}", description=self.text(20))
+            for name in ('Percussion', 'String', 'Wind', 'Idiophone')
+        ])
+        regions = [
+            Region.objects.get_or_create(name=value)[0]
+            for value, label in self.random.sample(Region.REGION_CHOICES, 6)
+        ]
+        provinces = [value for value, label in PH_PROVINCES]
+
+        Instrument.objects.bulk_create([
+            Instrument(
+                name=f"{PREFIX} instrument {i:04d}",
+                description=self.paragraphs(6),
+                category=self.random.choice(categories),
+                region=self.random.choice(regions),
+                province=self.random.choice(provinces),
+                image=f"images/instruments/images/bench_{i % 10}.jpg",
+                views=self.random.randint(0, 5000),
+            )
+            for i in range(count)
+        ])
+        return list(Instrument.objects.filter(name__startswith=PREFIX).order_by('pk'))
+
+    def create_pages(self, instruments):
+        InstrumentPage.objects.bulk_create([
+            InstrumentPage(instrument=instrument, title=f"{self.text(3)} ({order})", order=order)
+            for instrument in instruments
+            for order in range(1, 4)
+        ])
+        sections = []
+        for page in InstrumentPage.objects.filter(instrument__in=instruments):
+            for order in range(1, 5):
+                section_type = self.random.choice(['description', 'bullet_points', 'quote'])
+                content = (
+                    '\n'.join(self.text(8) for _ in range(6)) if section_type == 'bullet_points'
+                    else self.paragraphs(4)
+                )
+                sections.append(PageSection(
+                    page=page, section_type=section_type, title=self.text(4), content=content, order=order,
+                ))
+        PageSection.objects.bulk_create(sections)
+
+    def create_media(self, instruments):
+        Sound.objects.bulk_create([
+            Sound(instrument=instrument, title=self.text(3), sound_sample=f"images/instruments/sounds/bench_{n}.mp3")
+            for instrument in instruments
+            for n in range(3)
+        ])
+        VideoTutorial.objects.bulk_create([
+            VideoTutorial(
+                instrument=instrument,
+                title=self.text(5),
+                description=self.paragraphs(3),
+                video_file=f"images/videos/tutorials/bench_{n}.mp4",
+                views=self.random.randint(0, 2000),
+            )
+            for instrument in instruments
+            for n in range(2)
+        ])
+
+    def create_forums(self, instruments, users, total):
+        forums = InstrumentForum.objects.bulk_create([InstrumentForum(instrument=i) for i in instruments])
+        messages = [
+            InstrumentMessage(forum=self.random.choice(forums), author=self.random.choice(users), content=self.text(25))
+            for _ in range(total)
+        ]
+        InstrumentMessage.objects.bulk_create(messages, batch_size=1000)
+
+    def create_feedback(self, instruments, users):
+        Feedback.objects.bulk_create([
+            Feedback(
+                user=self.random.choice(users),
+                instrument=self.random.choice(instruments),
+                message=self.text(40),
+                is_suggestion=self.random.random() < 0.3,
+            )
+            for _ in range(len(users))
+        ])
+        Testimonial.objects.bulk_create([
+            Testimonial(user=user, message=self.text(30), rating=self.random.randint(3, 5), approved=self.random.random() < 0.7)
+            for user in users[: len(users) // 2]
+        ])
+
+    def create_appointments(self, users, count):
+        today = timezone.localdate()
+        statuses = [value for value, label in PerformanceAppointment.STATUS_CHOICES]
+        event_types = [value for value, label in PerformanceAppointment.EVENT_TYPE_CHOICES]
+
+        PerformanceAppointment.objects.bulk_create([
+            PerformanceAppointment(
+                user=self.random.choice(users),
+                event_name=self.text(4),
+                event_type=self.random.choice(event_types),
+                event_location=self.text(3),
+                event_date=today + timedelta(days=self.random.randint(-90, 180)),
+                event_time=time(self.random.randint(8, 20)),
+                message=self.text(30),
+                status=self.random.choice(statuses),
+            )
+            for _ in range(count)
+        ])
+        LessonAppointment.objects.bulk_create([
+            LessonAppointment(
+                user=self.random.choice(users),
+                school_name=f"{self.text(2)} School",
+                class_size=self.random.randint(10, 60),
+                lesson_date=today + timedelta(days=self.random.randint(-90, 180)),
+                lesson_time=time(self.random.randint(8, 17)),
+                location=self.text(3),
+                message=self.text(30),
+                status=self.random.choice(statuses),
+            )
+            for _ in range(count)
+        ])
+
+    def create_site_content(self, instruments):
+        """
+        One row of each model the remaining admin pages edit, so benchmark_urls
+        reaches every url. The site-wide content (home page, footer, ...) only
+        goes into empty tables, a real site's stays as it is; --flush leaves it.
+        """
+        instrument = instruments[0]
+        material = Material.objects.create(name=f"{PREFIX} bronze", description=self.text(20))
+        InstrumentMaterial.objects.create(instrument=instrument, description=self.text(20)).materials.add(material)
+        ConstructionStep.objects.create(instrument=instrument, title=self.text(3), description=self.paragraphs(2))
+        InstrumentImage.objects.create(instrument=instrument, view_type='front', image="images/instruments/images/bench_0.jpg")
+        Instrument3DModel.objects.create(instrument=instrument, file="models/bench_0.glb")
+        InstrumentLink.objects.create(instrument=instrument, title=self.text(3), url="https://example.com/")
+        CulturalSignificance.objects.create(instrument=instrument, description=self.paragraphs(2))
+        Funfact.objects.create(instrument=instrument, description=self.text(30))
+        TechniqueStep.objects.create(
+            video_tutorial=VideoTutorial.objects.filter(instrument=instrument).first(),
+            step_number=1, title=self.text(3), description=self.paragraphs(1),
+        )
+
+        ContactMessage.objects.create(
+            name=f"{PREFIX} visitor", email="bench_visitor@example.com", subject="General Inquiry", message=self.text(40),
+        )
+        member = TeamMember.objects.create(name=f"{PREFIX} member", title=self.text(2), back_description=self.text(30))
+        SocialLink.objects.create(member=member, platform='github', url="https://example.com/")
+        for model in (Offering, CulturalImportance, TargetAudience):
+            model.objects.create(title=f"{PREFIX} {self.text(2)}", description=self.text(30))
+        DeletionJob.objects.create(
+            label=f"{PREFIX} instrument", model='app.Instrument', lookup={'pk': 0}, status='done', finished_at=timezone.now(),
+        )
+
+        if not DiscoverSection.objects.exists():
+            DiscoverSection.objects.create(
+                title=self.text(3), description=self.paragraphs(1),
+                mastering_paragraph1=self.paragraphs(1), mastering_paragraph2=self.paragraphs(1),
+            )
+        if not GuidingPrinciples.objects.exists():
+            principles = GuidingPrinciples.objects.create()
+            PrincipleCard.objects.create(guiding_principles=principles, card_type='Mission', accent_color="#FF6B6B")
+        if not SocialMediaLink.objects.exists():
+            SocialMediaLink.objects.create(platform='facebook', url="https://example.com/")
+        for model in (HomePage, Tagline, FooterSettings, Site3DContent):
+            if not model.objects.exists():
+                model.objects.create()
@@ -0,0 +1,77 @@
+import posixpath
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from app.media_processing import (
+    MediaProcessingError, delete_storage_directory, local_copy, transcode_video, upload_directory, work_directory,
+)
+from app.models import VideoTutorial, VideoRendition
+
+
+class Command(BaseCommand):
+    help = "Transcode VideoTutorial uploads into an HLS bitrate ladder, poster frame and preview clip (needs ffmpeg)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--id', type=int, action='append', dest='ids', help="Only process this tutorial id (repeatable)")
+        parser.add_argument('--force', action='store_true', help="Rebuild renditions even if they are up to date")
+        parser.add_argument('--limit', type=int, default=0, help="Stop after this many tutorials")
+
+    def handle(self, *args, **options):
+        tutorials = VideoTutorial.objects.exclude(video_file='').order_by('pk')
+        if options['ids']:
+            tutorials = tutorials.filter(pk__in=options['ids'])
+
+        processed = failed = 0
+        for tutorial in tutorials.iterator():
+            if not options['force'] and tutorial.transcoded_source == tutorial.video_file.name:
+                continue
+            if options['limit'] and processed + failed >= options['limit']:
+                break
+
+            self.stdout.write(f"Transcoding #{tutorial.pk} {tutorial.title} ...")
+            try:
+                self.transcode(tutorial)
+            except MediaProcessingError as e:
+                failed += 1
+                self.stderr.write(self.style.ERROR(f"  failed: {e}"))
+                continue
+            processed += 1
+            self.stdout.write(self.style.SUCCESS("  done"))
+
+        self.stdout.write(f"{processed} transcoded, {failed} failed")
+
+    def transcode(self, tutorial):
+        source_name = tutorial.video_file.name
+        prefix = f"images/videos/renditions/{tutorial.pk}/{timezone.now():%Y%m%d%H%M%S}"
+
+        with local_copy(tutorial.video_file) as source, work_directory() as output_dir:
+            renditions = transcode_video(source, output_dir)
+            stored = upload_directory(output_dir, prefix)
+
+        old_prefixes = {
+            posixpath.dirname(name)
+            for name in tutorial.renditions.filter(kind='hls').values_list('file', flat=True)
+        }
+
+        with transaction.atomic():
+            tutorial.renditions.all().delete()
+            VideoRendition.objects.bulk_create([
+                VideoRendition(
+                    video_tutorial=tutorial,
+                    kind=rendition['kind'],
+                    label=rendition['label'],
+                    file=stored[rendition['path']],
+                    width=rendition['width'],
+                    height=rendition['height'],
+                    bitrate=rendition['bitrate'],
+                    size_bytes=rendition['size_bytes'],
+                )
+                for rendition in renditions
+            ])
+            VideoTutorial.objects.filter(pk=tutorial.pk).update(transcoded_source=source_name)
+
+        # Previous builds are only removed once the new one is live
+        for old_prefix in old_prefixes:
+            delete_storage_directory(old_prefix)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile every project template through the cached loader and report the time taken. "
+        "Fails if any template does not compile."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Include third-party app templates (admin, allauth)")
+
+    def handle(self, *args, **options):
+        compiled, errors, elapsed = warm_templates(include_third_party=options['all'])
+        for name, error in sorted(errors.items()):
+            self.stderr.write(self.style.ERROR(f"{name}: {error}"))
+        self.stdout.write(f"Compiled {compiled} templates in {elapsed * 1000:.0f}ms")
+        if errors:
+            raise CommandError(f"{len(errors)} template(s) failed to compile")
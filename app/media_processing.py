@@ -0,0 +1,416 @@
+"""
+Offline media processing helpers built on a locally installed ffmpeg.
+
+These run from management commands (never inside a request) and work on
+local temporary copies, so they behave the same with local media and R2.
+"""
+import array
+import json
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+
+
+class MediaProcessingError(Exception):
+    """Raised when ffmpeg/ffprobe is missing or fails on a file."""
+
+
+def run_tool(args, binary=False):
+    """
+    Run an external tool and return its stdout (bytes when binary=True),
+    raising MediaProcessingError on failure.
+    """
+    args = [str(arg) for arg in args]
+    try:
+        result = subprocess.run(
+            args,
+            capture_output=True,
+            text=not binary,
+            timeout=settings.MEDIA_PROCESSING_TIMEOUT,
+        )
+    except FileNotFoundError:
+        raise MediaProcessingError(f"{args[0]} is not installed or not on PATH")
+    except subprocess.TimeoutExpired:
+        raise MediaProcessingError(f"{args[0]} timed out after {settings.MEDIA_PROCESSING_TIMEOUT}s")
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors='replace') if binary else result.stderr
+        # ffmpeg writes a long banner to stderr, the useful part is at the end
+        raise MediaProcessingError(stderr.strip()[-1000:] or f"{args[0]} exited with {result.returncode}")
+    return result.stdout
+
+
+def probe(path):
+    """Return ffprobe's JSON description of a media file"""
+    output = run_tool([
+        settings.FFPROBE_BINARY,
+        '-v', 'error',
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        path,
+    ])
+    return json.loads(output or '{}')
+
+
+def probe_video(path):
+    """Return width, height, duration and audio presence of a video file"""
+    info = probe(path)
+    streams = info.get('streams', [])
+    video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+    if video is None:
+        raise MediaProcessingError(f"{Path(path).name} has no video stream")
+
+    return {
+        'width': int(video['width']),
+        'height': int(video['height']),
+        'duration': float(info.get('format', {}).get('duration') or 0),
+        'has_audio': any(s.get('codec_type') == 'audio' for s in streams),
+    }
+
+
+@contextmanager
+def local_copy(field_file):
+    """Yield a local path to the contents of a FieldFile, cleaned up afterwards"""
+    workdir = tempfile.mkdtemp(prefix='philharmonia-')
+    try:
+        path = Path(workdir) / Path(field_file.name).name
+        field_file.open('rb')
+        try:
+            with open(path, 'wb') as destination:
+                for chunk in field_file.chunks():
+                    destination.write(chunk)
+        finally:
+            field_file.close()
+        yield path
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+@contextmanager
+def work_directory():
+    """Yield a scratch directory for tool output, removed afterwards"""
+    workdir = tempfile.mkdtemp(prefix='philharmonia-out-')
+    try:
+        yield Path(workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def directory_size(path):
+    """Total size in bytes of every file under path"""
+    return sum(f.stat().st_size for f in Path(path).rglob('*') if f.is_file())
+
+
+def upload_directory(local_dir, storage_prefix):
+    """
+    Copy every file under local_dir into default storage below storage_prefix,
+    keeping relative paths so playlists can reference their segments.
+    Returns {relative_path: stored_name}.
+    """
+    stored = {}
+    local_dir = Path(local_dir)
+    for path in sorted(local_dir.rglob('*')):
+        if not path.is_file():
+            continue
+        relative = path.relative_to(local_dir).as_posix()
+        with open(path, 'rb') as fh:
+            stored[relative] = default_storage.save(f"{storage_prefix}/{relative}", File(fh))
+    return stored
+
+
+def delete_storage_directory(prefix):
+    """Remove a directory tree from default storage, ignoring missing paths"""
+    try:
+        directories, files = default_storage.listdir(prefix)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    for name in files:
+        default_storage.delete(f"{prefix}/{name}")
+    for name in directories:
+        delete_storage_directory(f"{prefix}/{name}")
+
+
+# --------------------------------------------------
+# VIDEO
+# --------------------------------------------------
+def _even(value):
+    """libx264 needs even frame dimensions"""
+    return max(2, int(round(value / 2.0)) * 2)
+
+
+def select_ladder(source_height, ladder=None):
+    """Rungs no taller than the source; the smallest rung if the source is tiny"""
+    ladder = sorted(ladder or settings.VIDEO_RENDITION_LADDER, key=lambda r: r['height'], reverse=True)
+    rungs = [rung for rung in ladder if rung['height'] <= source_height]
+    return rungs or ladder[-1:]
+
+
+def transcode_hls_ladder(source, output_dir, info):
+    """
+    Encode one HLS variant per ladder rung plus a master playlist.
+    Returns rendition dicts relative to output_dir.
+    """
+    output_dir = Path(output_dir)
+    renditions = []
+    master_lines = ['#EXTM3U', '#EXT-X-VERSION:3']
+
+    for rung in select_ladder(info['height']):
+        height = _even(min(rung['height'], info['height']))
+        width = _even(info['width'] * height / info['height'])
+        video_bitrate = rung['video_bitrate']
+        audio_bitrate = rung['audio_bitrate'] if info['has_audio'] else 0
+
+        rung_dir = output_dir / rung['label']
+        rung_dir.mkdir(parents=True, exist_ok=True)
+
+        args = [
+            settings.FFMPEG_BINARY, '-y', '-i', source,
+            '-vf', f'scale={width}:{height}',
+            '-c:v', 'libx264', '-preset', 'veryfast', '-profile:v', 'main',
+            '-b:v', f'{video_bitrate}k',
+            '-maxrate', f'{int(video_bitrate * 1.07)}k',
+            '-bufsize', f'{int(video_bitrate * 1.5)}k',
+            # fixed GOP so every variant switches on the same boundaries
+            '-g', '48', '-keyint_min', '48', '-sc_threshold', '0',
+        ]
+        if audio_bitrate:
+            args += ['-c:a', 'aac', '-b:a', f'{audio_bitrate}k', '-ac', '2']
+        else:
+            args += ['-an']
+        args += [
+            '-f', 'hls',
+            '-hls_time', str(settings.VIDEO_HLS_SEGMENT_SECONDS),
+            '-hls_playlist_type', 'vod',
+            '-hls_segment_filename', rung_dir / 'segment_%03d.ts',
+            rung_dir / 'index.m3u8',
+        ]
+        run_tool(args)
+
+        bandwidth = (video_bitrate + audio_bitrate) * 1000
+        master_lines.append(f'#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={width}x{height}')
+        master_lines.append(f"{rung['label']}/index.m3u8")
+
+        renditions.append({
+            'kind': 'variant',
+            'label': rung['label'],
+            'path': f"{rung['label']}/index.m3u8",
+            'width': width,
+            'height': height,
+            'bitrate': video_bitrate + audio_bitrate,
+            'size_bytes': directory_size(rung_dir),
+        })
+
+    (output_dir / 'master.m3u8').write_text('\n'.join(master_lines) + '\n')
+    renditions.insert(0, {
+        'kind': 'hls',
+        'label': 'master',
+        'path': 'master.m3u8',
+        'width': renditions[0]['width'],
+        'height': renditions[0]['height'],
+        'bitrate': renditions[0]['bitrate'],
+        'size_bytes': sum(r['size_bytes'] for r in renditions),
+    })
+    return renditions
+
+
+def extract_poster(source, output_dir, info):
+    """Grab a JPEG frame about 10% into the video"""
+    height = _even(min(settings.VIDEO_POSTER_HEIGHT, info['height']))
+    path = Path(output_dir) / 'poster.jpg'
+    run_tool([
+        settings.FFMPEG_BINARY, '-y',
+        '-ss', f"{min(info['duration'] * 0.1, 10):.2f}",
+        '-i', source,
+        '-frames:v', '1',
+        '-vf', f'scale=-2:{height}',
+        '-q:v', '3',
+        path,
+    ])
+    return {
+        'kind': 'poster',
+        'label': 'poster',
+        'path': 'poster.jpg',
+        'width': _even(info['width'] * height / info['height']),
+        'height': height,
+        'bitrate': None,
+        'size_bytes': path.stat().st_size,
+    }
+
+
+def extract_preview(source, output_dir, info):
+    """Encode a short, silent, low resolution MP4 clip from the middle of the video"""
+    seconds = settings.VIDEO_PREVIEW_SECONDS
+    height = _even(min(settings.VIDEO_PREVIEW_HEIGHT, info['height']))
+    start = max(0.0, info['duration'] / 2 - seconds / 2)
+    path = Path(output_dir) / 'preview.mp4'
+    run_tool([
+        settings.FFMPEG_BINARY, '-y',
+        '-ss', f'{start:.2f}',
+        '-i', source,
+        '-t', str(seconds),
+        '-an',
+        '-vf', f'scale=-2:{height}',
+        '-c:v', 'libx264', '-preset', 'veryfast', '-crf', '28',
+        '-movflags', '+faststart',
+        path,
+    ])
+    return {
+        'kind': 'preview',
+        'label': 'preview',
+        'path': 'preview.mp4',
+        'width': _even(info['width'] * height / info['height']),
+        'height': height,
+        'bitrate': None,
+        'size_bytes': path.stat().st_size,
+    }
+
+
+def transcode_video(source, output_dir):
+    """Run the whole video pipeline on a local file and describe what was produced"""
+    info = probe_video(source)
+    renditions = transcode_hls_ladder(source, output_dir, info)
+    renditions.append(extract_poster(source, output_dir, info))
+    renditions.append(extract_preview(source, output_dir, info))
+    return renditions
+
+
+# --------------------------------------------------
+# AUDIO
+# --------------------------------------------------
+def probe_audio(path):
+    """Return the duration in seconds of an audio file"""
+    info = probe(path)
+    if not any(s.get('codec_type') == 'audio' for s in info.get('streams', [])):
+        raise MediaProcessingError(f"{Path(path).name} has no audio stream")
+    return {'duration': float(info.get('format', {}).get('duration') or 0)}
+
+
+def _loudnorm_filter():
+    return f"loudnorm=I={settings.AUDIO_LOUDNESS_TARGET}:TP=-1.5:LRA=11"
+
+
+def encode_opus(source, output_dir):
+    """Loudness normalised Opus in a WebM container"""
+    path = Path(output_dir) / f"{Path(source).stem}.webm"
+    run_tool([
+        settings.FFMPEG_BINARY, '-y', '-i', source,
+        '-vn', '-af', _loudnorm_filter(),
+        '-c:a', 'libopus', '-b:a', f'{settings.AUDIO_OPUS_BITRATE}k',
+        '-ar', '48000',
+        path,
+    ])
+    return path
+
+
+def encode_aac(source, output_dir):
+    """Loudness normalised AAC in an M4A container, playable everywhere"""
+    path = Path(output_dir) / f"{Path(source).stem}.m4a"
+    run_tool([
+        settings.FFMPEG_BINARY, '-y', '-i', source,
+        '-vn', '-af', _loudnorm_filter(),
+        '-c:a', 'aac', '-b:a', f'{settings.AUDIO_AAC_BITRATE}k',
+        '-ar', '44100',
+        '-movflags', '+faststart',
+        path,
+    ])
+    return path
+
+
+def compute_peaks(source, buckets=None):
+    """
+    Decode to 8 kHz mono PCM and return the peak of each bucket scaled to 0-100,
+    small enough to store on the row and draw as a waveform.
+    """
+    buckets = buckets or settings.AUDIO_WAVEFORM_PEAKS
+    raw = run_tool([
+        settings.FFMPEG_BINARY, '-v', 'error', '-i', source,
+        '-vn', '-ac', '1', '-ar', '8000',
+        '-f', 's16le', '-acodec', 'pcm_s16le', '-',
+    ], binary=True)
+
+    samples = array.array('h')
+    samples.frombytes(raw[:len(raw) - len(raw) % 2])
+    if not samples:
+        return [0] * buckets
+
+    size = max(1, len(samples) // buckets)
+    peaks = []
+    for start in range(0, size * buckets, size):
+        chunk = samples[start:start + size]
+        peaks.append(max((abs(v) for v in chunk), default=0))
+
+    loudest = max(peaks) or 1
+    return [round(p * 100 / loudest) for p in peaks]
+
+
+def process_audio(source, output_dir):
+    """Run the whole audio pipeline on a local file"""
+    info = probe_audio(source)
+    return {
+        'duration': info['duration'],
+        'peaks': compute_peaks(source),
+        'opus': encode_opus(source, output_dir),
+        'aac': encode_aac(source, output_dir),
+    }
+
+
+# --------------------------------------------------
+# 3D MODELS
+# --------------------------------------------------
+def _gltf_transform_optimize(source, path, texture_size, extra=()):
+    run_tool([
+        settings.GLTF_TRANSFORM_BINARY, 'optimize', source, path,
+        # meshopt also quantizes vertex attributes
+        '--compress', 'meshopt',
+        '--texture-compress', 'webp',
+        '--texture-size', texture_size,
+        *extra,
+    ])
+    return path
+
+
+def optimize_model(source, output_dir):
+    """Compressed full detail GLB with textures capped at MODEL_TEXTURE_SIZE"""
+    path = Path(output_dir) / f"{Path(source).stem}.glb"
+    return _gltf_transform_optimize(source, path, settings.MODEL_TEXTURE_SIZE, ['--simplify', 'false'])
+
+
+def build_model_lod(source, output_dir):
+    """Simplified low-poly GLB with small textures, shown while the full model loads"""
+    path = Path(output_dir) / f"{Path(source).stem}-lod.glb"
+    return _gltf_transform_optimize(source, path, settings.MODEL_LOD_TEXTURE_SIZE, [
+        '--simplify-ratio', settings.MODEL_LOD_RATIO,
+        '--simplify-error', '0.01',
+    ])
+
+
+def render_model_poster(source, output_dir):
+    """Render a JPEG still of the model with headless model-viewer"""
+    path = Path(output_dir) / f"{Path(source).stem}-poster.jpg"
+    size = settings.MODEL_POSTER_SIZE
+    run_tool([
+        settings.GLB_SCREENSHOT_BINARY,
+        '--input', source,
+        '--output', path,
+        '--width', size,
+        '--height', size,
+        # same background as the gallery viewer
+        '--color', '#f0f0f0',
+    ])
+    return path
+
+
+def process_model(source, output_dir):
+    """Run the whole 3D pipeline on a local file"""
+    return {
+        'optimized': optimize_model(source, output_dir),
+        'lod': build_model_lod(source, output_dir),
+        'poster': render_model_poster(source, output_dir),
+    }
@@ -0,0 +1,76 @@
+"""
+Prometheus metrics for the web tier.
+
+Under gunicorn every worker writes its samples to files in
+PROMETHEUS_MULTIPROC_DIR (set up in gunicorn.conf.py) and /metrics merges
+them, so the numbers cover the whole service, not just the worker that
+answered the scrape. Without that variable (runserver) the default
+in-process registry is used.
+"""
+import os
+
+from django.core.cache.backends.locmem import LocMemCache
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import REGISTRY, multiprocess
+
+REQUESTS = Counter(
+    'philharmonia_http_requests_total',
+    "HTTP requests by url name, method and status",
+    ['view', 'method', 'status'],
+)
+LATENCY = Histogram(
+    'philharmonia_http_request_duration_seconds',
+    "Time spent handling a request, by url name",
+    ['view'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+QUERIES = Histogram(
+    'philharmonia_db_queries_per_request',
+    "Database queries run by one request, by url name",
+    ['view'],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+)
+CACHE_REQUESTS = Counter(
+    'philharmonia_cache_requests_total',
+    "Cache lookups by cache location and result (hit or miss)",
+    ['cache', 'result'],
+)
+RATE_LIMITED = Counter(
+    'philharmonia_rate_limited_total',
+    "Requests refused with 429 by RateLimitMiddleware, by url name",
+    ['view'],
+)
+# Summed over live workers; busy / workers is the utilisation
+WORKERS = Gauge('philharmonia_workers', "Live worker processes", multiprocess_mode='livesum')
+WORKERS_BUSY = Gauge('philharmonia_workers_busy', "Workers currently handling a request", multiprocess_mode='livesum')
+
+WORKERS.set(1)
+
+
+def render_metrics():
+    """Return (body, content_type) for the /metrics endpoint"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+_missing = object()
+
+
+class MetricsLocMemCache(LocMemCache):
+    """LocMemCache that counts hits and misses for /metrics"""
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        self.metrics_alias = name or "default"
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _missing, version)
+        if value is _missing:
+            CACHE_REQUESTS.labels(self.metrics_alias, 'miss').inc()
+            return default
+        CACHE_REQUESTS.labels(self.metrics_alias, 'hit').inc()
+        return value
@@ -1,6 +1,28 @@
 # Create a file: middleware.py
+import contextvars
+import heapq
+import itertools
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import JsonResponse
 from django.shortcuts import redirect
+from django.template.backends.django import Template as DjangoTemplate
 from django.urls import reverse
+from django.utils import timezone
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from app import metrics, ratelimit
+from app.benchmarking import QueryCounter
 
 class LoginRedirectMiddleware:
     def __init__(self, get_response):
@@ -14,4 +36,327 @@ class LoginRedirectMiddleware:
             request.path == '/accounts/google/login/callback/'):
             return redirect('user_home')
             
-        return response
\ No newline at end of file
+        return response
+
+# --------------------------------------------------
+# REQUEST PROFILING
+# --------------------------------------------------
+logger = logging.getLogger('app.profiling')
+
+_current_profile = contextvars.ContextVar('request_profile', default=None)
+
+# Slowest sampled requests of this process, as a min-heap of (total_ms, seq, record)
+_slowest = []
+_slowest_lock = threading.Lock()
+_sequence = itertools.count()
+
+
+def slowest_requests():
+    """Slowest profiled requests seen by this worker process, slowest first"""
+    with _slowest_lock:
+        return [record for _, _, record in sorted(_slowest, reverse=True)]
+
+
+def _remember(record):
+    entry = (record['total_ms'], next(_sequence), record)
+    with _slowest_lock:
+        if len(_slowest) < settings.REQUEST_PROFILING_BUFFER_SIZE:
+            heapq.heappush(_slowest, entry)
+        elif entry[0] > _slowest[0][0]:
+            heapq.heapreplace(_slowest, entry)
+
+
+def fingerprint(sql):
+    """Normalise a query so repeats with different parameters compare equal"""
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+\b', '?', sql)
+    sql = re.sub(r'\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)', '(...)', sql)
+    return sql.replace('%s', '?')
+
+
+# The project middleware below runs in sync and async mode. Under ASGI the
+# ORM runs in executor threads and connections are per thread, so a wrapper
+# entered around get_response() would miss the queries. Instead every
+# connection gets one wrapper that reports to the request's counter and
+# profile through context variables, which follow the request into them.
+_current_counter = contextvars.ContextVar('request_query_counter', default=None)
+
+
+def _observe_query(execute, sql, params, many, context):
+    counter = _current_counter.get()
+    profile = _current_profile.get()
+    if counter is not None:
+        counter.count += 1
+    if profile is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile['sql_ms'] += (time.perf_counter() - start) * 1000
+        profile['queries'][fingerprint(sql)] += 1
+
+
+def _watch(connection):
+    # First in the list: connection.execute_wrapper() pops the last one on exit
+    if _observe_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _observe_query)
+
+
+def _watch_new_connection(sender, connection, **kwargs):
+    _watch(connection)
+
+
+connection_created.connect(_watch_new_connection, dispatch_uid='app_middleware_observe_queries')
+
+
+def _watch_connections():
+    """Connections of this thread opened before the receiver was connected"""
+    for connection in connections.all(initialized_only=True):
+        _watch(connection)
+
+
+def _loaded_user(request):
+    """
+    The user, if the request has already looked it up (AuthenticationMiddleware
+    caches it on the request). Profiling must not trigger the session and user
+    queries itself: they would skew the counts of views that never read the
+    user, and from async code they cannot run at all.
+    """
+    return getattr(request, '_cached_user', None) or getattr(request, '_acached_user', None)
+
+
+def _timed_template_render(original):
+    def render(self, context=None, request=None):
+        profile = _current_profile.get()
+        if profile is None or profile['template_depth']:
+            return original(self, context, request)
+        # Only the outermost render is timed; includes are part of it
+        profile['template_depth'] += 1
+        start = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            profile['template_ms'] += (time.perf_counter() - start) * 1000
+            profile['template_depth'] -= 1
+    render.profiled = True
+    return render
+
+
+class RequestProfilingMiddleware:
+    """
+    Profile a sample of requests: query count, SQL time, repeated queries
+    (N+1), template render time and wall time. Results go to the
+    app.profiling logger as JSON, to a Server-Timing header, and the
+    slowest end up on the admin slow request page.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        if not getattr(DjangoTemplate.render, 'profiled', False):
+            DjangoTemplate.render = _timed_template_render(DjangoTemplate.render)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if random.random() >= settings.REQUEST_PROFILING_SAMPLE_RATE:
+            return self.get_response(request)
+        _watch_connections()
+        profile, token, start = self.begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+        return self.finish(request, response, profile, start, _loaded_user(request))
+
+    async def __acall__(self, request):
+        if random.random() >= settings.REQUEST_PROFILING_SAMPLE_RATE:
+            return await self.get_response(request)
+        profile, token, start = self.begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+        return self.finish(request, response, profile, start, _loaded_user(request))
+
+    def begin(self):
+        profile = {'sql_ms': 0.0, 'template_ms': 0.0, 'template_depth': 0, 'queries': Counter()}
+        return profile, _current_profile.set(profile), time.perf_counter()
+
+    def finish(self, request, response, profile, start, user):
+        total_ms = (time.perf_counter() - start) * 1000
+        record = self.build_record(request, response, profile, total_ms, user)
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={record["sql_ms"]};desc="{record["query_count"]} queries"',
+            f'tpl;dur={record["template_ms"]}',
+            f'total;dur={record["total_ms"]}',
+        ])
+
+        slow = total_ms >= settings.REQUEST_PROFILING_SLOW_MS
+        logger.log(logging.WARNING if slow or record['duplicates'] else logging.INFO, json.dumps(record))
+        _remember(record)
+        return response
+
+    def build_record(self, request, response, profile, total_ms, user):
+        threshold = settings.REQUEST_PROFILING_DUPLICATE_THRESHOLD
+        duplicates = [
+            {'sql': sql[:500], 'count': count}
+            for sql, count in profile['queries'].most_common(5)
+            if count >= threshold
+        ]
+        return {
+            'timestamp': timezone.now().isoformat(),
+            'method': request.method,
+            'path': request.get_full_path()[:300],
+            'status': response.status_code,
+            'user_id': user.pk if user is not None and user.is_authenticated else None,
+            'total_ms': round(total_ms, 1),
+            'sql_ms': round(profile['sql_ms'], 1),
+            'template_ms': round(profile['template_ms'], 1),
+            'query_count': sum(profile['queries'].values()),
+            'duplicates': duplicates,
+        }
+
+
+# --------------------------------------------------
+# PROMETHEUS METRICS
+# --------------------------------------------------
+class MetricsMiddleware:
+    """
+    Record request count, latency and query count per url name for
+    /metrics. Sits first so redirects and static files are counted too.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        _watch_connections()
+        counter, token, start = self.begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            self.end(token)
+        return self.finish(request, response, counter, start)
+
+    async def __acall__(self, request):
+        counter, token, start = self.begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.end(token)
+        return self.finish(request, response, counter, start)
+
+    def begin(self):
+        counter = QueryCounter()
+        token = _current_counter.set(counter)
+        metrics.WORKERS_BUSY.inc()
+        return counter, token, time.perf_counter()
+
+    def end(self, token):
+        metrics.WORKERS_BUSY.dec()
+        _current_counter.reset(token)
+
+    def finish(self, request, response, counter, start):
+        elapsed = time.perf_counter() - start
+        # url name keeps label cardinality bounded, raw paths would not
+        match = getattr(request, 'resolver_match', None)
+        view = (match.view_name if match else None) or 'unresolved'
+        metrics.REQUESTS.labels(view, request.method, str(response.status_code)).inc()
+        metrics.LATENCY.labels(view).observe(elapsed)
+        metrics.QUERIES.labels(view).observe(counter.count)
+        return response
+
+
+# --------------------------------------------------
+# RATE LIMITING
+# --------------------------------------------------
+class RateLimitMiddleware:
+    """
+    Answer 429 with Retry-After once a client has used up its bucket for a
+    url name listed in RATE_LIMITS (see app/ratelimit.py).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # Django would otherwise run process_view in a thread for every request
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        rule = settings.RATE_LIMITS.get(request.resolver_match.url_name)
+        if rule is None or request.method not in rule.get('methods', ('POST',)):
+            return None
+        return self.limit(request, rule)
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        rule = settings.RATE_LIMITS.get(request.resolver_match.url_name)
+        if rule is None or request.method not in rule.get('methods', ('POST',)):
+            return None
+        # The cache, and request.user for "user" keys, are sync only
+        return await sync_to_async(self.limit)(request, rule)
+
+    def limit(self, request, rule):
+        owner = ratelimit.client_key(request, rule.get('key', 'ip'))
+        retry_after = ratelimit.take_token(request.resolver_match.url_name, owner, rule['limit'], rule['period'])
+        if not retry_after:
+            return None
+        metrics.RATE_LIMITED.labels(request.resolver_match.url_name).inc()
+        response = JsonResponse(
+            {'success': False, 'error': 'Too many requests. Please wait a moment and try again.'},
+            status=429,
+        )
+        response['Retry-After'] = str(retry_after)
+        return response
+
+
+# --------------------------------------------------
+# STATIC FILES
+# --------------------------------------------------
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise, which is sync only, able to run in async mode too: a single
+    sync middleware would put every ASGI request, async views included,
+    through a thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            # Opens the file
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
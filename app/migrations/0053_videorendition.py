@@ -0,0 +1,37 @@
+# Generated by Django 5.0.6 on 2026-10-19 04:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0052_lessonappointment_decline_reason_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='videotutorial',
+            name='transcoded_source',
+            field=models.CharField(blank=True, editable=False, help_text='video_file name the current renditions were built from', max_length=255),
+        ),
+        migrations.CreateModel(
+            name='VideoRendition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('hls', 'HLS Master Playlist'), ('variant', 'HLS Variant Playlist'), ('poster', 'Poster Frame'), ('preview', 'Preview Clip')], max_length=10)),
+                ('label', models.CharField(blank=True, max_length=20)),
+                ('file', models.FileField(max_length=255, upload_to='images/videos/renditions/')),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('bitrate', models.PositiveIntegerField(blank=True, help_text='Video + audio bitrate in kbps', null=True)),
+                ('size_bytes', models.PositiveBigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('video_tutorial', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renditions', to='app.videotutorial')),
+            ],
+            options={
+                'ordering': ['kind', '-height'],
+            },
+        ),
+    ]
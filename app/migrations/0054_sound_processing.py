@@ -0,0 +1,38 @@
+# Generated by Django 5.0.6 on 2026-10-19 04:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0053_videorendition'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sound',
+            name='audio_aac',
+            field=models.FileField(blank=True, editable=False, null=True, upload_to='images/instruments/sounds/processed/'),
+        ),
+        migrations.AddField(
+            model_name='sound',
+            name='audio_opus',
+            field=models.FileField(blank=True, editable=False, null=True, upload_to='images/instruments/sounds/processed/'),
+        ),
+        migrations.AddField(
+            model_name='sound',
+            name='duration',
+            field=models.FloatField(blank=True, editable=False, help_text='Length in seconds', null=True),
+        ),
+        migrations.AddField(
+            model_name='sound',
+            name='peaks',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Waveform peaks scaled 0-100'),
+        ),
+        migrations.AddField(
+            model_name='sound',
+            name='processed_source',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.0.6 on 2026-10-19 04:44
+
+import app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0054_sound_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='instrument3dmodel',
+            name='lod_file',
+            field=models.FileField(blank=True, editable=False, null=True, upload_to='images/instruments/3d_models/optimized/'),
+        ),
+        migrations.AddField(
+            model_name='instrument3dmodel',
+            name='lod_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='instrument3dmodel',
+            name='optimized_file',
+            field=models.FileField(blank=True, editable=False, null=True, upload_to='images/instruments/3d_models/optimized/'),
+        ),
+        migrations.AddField(
+            model_name='instrument3dmodel',
+            name='optimized_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='instrument3dmodel',
+            name='original_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='instrument3dmodel',
+            name='poster',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='images/instruments/3d_models/posters/'),
+        ),
+        migrations.AddField(
+            model_name='instrument3dmodel',
+            name='processed_source',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='instrument3dmodel',
+            name='file',
+            field=models.FileField(blank=True, help_text='Upload a 3D model file (.glb, .gltf)', null=True, upload_to='images/instruments/3d_models/', validators=[app.models.validate_3d_model]),
+        ),
+    ]
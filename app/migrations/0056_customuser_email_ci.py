@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:27
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Upper
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """Name the clashing addresses instead of failing on an IntegrityError"""
+    CustomUser = apps.get_model('app', 'CustomUser')
+    duplicates = (
+        CustomUser.objects.exclude(email='')
+        .values(address=Upper('email'))
+        .annotate(accounts=Count('id'))
+        .filter(accounts__gt=1)
+        .values_list('address', flat=True)
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Merge or change the accounts sharing these emails (ignoring case) before migrating: "
+            + ", ".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0055_instrument3dmodel_optimized'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='user_email_upper_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Upper('email'), condition=models.Q(('email', ''), _negated=True), name='unique_user_email_ci', violation_error_message='This email is already in use. Please choose a different one.'),
+        ),
+    ]
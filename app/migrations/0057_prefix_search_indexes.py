@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:32
+
+import app.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0056_customuser_email_ci'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=app.models.PrefixIndex('username', name='user_username_prefix_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='instrument',
+            index=app.models.PrefixIndex('name', name='instrument_name_prefix_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='instrumentpage',
+            index=app.models.PrefixIndex('title', name='page_title_prefix_idx'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:40
+
+import app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0057_prefix_search_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='customuser',
+            name='user_email_upper_idx',
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['submitted_at', 'id'], name='contact_received_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['subject', 'id'], name='contact_subject_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=app.models.PrefixIndex('email', name='user_email_prefix_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='instrument',
+            index=models.Index(fields=['date_added', 'id'], name='instrument_added_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lessonappointment',
+            index=models.Index(fields=['lesson_date', 'id'], name='lesson_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lessonappointment',
+            index=models.Index(fields=['created_at', 'id'], name='lesson_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='performanceappointment',
+            index=models.Index(fields=['event_date', 'id'], name='performance_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='performanceappointment',
+            index=models.Index(fields=['created_at', 'id'], name='performance_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['date_submitted', 'id'], name='testimonial_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['rating', 'id'], name='testimonial_rating_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0059_deletion_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pendingfiledeletion',
+            name='directory',
+            field=models.BooleanField(default=False, help_text='name is a directory, removed with everything under it'),
+        ),
+    ]
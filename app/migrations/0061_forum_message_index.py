@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0060_pending_file_directories'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='instrumentmessage',
+            index=models.Index(fields=['forum', 'created_at', 'id'], name='forum_message_posted_idx'),
+        ),
+    ]
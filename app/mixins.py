@@ -0,0 +1,34 @@
+"""
+Mixins shared by the class-based views in app/views.py.
+"""
+
+
+class CachedObjectMixin:
+    """
+    Look the view's object up once per request. SingleObjectMixin.get_object()
+    queries on every call, and the views call it from get(), post(),
+    get_form(), get_context_data() and form_valid().
+
+    select_related lists the relations the view's template or code reads,
+    so they come in the same query. Views that do work when the object is
+    loaded (e.g. counting a page view) override fetch_object(), which runs
+    once. The cached object is the one the update forms edit; read the saved
+    values from form.initial, not from get_object().
+    """
+    select_related = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        return queryset
+
+    def fetch_object(self):
+        return super().get_object()
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_object'):
+            self._object = self.fetch_object()
+        return self._object
@@ -1,3 +1,5 @@
+import json
+
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.urls import reverse
@@ -7,9 +9,39 @@ from django.utils import timezone
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
 from django.db.models import Max, Count
+from django.db.models.functions import Left, Upper
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
+# List pages show at most a few dozen words of long TextFields, so they
+# fetch this many characters as "<field>_excerpt" instead of the column
+EXCERPT_LENGTH = 300
+
+
+class PrefixIndex(models.Index):
+    """
+    Index for case-insensitive prefix searches (<field>__istartswith, i.e.
+    UPPER(field) LIKE 'ABC%'), such as the admin autocomplete. PostgreSQL
+    only uses an index for LIKE when it is built with the text_pattern_ops
+    operator class (the database does not use the C collation); other
+    backends get a plain UPPER(field) index.
+    """
+
+    def __init__(self, field, *, name):
+        self.field = field
+        super().__init__(Upper(field), name=name)
+
+    def deconstruct(self):
+        return f'{self.__class__.__module__}.{self.__class__.__name__}', (self.field,), {'name': self.name}
+
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        if schema_editor.connection.vendor == 'postgresql':
+            from django.contrib.postgres.indexes import OpClass
+
+            index = models.Index(OpClass(Upper(self.field), name='text_pattern_ops'), name=self.name)
+            return index.create_sql(model, schema_editor, using, **kwargs)
+        return super().create_sql(model, schema_editor, using, **kwargs)
+
 
 # Custom User Model
 class CustomUser(AbstractUser):
@@ -28,6 +60,24 @@ class CustomUser(AbstractUser):
         blank=True,
     )
 
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            # One account per address whatever its case; blank emails (e.g.
+            # createsuperuser without one) are left alone
+            models.UniqueConstraint(
+                Upper('email'), condition=~models.Q(email=''), name='unique_user_email_ci',
+                violation_error_message="This email is already in use. Please choose a different one.",
+            ),
+        ]
+        indexes = [
+            # For email__iexact (UPPER(email) = UPPER(...)) lookups: the forms'
+            # clean_email and allauth's email login. The unique index above is
+            # partial, so the planner cannot use it for them. As a prefix index
+            # it also serves the admin user table's search.
+            PrefixIndex('email', name='user_email_prefix_idx'),
+            PrefixIndex('username', name='user_username_prefix_idx'),
+        ]
+
     def is_admin(self):
         """Returns True if the user is an admin."""
         return self.role == 'admin'
@@ -194,6 +244,23 @@ PH_PROVINCES = (
     ('Zamboanga Sibugay', 'Zamboanga Sibugay'),
 )
 
+class InstrumentQuerySet(models.QuerySet):
+    def for_card(self):
+        """Instrument cards, icon strips and the admin list"""
+        return (
+            self.select_related('category', 'region')
+            .only(
+                'id', 'name', 'province', 'image', 'date_added', 'views',
+                'category__id', 'category__name', 'category__icon',
+                'region__id', 'region__name',
+            )
+            .annotate(description_excerpt=Left('description', EXCERPT_LENGTH))
+        )
+
+    def for_choices(self):
+        """Instrument <select> options"""
+        return self.only('id', 'name')
+
 class Instrument(models.Model):
     name = models.CharField(max_length=200, unique=True)
     description = models.TextField()
@@ -204,6 +271,14 @@ class Instrument(models.Model):
     date_added = models.DateTimeField(auto_now_add=True)
     views = models.IntegerField(default=0)
 
+    objects = InstrumentQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            PrefixIndex('name', name='instrument_name_prefix_idx'),
+            models.Index(fields=['date_added', 'id'], name='instrument_added_idx'),
+        ]
+
     def __str__(self):
         return self.name
     
@@ -238,6 +313,50 @@ class InstrumentLink(models.Model):
     def __str__(self):
         return f"{self.title} - {self.instrument.name}"
 
+def validate_3d_model(value):
+    """Reject anything that is not a self-contained glTF 2.0 asset"""
+    name = value.name.lower()
+    if not name.endswith(('.glb', '.gltf')):
+        raise ValidationError("Upload a .glb or .gltf file.")
+    if value.size > settings.MODEL_MAX_UPLOAD_MB * 1024 * 1024:
+        raise ValidationError(f"3D models must be smaller than {settings.MODEL_MAX_UPLOAD_MB} MB.")
+
+    value.seek(0)
+    try:
+        if name.endswith('.glb'):
+            # 12 byte header: magic, container version, total length
+            header = value.read(12)
+            if len(header) < 12 or header[:4] != b'glTF':
+                raise ValidationError("This is not a valid GLB file.")
+            if int.from_bytes(header[4:8], 'little') != 2:
+                raise ValidationError("Only glTF 2.0 models are supported.")
+            if int.from_bytes(header[8:12], 'little') > value.size:
+                raise ValidationError("This GLB file is truncated.")
+        else:
+            try:
+                gltf = json.loads(value.read())
+            except ValueError:
+                raise ValidationError("This is not a valid glTF file.")
+            if not isinstance(gltf, dict) or not isinstance(gltf.get('asset'), dict):
+                raise ValidationError("This is not a valid glTF file.")
+            if not str(gltf['asset'].get('version', '')).startswith('2'):
+                raise ValidationError("Only glTF 2.0 models are supported.")
+            buffers = gltf.get('buffers') or []
+            images = gltf.get('images') or []
+            if not isinstance(buffers, list) or not isinstance(images, list):
+                raise ValidationError("This is not a valid glTF file.")
+            items = buffers + images
+            if not all(isinstance(item, dict) and isinstance(item.get('uri', ''), str) for item in items):
+                raise ValidationError("This is not a valid glTF file.")
+            # Only the model file is uploaded, so buffers and images must be embedded
+            for item in items:
+                uri = item.get('uri')
+                if uri and not uri.startswith('data:'):
+                    raise ValidationError("This .gltf references external files; upload a .glb instead.")
+    finally:
+        value.seek(0)
+
+
 class Instrument3DModel(models.Model):
     instrument = models.OneToOneField(
         Instrument,
@@ -248,12 +367,42 @@ class Instrument3DModel(models.Model):
         upload_to='images/instruments/3d_models/',
         blank=True,
         null=True,
+        validators=[validate_3d_model],
         help_text="Upload a 3D model file (.glb, .gltf)"
     )
     date_uploaded = models.DateTimeField(auto_now_add=True)
 
+    # Filled in by the process_3d_models command
+    optimized_file = models.FileField(upload_to='images/instruments/3d_models/optimized/', blank=True, null=True, editable=False)
+    lod_file = models.FileField(upload_to='images/instruments/3d_models/optimized/', blank=True, null=True, editable=False)
+    poster = models.ImageField(upload_to='images/instruments/3d_models/posters/', blank=True, null=True, editable=False)
+    original_size = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    optimized_size = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    lod_size = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    processed_source = models.CharField(max_length=255, blank=True, editable=False)
+
     def __str__(self):
         return f"3D Model for {self.instrument.name}"
+
+    @property
+    def is_processed(self):
+        """True when the optimized files were built from the current upload"""
+        return bool(self.file) and self.processed_source == self.file.name
+
+    @property
+    def viewer_url(self):
+        """Compressed model when available, otherwise the raw upload"""
+        if self.is_processed and self.optimized_file:
+            return self.optimized_file.url
+        return self.file.url if self.file else ''
+
+    @property
+    def lod_url(self):
+        return self.lod_file.url if self.is_processed and self.lod_file else ''
+
+    @property
+    def poster_url(self):
+        return self.poster.url if self.is_processed and self.poster else ''
     
 class Site3DContent(models.Model):
     hero_title = models.CharField(max_length=200, default="Discover Philippine Traditional Instruments")
@@ -276,6 +425,7 @@ class InstrumentPage(models.Model):
     
     class Meta:
         ordering = ['order']
+        indexes = [PrefixIndex('title', name='page_title_prefix_idx')]
     
     def save(self, *args, **kwargs):
         if not self.pk:  # Only on creation
@@ -289,6 +439,15 @@ class InstrumentPage(models.Model):
     def __str__(self):
         return f"{self.instrument.name} - {self.title}"
 
+class PageSectionQuerySet(models.QuerySet):
+    def for_list(self):
+        """Admin history list"""
+        return (
+            self.select_related('page')
+            .only('id', 'section_type', 'title', 'image', 'order', 'page__id', 'page__title')
+            .annotate(content_excerpt=Left('content', EXCERPT_LENGTH))
+        )
+
 class PageSection(models.Model):
     SECTION_TYPE_CHOICES = [
         ('description', 'Description'),
@@ -303,6 +462,8 @@ class PageSection(models.Model):
     content = models.TextField(blank=True, null=True)
     image = models.ImageField(upload_to='images/page_sections/', blank=True, null=True)
     order = models.PositiveIntegerField(default=0)
+
+    objects = PageSectionQuerySet.as_manager()
     
     class Meta:
         ordering = ['order']
@@ -325,9 +486,35 @@ class Sound(models.Model):
     sound_sample = models.FileField(upload_to='images/instruments/sounds/', blank=True, null=True)
     # date_added = models.DateTimeField(auto_now_add=True)
 
+    # Filled in by the process_sounds command
+    audio_opus = models.FileField(upload_to='images/instruments/sounds/processed/', blank=True, null=True, editable=False)
+    audio_aac = models.FileField(upload_to='images/instruments/sounds/processed/', blank=True, null=True, editable=False)
+    duration = models.FloatField(null=True, blank=True, editable=False, help_text="Length in seconds")
+    peaks = models.JSONField(default=list, blank=True, editable=False, help_text="Waveform peaks scaled 0-100")
+    processed_source = models.CharField(max_length=255, blank=True, editable=False)
+
     def __str__(self):
         return self.title
 
+    @property
+    def is_processed(self):
+        """True when the processed files were built from the current upload"""
+        return bool(self.sound_sample) and self.processed_source == self.sound_sample.name
+
+    @property
+    def playback_url(self):
+        """Normalised AAC when available (plays everywhere), otherwise the raw upload"""
+        if self.is_processed and self.audio_aac:
+            return self.audio_aac.url
+        return self.sound_sample.url if self.sound_sample else ''
+
+    def duration_display(self):
+        """Duration as m:ss, or an empty string when unknown"""
+        if not self.is_processed or self.duration is None:
+            return ''
+        minutes, seconds = divmod(int(round(self.duration)), 60)
+        return f"{minutes}:{seconds:02d}"
+
 
 # Instrument Material Model
 class InstrumentMaterial(models.Model):
@@ -481,7 +668,28 @@ class Testimonial(models.Model):
     class Meta:
         ordering = ['-date_submitted']
         verbose_name_plural = "Testimonials"
-
+        indexes = [
+            models.Index(fields=['date_submitted', 'id'], name='testimonial_submitted_idx'),
+            models.Index(fields=['rating', 'id'], name='testimonial_rating_idx'),
+        ]
+
+
+class VideoTutorialQuerySet(models.QuerySet):
+    def for_card(self):
+        """Tutorial gallery cards and the admin list"""
+        return (
+            self.select_related('instrument__category')
+            .only(
+                'id', 'title', 'video_file', 'uploaded_at', 'views', 'transcoded_source',
+                'instrument__id', 'instrument__name', 'instrument__image',
+                'instrument__category__id', 'instrument__category__name',
+            )
+            .annotate(description_excerpt=Left('description', EXCERPT_LENGTH))
+        )
+
+    def for_choices(self):
+        """Tutorial <select> options"""
+        return self.only('id', 'title')
 
 class VideoTutorial(models.Model):
     instrument = models.ForeignKey(Instrument, on_delete=models.CASCADE, related_name='video_tutorials')
@@ -490,9 +698,69 @@ class VideoTutorial(models.Model):
     video_file = models.FileField(upload_to='images/videos/tutorials/', help_text="Upload an MP4 video file")
     uploaded_at = models.DateTimeField(auto_now_add=True)
     views = models.IntegerField(default=0)
+    transcoded_source = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="video_file name the current renditions were built from"
+    )
+
+    objects = VideoTutorialQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.title} - {self.instrument.name}"
+
+    def get_rendition(self, kind):
+        """Return the rendition of the given kind, or None if missing or built from an older upload"""
+        if not self.transcoded_source or self.transcoded_source != self.video_file.name:
+            return None
+        # Iterate so a prefetch_related('renditions') is reused
+        for rendition in self.renditions.all():
+            if rendition.kind == kind:
+                return rendition
+        return None
+
+    @property
+    def hls_manifest(self):
+        return self.get_rendition('hls')
+
+    @property
+    def poster_frame(self):
+        return self.get_rendition('poster')
+
+    @property
+    def preview_clip(self):
+        return self.get_rendition('preview')
+
+
+class VideoRendition(models.Model):
+    """Transcoded output of a VideoTutorial, produced by the transcode_videos command"""
+    KIND_CHOICES = [
+        ('hls', 'HLS Master Playlist'),
+        ('variant', 'HLS Variant Playlist'),
+        ('poster', 'Poster Frame'),
+        ('preview', 'Preview Clip'),
+    ]
+
+    video_tutorial = models.ForeignKey(
+        VideoTutorial,
+        on_delete=models.CASCADE,
+        related_name='renditions'
+    )
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    label = models.CharField(max_length=20, blank=True)
+    file = models.FileField(upload_to='images/videos/renditions/', max_length=255)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    bitrate = models.PositiveIntegerField(null=True, blank=True, help_text="Video + audio bitrate in kbps")
+    size_bytes = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['kind', '-height']
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.label} - {self.video_tutorial.title}"
     
 
 class TechniqueStep(models.Model):
@@ -582,6 +850,15 @@ class PrincipleCard(models.Model):
     
 
 # models.py
+class DiscoverSectionQuerySet(models.QuerySet):
+    def for_list(self):
+        """Admin instructor list"""
+        return self.defer('description', 'mastering_paragraph1', 'mastering_paragraph2').annotate(
+            description_excerpt=Left('description', EXCERPT_LENGTH),
+            mastering_paragraph1_excerpt=Left('mastering_paragraph1', EXCERPT_LENGTH),
+            mastering_paragraph2_excerpt=Left('mastering_paragraph2', EXCERPT_LENGTH),
+        )
+
 class DiscoverSection(models.Model):
     title = models.CharField(max_length=255, default="Discover Traditional Instruments")
     description = models.TextField()
@@ -593,6 +870,8 @@ class DiscoverSection(models.Model):
     video2 = models.FileField(upload_to='images/videos/', blank=True, null=True)
     video_description = models.TextField(default="Listen to the mesmerizing tones of traditional sitar music")
 
+    objects = DiscoverSectionQuerySet.as_manager()
+
     def __str__(self):
         return self.title
     
@@ -656,6 +935,15 @@ class ContactPage(models.Model):
     def __str__(self):
         return "Contact Page Configuration"
     
+class ContactMessageQuerySet(models.QuerySet):
+    def for_list(self):
+        """Admin inbox list"""
+        return (
+            self.select_related('user')
+            .only('id', 'name', 'email', 'subject', 'is_read', 'submitted_at', 'user__id', 'user__username')
+            .annotate(message_excerpt=Left('message', EXCERPT_LENGTH))
+        )
+
 class ContactMessage(models.Model):
     Subject = [
         ('General Inquiry', 'General Inquiry'),
@@ -678,6 +966,14 @@ class ContactMessage(models.Model):
     message = models.TextField()
     is_read = models.BooleanField(default=False)
     submitted_at = models.DateTimeField(default=timezone.now)
+
+    objects = ContactMessageQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['submitted_at', 'id'], name='contact_received_idx'),
+            models.Index(fields=['subject', 'id'], name='contact_subject_idx'),
+        ]
     
     def __str__(self):
         if self.user:
@@ -743,6 +1039,17 @@ class TargetAudience(models.Model):
             return f'fa fa-{self.icon}'
         return f'fa {self.icon}'
     
+class TeamMemberQuerySet(models.QuerySet):
+    def for_list(self):
+        """Admin team list"""
+        return self.defer('back_description').annotate(
+            back_description_excerpt=Left('back_description', EXCERPT_LENGTH),
+        )
+
+    def for_choices(self):
+        """Team member <select> options"""
+        return self.only('id', 'name', 'title')
+
 class TeamMember(models.Model):
     name = models.CharField(max_length=100)
     title = models.CharField(max_length=100)
@@ -750,6 +1057,8 @@ class TeamMember(models.Model):
     back_description = models.TextField()
     created_at = models.DateTimeField(default=timezone.now)
 
+    objects = TeamMemberQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Team Member"
         verbose_name_plural = "Team Members"
@@ -956,6 +1265,10 @@ class PerformanceAppointment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['event_date', 'id'], name='performance_date_idx'),
+            models.Index(fields=['created_at', 'id'], name='performance_created_idx'),
+        ]
 
 
 # Lesson Appointment (for group classes)
@@ -988,6 +1301,10 @@ class LessonAppointment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['lesson_date', 'id'], name='lesson_date_idx'),
+            models.Index(fields=['created_at', 'id'], name='lesson_created_idx'),
+        ]
 
 
 class InstrumentForum(models.Model):
@@ -1020,7 +1337,58 @@ class InstrumentMessage(models.Model):
     
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # The chat management table pages one forum at a time (app/tables.py)
+            models.Index(fields=['forum', 'created_at', 'id'], name='forum_message_posted_idx'),
+        ]
     
     def __str__(self):
         return f"Message by {self.author} in {self.forum.instrument.name}"
     
+
+
+class DeletionJob(models.Model):
+    """A delete too large for one request, run in the background by app/deletion.py"""
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    label = models.CharField(max_length=255)
+    model = models.CharField(max_length=100, help_text="app_label.ModelName of the rows to delete")
+    lookup = models.JSONField(help_text="filter() arguments selecting the rows")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    total = models.PositiveIntegerField(default=0, help_text="Rows to delete, cascades included, when queued")
+    deleted = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)  # bumped by every chunk
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'updated_at'], name='deletion_job_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.label} ({self.get_status_display()})"
+
+
+class PendingFileDeletion(models.Model):
+    """Storage file of a deleted row, removed from storage after the delete commits"""
+    name = models.CharField(max_length=255)
+    directory = models.BooleanField(default=False, help_text="name is a directory, removed with everything under it")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
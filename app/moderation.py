@@ -0,0 +1,130 @@
+"""
+Bulk moderation of the admin panels' approval toggles and appointment
+statuses (moderate/<target>/, see views.bulk_moderate).
+
+A request names up to MODERATION_MAX_IDS rows and one target state. Inside
+one transaction the rows are locked (select_for_update), the ones that
+exist are set with a single UPDATE ... WHERE id IN (...), and every id gets
+a result: "updated", "not_found", or for appointments "conflict".
+
+Accepting appointments keeps the rule check_date_availability enforces on
+the booking forms: at most one accepted appointment, performance or lesson,
+per date. Dates already taken are found with one query per table; within
+the batch the lowest id on a free date wins and the rest conflict.
+"""
+from django.conf import settings
+from django.core.exceptions import BadRequest
+from django.db import transaction
+
+from .fragments import bump_content_version
+
+UPDATED = 'updated'
+NOT_FOUND = 'not_found'
+CONFLICT = 'conflict'
+
+BOOLEANS = {'true': True, '1': True, 'on': True, 'false': False, '0': False, 'off': False}
+STATUSES = ['Pending', 'Accepted', 'Declined', 'Completed']
+
+
+class Target:
+    def __init__(self, model, field, date_field=None, bump=False):
+        self.model = model                  # callable, so the models load lazily
+        self.field = field
+        self.date_field = date_field        # appointments: the date accepting claims
+        self.bump = bump                    # rows shown in cached fragments
+
+    def parse_state(self, state):
+        state = str(state).strip()
+        if self.date_field:
+            if state not in STATUSES:
+                raise BadRequest(f'state must be one of {", ".join(STATUSES)}')
+            return state
+        if state.lower() not in BOOLEANS:
+            raise BadRequest('state must be true or false')
+        return BOOLEANS[state.lower()]
+
+
+def targets():
+    from . import models
+
+    return {
+        'feedback': Target(lambda: models.Feedback, 'is_suggestion'),
+        'testimonials': Target(lambda: models.Testimonial, 'approved', bump=True),
+        'social_media': Target(lambda: models.SocialMediaLink, 'is_active', bump=True),
+        'instrument_links': Target(lambda: models.InstrumentLink, 'is_primary_source'),
+        'performances': Target(lambda: models.PerformanceAppointment, 'status', date_field='event_date'),
+        'lessons': Target(lambda: models.LessonAppointment, 'status', date_field='lesson_date'),
+    }
+
+
+def parse_ids(values):
+    try:
+        ids = sorted({int(value) for value in values})
+    except (TypeError, ValueError) as e:
+        raise BadRequest('ids must be integers') from e
+    if not ids:
+        raise BadRequest('No ids given')
+    if len(ids) > settings.MODERATION_MAX_IDS:
+        raise BadRequest(f'At most {settings.MODERATION_MAX_IDS} ids per request')
+    return ids
+
+
+def taken_dates(model, dates, exclude_ids):
+    """Dates in `dates` that already have an accepted appointment outside the batch"""
+    from .models import LessonAppointment, PerformanceAppointment
+
+    taken = set()
+    for other, date_field in [(PerformanceAppointment, 'event_date'), (LessonAppointment, 'lesson_date')]:
+        queryset = other.objects.filter(status='Accepted', **{f'{date_field}__in': dates})
+        if other is model:
+            queryset = queryset.exclude(pk__in=exclude_ids)
+        taken.update(queryset.values_list(date_field, flat=True))
+    return taken
+
+
+def accept(model, date_field, rows):
+    """Ids of `rows` [(id, date, status)] that can be accepted; the others conflict"""
+    taken = taken_dates(model, {date for pk, date, status in rows}, [pk for pk, date, status in rows])
+    accepted = set()
+    # Rows already accepted keep their date, so claim those first
+    for pk, date, status in sorted(rows, key=lambda row: (row[2] != 'Accepted', row[0])):
+        if date not in taken:
+            taken.add(date)
+            accepted.add(pk)
+    return accepted
+
+
+def moderate(name, ids, state, decline_reason=''):
+    """{'results': {id: outcome}, 'updated': n}, or None when there is no such target"""
+    target = targets().get(name)
+    if target is None:
+        return None
+    ids = parse_ids(ids)
+    value = target.parse_state(state)
+    model = target.model()
+    values = {target.field: value}
+    if target.date_field:
+        # Only a decline keeps a reason, as in performance_Status/Lesson_Status
+        values['decline_reason'] = decline_reason.strip() if value == 'Declined' else ''
+
+    with transaction.atomic():
+        locked = model.objects.select_for_update().filter(pk__in=ids).order_by('pk')
+        if target.date_field and value == 'Accepted':
+            rows = list(locked.values_list('pk', target.date_field, 'status'))
+            found = {pk for pk, date, status in rows}
+            allowed = accept(model, target.date_field, rows)
+        else:
+            found = allowed = set(locked.values_list('pk', flat=True))
+        updated = model.objects.filter(pk__in=allowed).update(**values) if allowed else 0
+
+    if target.bump and updated:
+        bump_content_version()  # update() sends no post_save
+    results = {}
+    for pk in ids:
+        if pk in allowed:
+            results[pk] = UPDATED
+        elif pk in found:
+            results[pk] = CONFLICT
+        else:
+            results[pk] = NOT_FOUND
+    return {'results': results, 'updated': updated}
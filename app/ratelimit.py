@@ -0,0 +1,98 @@
+"""
+Per-client rate limits for the url names in settings.RATE_LIMITS
+(enforced by app.middleware.RateLimitMiddleware).
+
+Every (url name, client) pair has a token bucket holding up to `limit`
+tokens, refilled continuously at `limit` per `period` seconds; a request
+takes one. A client can burst at most `limit` requests, then gets one every
+`period / limit` seconds. (A counter reset every period would let 2 x
+`limit` through within moments, either side of the reset.)
+
+The bucket is stored as (tokens, time of the last refill). All workers
+pointed at the same RATE_LIMIT_CACHE (Redis via RATE_LIMIT_REDIS_URL in
+production) share the buckets: on Redis a Lua script refills and takes
+in one atomic round trip. Other caches read and write the bucket under a
+process lock, which is atomic for the LocMemCache used without Redis.
+
+That LocMemCache lives in one process: each gunicorn worker keeps its own
+buckets, and requests spread over N workers get up to N x `limit` through
+per period. Settings print a warning when production starts that way.
+"""
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+
+# KEYS[1]: bucket; ARGV: limit, tokens per second, now, expiry seconds.
+# Returns the seconds to wait for a token ("0" when one was taken) as a
+# string, Redis would truncate a Lua number to an integer.
+TAKE_TOKEN_SCRIPT = """
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'refilled')
+local limit, rate, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local tokens = tonumber(bucket[1]) or limit
+local refilled = tonumber(bucket[2]) or now
+tokens = math.min(limit, tokens + math.max(0, now - refilled) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'refilled', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return tostring(wait)
+"""
+
+_lock = threading.Lock()
+
+
+def client_ip(request):
+    """
+    The client's address. Behind RATE_LIMIT_PROXY_COUNT reverse proxies it
+    is the entry those proxies appended to X-Forwarded-For; entries further
+    left come from the client and could be forged.
+    """
+    proxies = settings.RATE_LIMIT_PROXY_COUNT
+    if proxies:
+        forwarded = [part.strip() for part in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if part.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def client_key(request, key):
+    """Bucket owner: the user for key "user" (falling back to the IP when anonymous), else the IP"""
+    if key == 'user' and request.user.is_authenticated:
+        return f'user:{request.user.pk}'
+    return f'ip:{client_ip(request)}'
+
+
+def take_from(tokens, refilled, limit, rate, now):
+    """Take a token from a bucket last refilled at `refilled`; returns (tokens left, seconds to wait for one)"""
+    tokens = min(limit, tokens + max(0, now - refilled) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0
+    return tokens, (1 - tokens) / rate
+
+
+def take_token(name, owner, limit, period, now=None):
+    """Take a token from the bucket; returns 0, or the whole seconds until it holds one when it is empty"""
+    now = time.time() if now is None else now
+    rate = limit / period
+    cache = caches[settings.RATE_LIMIT_CACHE]
+    key = f'ratelimit:{name}:{owner}'
+    # A bucket idle this long is full again, forgetting it changes nothing
+    expiry = math.ceil(period) + 1
+    if isinstance(cache, RedisCache):
+        key = cache.make_and_validate_key(key)
+        client = cache._cache.get_client(key, write=True)
+        wait = float(client.eval(TAKE_TOKEN_SCRIPT, 1, key, limit, rate, repr(now), expiry))
+    else:
+        with _lock:
+            tokens, refilled = cache.get(key, (limit, now))
+            tokens, wait = take_from(tokens, refilled, limit, rate, now)
+            cache.set(key, (tokens, now), expiry)
+    return max(1, math.ceil(wait)) if wait else 0
@@ -1,8 +1,15 @@
 from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from .fragments import bump_content_version, content_models
 from .models import UserLogin
 
 @receiver(user_logged_in)
 def log_user_login(sender, request, user, **kwargs):
     """Log user login event."""
     UserLogin.objects.create(user=user)
+
+# Cached page fragments are keyed on the content version
+for model in content_models():
+    post_save.connect(bump_content_version, sender=model, dispatch_uid=f'content_version_save_{model.__name__}')
+    post_delete.connect(bump_content_version, sender=model, dispatch_uid=f'content_version_delete_{model.__name__}')
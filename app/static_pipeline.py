@@ -0,0 +1,178 @@
+"""
+collectstatic post-processing for the project's own static files
+(STATICFILES_DIRS; admin/allauth files are left as they ship):
+
+1. static raster images get WebP (and AVIF, when Pillow can write it)
+   siblings, kept only when smaller than the original;
+2. JS and CSS are minified in place, and CSS `background-image: url(...)`
+   declarations get an image-set() with the WebP variant after them;
+3. the files in STATIC_BUNDLES are concatenated into one file per page.
+
+WhiteNoise's CompressedManifestStaticFilesStorage then fingerprints all of
+it (including the generated files) and writes .gz and .br copies, and
+WhiteNoise serves fingerprinted names with a far-future `immutable`
+Cache-Control. Templates pick the bundles and variants up through
+app/templatetags/static_assets.py.
+"""
+import io
+import posixpath
+import re
+from pathlib import Path, PurePosixPath
+
+import rcssmin
+import rjsmin
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.base import ContentFile
+from PIL import Image
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+RASTER_SUFFIXES = ('.jpg', '.jpeg', '.png')
+IMAGE_TYPES = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.png': 'image/png'}
+
+# Leading @import rules of a minified stylesheet; they have to stay in
+# front of every other rule once files are concatenated
+IMPORT = r'''@import\s*(?:url\([^)]*\)|"[^"]*"|'[^']*')[^;]*;'''
+LEADING_IMPORTS = re.compile(rf'^(?:@charset[^;]*;)?((?:{IMPORT})*)')
+CSS_URL = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+BACKGROUND_IMAGE = re.compile(r'''background-image:url\((['"]?)([^'")]+)\1\)(?=[;}])''')
+
+
+def variant_name(name, fmt):
+    """images/kul.jpg -> images/kul.webp"""
+    return str(PurePosixPath(name).with_suffix(f'.{fmt}'))
+
+
+def image_formats():
+    """Modern formats this Pillow build can write, best first"""
+    Image.init()
+    return [fmt for fmt in ('avif', 'webp') if fmt.upper() in Image.SAVE]
+
+
+def is_generated(name):
+    """True when collectstatic produced `name` (a bundle or image variant) and it is being served"""
+    if settings.DEBUG:
+        return False
+    return name in getattr(staticfiles_storage, 'hashed_files', {})
+
+
+class OptimizedStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    image_quality = 75
+    # Variants are capped here (longest edge); no page shows these larger
+    image_max_size = 1600
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            paths = dict(paths)
+            yield from self.optimize(paths)
+        yield from super().post_process(paths, dry_run, **options)
+
+    def optimize(self, paths):
+        """Rewrite `paths` so the hashing pass below reads the optimized copies"""
+        project_dirs = {Path(d).resolve() for d in settings.STATICFILES_DIRS}
+        own = sorted(
+            name for name, (storage, _) in paths.items()
+            if Path(getattr(storage, 'location', '')).resolve() in project_dirs
+        )
+
+        variants = set()
+        for name in own:
+            if name.lower().endswith(RASTER_SUFFIXES):
+                for variant in self.convert_image(name):
+                    paths[variant] = (self, variant)
+                    variants.add(variant)
+                    yield name, variant, True
+
+        for name in own:
+            if name.endswith(('.min.js', '.min.css')):
+                continue
+            if name.endswith('.js'):
+                self.replace(name, rjsmin.jsmin(self.read(name)))
+            elif name.endswith('.css'):
+                self.replace(name, self.add_image_sets(name, rcssmin.cssmin(self.read(name)), variants))
+            else:
+                continue
+            paths[name] = (self, name)
+            yield name, name, True
+
+        for bundle, sources in settings.STATIC_BUNDLES.items():
+            missing = [source for source in sources if source not in paths]
+            if missing:
+                yield bundle, None, ValueError(f"Bundle {bundle} lists unknown files: {', '.join(missing)}")
+                continue
+            self.replace(bundle, self.concatenate(bundle, sources))
+            paths[bundle] = (self, bundle)
+            yield bundle, bundle, True
+
+    def read(self, name):
+        with self.open(name) as f:
+            return f.read().decode('utf-8')
+
+    def replace(self, name, content):
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(content.encode('utf-8') if isinstance(content, str) else content))
+
+    def convert_image(self, name):
+        with self.open(name) as f:
+            original = f.read()
+        image = Image.open(io.BytesIO(original))
+        image.load()
+        if image.mode not in ('RGB', 'RGBA'):
+            alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if alpha else 'RGB')
+        image.thumbnail((self.image_max_size, self.image_max_size))
+        for fmt in image_formats():
+            buffer = io.BytesIO()
+            image.save(buffer, fmt.upper(), quality=self.image_quality, method=6)
+            # Small or already well-compressed images are better left alone
+            if buffer.tell() < len(original):
+                variant = variant_name(name, fmt)
+                self.replace(variant, buffer.getvalue())
+                yield variant
+
+    def static_name(self, url, base):
+        """The static file a CSS url() points at, or None for external/data URLs"""
+        if url.startswith(('data:', '#', 'http:', 'https:', '//')):
+            return None
+        if url.startswith(settings.STATIC_URL):
+            return url[len(settings.STATIC_URL):]
+        if url.startswith('/'):
+            return None
+        return posixpath.normpath(posixpath.join(posixpath.dirname(base), url))
+
+    def add_image_sets(self, name, css, variants):
+        def repl(match):
+            url = match.group(2)
+            target = self.static_name(url, name)
+            suffix = PurePosixPath(target or '').suffix.lower()
+            options = [
+                f'url("{url[:-len(suffix)]}.{fmt}") type("image/{fmt}")'
+                for fmt in image_formats() if target and variant_name(target, fmt) in variants
+            ]
+            if not options:
+                return match.group(0)
+            options.append(f'url("{url}") type("{IMAGE_TYPES[suffix]}")')
+            # Browsers without image-set() ignore the second declaration
+            return f'{match.group(0)};background-image:image-set({",".join(options)})'
+        return BACKGROUND_IMAGE.sub(repl, css)
+
+    def concatenate(self, bundle, sources):
+        if bundle.endswith('.js'):
+            # The separator keeps one file's missing semicolon from joining it to the next
+            return ';\n'.join(self.read(source) for source in sources)
+
+        imports, bodies = [], []
+        for source in sources:
+            css = self.read(source)
+            leading = LEADING_IMPORTS.match(css)
+            imports += [rule for rule in re.findall(IMPORT, leading.group(1)) if rule not in imports]
+            # Relative url()s are written against the source file's folder
+            bodies.append(CSS_URL.sub(lambda m: self.rebase_url(m, source), css[leading.end():]))
+        return ''.join(imports) + '\n'.join(bodies)
+
+    def rebase_url(self, match, source):
+        url = match.group(2)
+        if url.startswith(('data:', '#', 'http:', 'https:', '/')):
+            return match.group(0)
+        return f'url("{settings.STATIC_URL}{self.static_name(url, source)}")'
@@ -0,0 +1,217 @@
+"""
+Server-side tables for the admin panels: a panel fetches one page of rows
+at a time from admin_table/<name>/ instead of rendering the whole table
+into admin_main (static/js/admin/data_table.js drives the panels).
+
+Query parameters:
+  sort    a key of the table's sorts, "-" in front for descending
+  q       prefix search (istartswith) on the table's search fields
+  <name>  one of the table's filters, e.g. ?status=Pending
+  cursor  the "next"/"prev" cursor of the previous response
+  limit   rows per page (ADMIN_TABLE_PAGE_SIZE, at most ADMIN_TABLE_MAX_PAGE_SIZE)
+  count   0 to skip the total, which the client already has after the first page
+
+Pages are cut by keyset (cursor) pagination on (sort field, pk): a page
+costs an index range scan of `limit` rows wherever it is, where OFFSET
+would read and throw away every row before it. Every sort field has an
+index on (field, id) for that, and none of them is nullable. The total is
+counted up to ADMIN_TABLE_COUNT_LIMIT rows; above that the panel shows
+"10000+" rather than counting a huge table on every filter change.
+"""
+import base64
+import json
+
+from django.conf import settings
+from django.core.exceptions import BadRequest
+from django.db.models import Q
+from django.template.loader import render_to_string
+
+BOOLEAN = {'1': True, '0': False}
+
+
+def choices(pairs):
+    """Filter values for a field with choices"""
+    return {value: value for value, label in pairs}
+
+
+class Table:
+    def __init__(self, queryset, templates, sorts, default_sort, filters=None, search=()):
+        self.queryset = queryset            # callable, so the models load lazily
+        self.templates = templates          # {part: template rendered with rows}, one per container
+        self.sorts = sorts                  # {sort key: model field}
+        self.default_sort = default_sort
+        self.filters = filters or {}        # {param: (lookup, {raw value: value} or converter)}
+        self.search = search
+
+
+def tables():
+    from .models import (
+        ContactMessage, CustomUser, Instrument, InstrumentMessage, LessonAppointment, PerformanceAppointment, Testimonial,
+    )
+
+    return {
+        'users': Table(
+            lambda: CustomUser.objects.only(
+                'id', 'username', 'first_name', 'last_name', 'email', 'role', 'profile_picture'),
+            {'rows': 'app/admin/user_table_rows.html', 'cards': 'app/admin/user_table_cards.html'},
+            sorts={'username': 'username'},
+            default_sort='username',
+            filters={'role': ('role', choices(CustomUser.USER_ROLES))},
+            search=['username', 'email'],
+        ),
+        'instruments': Table(
+            lambda: Instrument.objects.for_card(),
+            {'rows': 'app/admin/Instrument/table_rows.html', 'cards': 'app/admin/Instrument/table_cards.html'},
+            sorts={'name': 'name', 'added': 'date_added'},
+            default_sort='name',
+            filters={'category': ('category_id', int)},
+            search=['name'],
+        ),
+        'contact_messages': Table(
+            lambda: ContactMessage.objects.for_list(),
+            {'rows': 'app/admin/ContactMessage/table_rows.html', 'cards': 'app/admin/ContactMessage/table_cards.html'},
+            sorts={'received': 'submitted_at', 'subject': 'subject'},
+            default_sort='-received',
+            filters={'is_read': ('is_read', BOOLEAN), 'subject': ('subject', choices(ContactMessage.Subject))},
+            search=['name', 'email'],
+        ),
+        'testimonials': Table(
+            lambda: Testimonial.objects.select_related('user'),
+            {'rows': 'app/admin/Testimonial/table_rows.html', 'cards': 'app/admin/Testimonial/table_cards.html'},
+            sorts={'submitted': 'date_submitted', 'rating': 'rating'},
+            default_sort='-submitted',
+            filters={'approved': ('approved', BOOLEAN)},
+            search=['user__username'],
+        ),
+        'performances': Table(
+            lambda: PerformanceAppointment.objects.select_related('user'),
+            {'rows': 'app/admin/Appointment/performance_rows.html',
+             'cards': 'app/admin/Appointment/performance_cards.html'},
+            sorts={'date': 'event_date', 'created': 'created_at'},
+            default_sort='-created',
+            filters={'status': ('status', choices(PerformanceAppointment.STATUS_CHOICES))},
+            search=['event_name', 'user__username'],
+        ),
+        'lessons': Table(
+            lambda: LessonAppointment.objects.select_related('user'),
+            {'rows': 'app/admin/Appointment/lesson_rows.html', 'cards': 'app/admin/Appointment/lesson_cards.html'},
+            sorts={'date': 'lesson_date', 'created': 'created_at'},
+            default_sort='-created',
+            filters={'status': ('status', choices(LessonAppointment.STATUS_CHOICES))},
+            search=['school_name', 'user__username'],
+        ),
+        'forum_messages': Table(
+            lambda: InstrumentMessage.objects.select_related('author').only(
+                'id', 'forum_id', 'content', 'created_at',
+                'author__id', 'author__username', 'author__first_name', 'author__last_name'),
+            {'rows': 'app/admin/Feedback/forum_message_rows.html'},
+            sorts={'posted': 'created_at'},
+            default_sort='posted',
+            filters={'forum': ('forum_id', int)},
+            search=['author__username'],
+        ),
+    }
+
+
+def encode_cursor(direction, value, pk):
+    if hasattr(value, 'isoformat'):
+        value = value.isoformat()  # full precision; DjangoJSONEncoder cuts microseconds
+    raw = json.dumps([direction, value, pk], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, field):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        direction, value, pk = json.loads(raw)
+        if direction not in ('next', 'prev'):
+            raise ValueError(direction)
+        return direction, field.to_python(value), int(pk)
+    except Exception as e:
+        raise BadRequest('Invalid cursor') from e
+
+
+def after(field, value, pk, descending):
+    """Rows after (value, pk) in (field, pk) order; the plain range on field lets the index bound the scan"""
+    op = 'lt' if descending else 'gt'
+    return Q(**{f'{field}__{op}e': value}) & (Q(**{f'{field}__{op}': value}) | Q(**{field: value, f'pk__{op}': pk}))
+
+
+def page(table, params):
+    """(rows, next cursor, prev cursor, total or None, whether the total is capped)"""
+    queryset = table.queryset()
+
+    for param, (lookup, parse) in table.filters.items():
+        raw = params.get(param, '')
+        if raw == '':
+            continue
+        try:
+            value = parse[raw] if isinstance(parse, dict) else parse(raw)
+        except (KeyError, ValueError) as e:
+            raise BadRequest(f'Invalid {param}') from e
+        queryset = queryset.filter(**{lookup: value})
+
+    query = params.get('q', '').strip()[:100]
+    if query and table.search:
+        condition = Q()
+        for field in table.search:
+            condition |= Q(**{f'{field}__istartswith': query})
+        queryset = queryset.filter(condition)
+
+    total = capped = None
+    if params.get('count') != '0':
+        limit = settings.ADMIN_TABLE_COUNT_LIMIT
+        total = queryset.order_by()[:limit + 1].count()
+        capped = total > limit
+        total = min(total, limit)
+
+    sort = params.get('sort') or table.default_sort
+    descending = sort.startswith('-')
+    if sort.lstrip('-') not in table.sorts:
+        sort = table.default_sort
+        descending = sort.startswith('-')
+    field = table.sorts[sort.lstrip('-')]
+    try:
+        size = min(int(params.get('limit', settings.ADMIN_TABLE_PAGE_SIZE)), settings.ADMIN_TABLE_MAX_PAGE_SIZE)
+    except ValueError as e:
+        raise BadRequest('Invalid limit') from e
+    size = max(size, 1)
+
+    direction = 'next'
+    if params.get('cursor'):
+        direction, value, pk = decode_cursor(params['cursor'], queryset.model._meta.get_field(field))
+        # A "prev" page is read backwards from its cursor and flipped
+        queryset = queryset.filter(after(field, value, pk, descending != (direction == 'prev')))
+    backwards = direction == 'prev'
+    prefix = '-' if descending != backwards else ''
+    rows = list(queryset.order_by(prefix + field, prefix + 'pk')[:size + 1])
+    more = len(rows) > size
+    rows = rows[:size]
+    if backwards:
+        rows.reverse()
+
+    next_cursor = prev_cursor = None
+    if rows:
+        first, last = rows[0], rows[-1]
+        if more or backwards:
+            next_cursor = encode_cursor('next', getattr(last, field), last.pk)
+        if params.get('cursor') and (more or not backwards):
+            prev_cursor = encode_cursor('prev', getattr(first, field), first.pk)
+    return rows, next_cursor, prev_cursor, total, capped
+
+
+def render_page(request, name):
+    """JSON-ready dict for admin_table/<name>/, or None when there is no such table"""
+    table = tables().get(name)
+    if table is None:
+        return None
+    rows, next_cursor, prev_cursor, total, capped = page(table, request.GET)
+    context = {'rows': rows}
+    return {
+        'parts': {part: render_to_string(template, context, request) for part, template in table.templates.items()},
+        'empty': not rows,
+        'next': next_cursor,
+        'prev': prev_cursor,
+        'total': total,
+        'total_capped': capped,
+    }
@@ -0,0 +1,23 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+register = template.Library()
+
+@register.simple_tag
+def waveform(sound, height=32):
+    """
+    Draw a Sound's stored peaks as an inline SVG (no audio download needed).
+    Use in templates like: {% waveform sound %}
+    """
+    if not sound.is_processed or not sound.peaks:
+        return ''
+    bars = format_html_join(
+        '',
+        '<rect x="{}" y="{}" width="0.7" height="{}"></rect>',
+        ((i, (100 - max(peak, 2)) / 2, max(peak, 2)) for i, peak in enumerate(sound.peaks)),
+    )
+    return format_html(
+        '<svg class="sound-waveform" viewBox="0 0 {} 100" preserveAspectRatio="none" '
+        'height="{}" width="100%" fill="currentColor" aria-hidden="true">{}</svg>',
+        len(sound.peaks), height, bars,
+    )
@@ -0,0 +1,64 @@
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from app.static_pipeline import IMAGE_TYPES, image_formats, is_generated, variant_name
+
+register = template.Library()
+
+
+@register.simple_tag
+def bundle(name):
+    """
+    <link>/<script> tags for a STATIC_BUNDLES entry: the single minified
+    bundle once collectstatic has built it, else its source files one by one
+    (runserver). Use in templates like: {% bundle 'bundles/user.css' %}
+    """
+    names = [name] if is_generated(name) else settings.STATIC_BUNDLES[name]
+    if name.endswith('.css'):
+        return format_html_join('\n', '<link rel="stylesheet" href="{}">', ((static(n),) for n in names))
+    return format_html_join('\n', '<script src="{}"></script>', ((static(n),) for n in names))
+
+
+@register.simple_tag
+def picture(name, **attrs):
+    """
+    <picture> with the AVIF/WebP variants collectstatic made of a static
+    image and the original as fallback.
+    Use in templates like: {% picture 'images/kul.jpg' alt="Kulintang" %}
+    """
+    img = format_html(
+        '<img src="{}"{}>',
+        static(name),
+        format_html_join('', ' {}="{}"', ((key.replace('_', '-'), value) for key, value in attrs.items())),
+    )
+    sources = [
+        (static(variant_name(name, fmt)), f'image/{fmt}')
+        for fmt in image_formats() if is_generated(variant_name(name, fmt))
+    ]
+    if not sources:
+        return img
+    return format_html(
+        '<picture>{}{}</picture>',
+        format_html_join('', '<source srcset="{}" type="{}">', sources),
+        img,
+    )
+
+
+@register.simple_tag
+def image_set(name):
+    """
+    CSS image-set() of a static image and its variants, for inline
+    background declarations; a plain url() when there are no variants.
+    Use in templates like: background-image: {% image_set 'images/ABOUT.jpg' %};
+    """
+    suffix = name[name.rfind('.'):].lower()
+    options = [
+        (static(variant_name(name, fmt)), f'image/{fmt}')
+        for fmt in image_formats() if is_generated(variant_name(name, fmt))
+    ]
+    if not options:
+        return format_html("url('{}')", static(name))
+    options.append((static(name), IMAGE_TYPES[suffix]))
+    return format_html('image-set({})', format_html_join(', ', 'url("{}") type("{}")', options))
@@ -1,3 +1,654 @@
-from django.test import TestCase
+import json
+import tempfile
+from datetime import date, datetime, time, timezone
+from io import StringIO
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.exceptions import BadRequest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db.models.expressions import Col
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from . import deletion, ratelimit, tables
+from .benchmarking import DEFAULT_BASELINE, load_baseline
+from .management.commands import benchmark_urls
+from .models import (
+    ContactMessage, CustomUser, DeletionJob, DiscoverSection, Feedback, Instrument, Instrument3DModel,
+    InstrumentCategory, InstrumentForum, InstrumentMessage, InstrumentPage, LessonAppointment, PageSection,
+    PendingFileDeletion, PerformanceAppointment, TeamMember, VideoRendition, VideoTutorial,
+)
+from .views import VIDEOS_PER_PAGE
+
+
+def selected(queryset):
+    """(columns as "table.column", annotation aliases) the queryset's SELECT loads"""
+    select, _, _ = queryset.query.get_compiler(queryset.db).get_select()
+    columns = {f'{expression.alias}.{expression.target.column}' for expression, _, _ in select if isinstance(expression, Col)}
+    annotations = {alias for expression, _, alias in select if not isinstance(expression, Col)}
+    return columns, annotations
+
+
+class ListQuerySetColumnTests(SimpleTestCase):
+    """
+    The list querysets load only what the list pages show; the long text
+    columns come as 300 character excerpts. A column added to a list page
+    has to be added here too, on purpose.
+    """
+
+    def assertSelects(self, queryset, columns, annotations=()):
+        self.assertEqual(selected(queryset), (set(columns), set(annotations)))
+
+    def test_instrument_for_card(self):
+        self.assertSelects(Instrument.objects.for_card(), [
+            'app_instrument.id', 'app_instrument.name', 'app_instrument.category_id', 'app_instrument.region_id',
+            'app_instrument.province', 'app_instrument.image', 'app_instrument.date_added', 'app_instrument.views',
+            'app_instrumentcategory.id', 'app_instrumentcategory.name', 'app_instrumentcategory.icon',
+            'app_region.id', 'app_region.name',
+        ], ['description_excerpt'])
+
+    def test_instrument_for_choices(self):
+        self.assertSelects(Instrument.objects.for_choices(), ['app_instrument.id', 'app_instrument.name'])
+
+    def test_page_section_for_list(self):
+        self.assertSelects(PageSection.objects.for_list(), [
+            'app_pagesection.id', 'app_pagesection.page_id', 'app_pagesection.section_type', 'app_pagesection.title',
+            'app_pagesection.image', 'app_pagesection.order', 'app_instrumentpage.id', 'app_instrumentpage.title',
+        ], ['content_excerpt'])
+
+    def test_video_tutorial_for_card(self):
+        self.assertSelects(VideoTutorial.objects.for_card(), [
+            'app_videotutorial.id', 'app_videotutorial.instrument_id', 'app_videotutorial.title',
+            'app_videotutorial.video_file', 'app_videotutorial.uploaded_at', 'app_videotutorial.views',
+            'app_videotutorial.transcoded_source', 'app_instrument.id', 'app_instrument.name',
+            'app_instrument.image', 'app_instrument.category_id', 'app_instrumentcategory.id',
+            'app_instrumentcategory.name',
+        ], ['description_excerpt'])
+
+    def test_video_tutorial_for_choices(self):
+        self.assertSelects(VideoTutorial.objects.for_choices(), ['app_videotutorial.id', 'app_videotutorial.title'])
+
+    def test_discover_section_for_list(self):
+        self.assertSelects(DiscoverSection.objects.for_list(), [
+            'app_discoversection.id', 'app_discoversection.title', 'app_discoversection.image',
+            'app_discoversection.mastering_title', 'app_discoversection.video1', 'app_discoversection.video2',
+            'app_discoversection.video_description',
+        ], ['description_excerpt', 'mastering_paragraph1_excerpt', 'mastering_paragraph2_excerpt'])
+
+    def test_contact_message_for_list(self):
+        self.assertSelects(ContactMessage.objects.for_list(), [
+            'app_contactmessage.id', 'app_contactmessage.user_id', 'app_contactmessage.name',
+            'app_contactmessage.email', 'app_contactmessage.subject', 'app_contactmessage.is_read',
+            'app_contactmessage.submitted_at', 'app_customuser.id', 'app_customuser.username',
+        ], ['message_excerpt'])
+
+    def test_team_member_for_list(self):
+        self.assertSelects(TeamMember.objects.for_list(), [
+            'app_teammember.id', 'app_teammember.name', 'app_teammember.title', 'app_teammember.image',
+            'app_teammember.created_at',
+        ], ['back_description_excerpt'])
+
+    def test_team_member_for_choices(self):
+        self.assertSelects(TeamMember.objects.for_choices(), [
+            'app_teammember.id', 'app_teammember.name', 'app_teammember.title',
+        ])
+
+
+@override_settings(REQUEST_PROFILING_SAMPLE_RATE=0)  # profiling must not make the query counts random
+class InstrumentContentTestCase(TestCase):
+    """An admin and two instruments with a page each; the first has a section and a 3D model"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user('admin', 'admin@example.com', 'admin', role='admin')
+        category = InstrumentCategory.objects.create(name='Percussion')
+        cls.instrument = Instrument.objects.create(name='Kulintang', description='Gongs', category=category)
+        cls.other = Instrument.objects.create(name='Kudyapi', description='Lute', category=category)
+        cls.page = InstrumentPage.objects.create(instrument=cls.instrument, title='History')
+        cls.other_page = InstrumentPage.objects.create(instrument=cls.other, title='Origins')
+        cls.section = PageSection.objects.create(page=cls.page, section_type='description', title='Origins', order=1)
+        cls.model_3d = Instrument3DModel.objects.create(instrument=cls.instrument, file='models/kulintang.glb')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+
+class ObjectViewQueryTests(InstrumentContentTestCase):
+    """
+    The update, delete and detail views look their object up once per
+    request (CachedObjectMixin). The counts include the session and user
+    lookups of the logged in admin.
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()  # cached template fragments would change the counts
+
+    def assertQueriesOnGet(self, count, name, pk):
+        with self.assertNumQueries(count):
+            response = self.client.get(reverse(name, args=[pk]))
+        self.assertEqual(response.status_code, 200)
+
+    def test_instrument_detail(self):
+        # No session lookup: the page does not read request.user
+        self.assertQueriesOnGet(15, 'LoginInstrumentDetail', self.instrument.pk)
+
+    def test_admin_instrument_detail(self):
+        self.assertQueriesOnGet(22, 'detail', self.instrument.pk)
+
+    def test_update_instrument(self):
+        self.assertQueriesOnGet(6, 'updateInstrument', self.instrument.pk)
+
+    def test_delete_instrument(self):
+        self.assertQueriesOnGet(3, 'deleteInstrument', self.instrument.pk)
+
+    def test_update_page(self):
+        self.assertQueriesOnGet(4, 'UpdatePage', self.page.pk)
+
+    def test_delete_page(self):
+        self.assertQueriesOnGet(3, 'DeletePage', self.page.pk)
+
+    def test_update_section(self):
+        self.assertQueriesOnGet(4, 'UpdateSection', self.section.pk)
+
+    def test_delete_section(self):
+        self.assertQueriesOnGet(3, 'DeleteSection', self.section.pk)
+
+    def test_update_3d_model(self):
+        self.assertQueriesOnGet(4, 'UpdatethreeD', self.model_3d.pk)
+
+    def test_delete_3d_model(self):
+        self.assertQueriesOnGet(3, 'DeletethreeD', self.model_3d.pk)
+
+
+class InvalidUpdateContextTests(InstrumentContentTestCase):
+    """An invalid POST re-renders with the saved relations, not the submitted ones the form put on the object"""
+
+    def test_update_section_keeps_saved_page(self):
+        PageSection.objects.create(page=self.page, section_type='quote', order=2)
+        response = self.client.post(reverse('UpdateSection', args=[self.section.pk]), {
+            'page': self.other_page.pk, 'section_type': 'not a type', 'title': 'Origins',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['page'], self.page)
+        self.assertEqual(response.context['max_order'], 2)
+
+    def test_update_3d_model_keeps_saved_instrument_choosable(self):
+        response = self.client.post(reverse('UpdatethreeD', args=[self.model_3d.pk]), {
+            'instrument': self.other.pk, 'file': SimpleUploadedFile('kudyapi.glb', b'not a model'),
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(self.instrument, response.context['Instruments'])
+        self.assertIn(self.instrument, response.context['form'].fields['instrument'].queryset)
+
+
+@override_settings(REQUEST_PROFILING_SAMPLE_RATE=0)
+class UrlTests(TestCase):
+    """
+    Every url benchmark_urls requests answers 2xx or 3xx, within the query
+    count benchmarks/baseline.json records for it. The data is seeded small,
+    so a page whose queries grow with its rows goes over budget here too.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command('seed_benchmark_data', instruments=3, users=4, messages=30, appointments=4, stdout=StringIO())
+
+    def setUp(self):
+        cache.clear()
+
+    def test_urls(self):
+        command = benchmark_urls.Command()
+        clients = {
+            'anonymous': command.make_client(None),
+            'user': command.make_client(command.pick_user(None, admin=False)),
+            'admin': command.make_client(command.pick_user(None, admin=True)),
+        }
+        budgets = load_baseline(DEFAULT_BASELINE, 'urls')
+        for route, pattern in command.routes(None):
+            with self.subTest(route):
+                path = command.build_path(route, pattern)
+                self.assertIsNotNone(path, "no row to request it for, seed_benchmark_data should create one")
+                self.assertTrue(route in budgets, "not in the baseline, record it with benchmark_urls --save-baseline")
+                result = command.measure(clients[command.role_for(route)], path, 1)
+                self.assertTrue(200 <= result['status'] < 400, f"{path} answered {result['status']}")
+                self.assertLessEqual(result['queries'], budgets[route]['queries'], path)
+
+
+@override_settings(REQUEST_PROFILING_SAMPLE_RATE=1)
+class RequestProfilingTests(TestCase):
+    """Profiling a request adds no queries of its own, and never reads request.user synchronously in async mode"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('listener', 'listener@example.com', 'listener')
+
+    def test_user_not_looked_up_for_views_that_do_not_read_it(self):
+        self.client.force_login(self.user)
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('health_live'))
+        self.assertIn('Server-Timing', response)
+
+    async def test_logged_in_async_view(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('check_auth_status'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Server-Timing', response)
+
+    async def test_anonymous_async_view(self):
+        response = await self.async_client.get(reverse('check_auth_status'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Server-Timing', response)
+
+
+@override_settings(
+    REQUEST_PROFILING_SAMPLE_RATE=0,
+    RATE_LIMITS={
+        'login': {'limit': 2, 'period': 60},
+        'User_contact': {'limit': 2, 'period': 60, 'key': 'user', 'methods': ('GET',)},
+    },
+)
+class RateLimitTests(TestCase):
+    """Token buckets per url name and client (ratelimit.py, RateLimitMiddleware)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('singer', 'singer@example.com', 'singer')
+        cls.other = CustomUser.objects.create_user('dancer', 'dancer@example.com', 'dancer')
+
+    def setUp(self):
+        caches[settings.RATE_LIMIT_CACHE].clear()
+
+    def statuses(self, method, name, count, **extra):
+        return [getattr(self.client, method)(reverse(name), **extra).status_code for _ in range(count)]
+
+    def test_429_with_retry_after(self):
+        self.assertEqual(self.statuses('post', 'login', 2), [200, 200])
+        response = self.client.post(reverse('login'))
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '30')  # one token every 60 / 2 seconds
+
+    def test_bucket_refills_a_token_at_a_time(self):
+        take = lambda now: ratelimit.take_token('login', 'ip:test', 2, 60, now=now)
+        self.assertEqual([take(0), take(0), take(0)], [0, 0, 30])
+        self.assertEqual(take(29.5), 1)
+        self.assertEqual([take(30), take(30)], [0, 30])
+
+    def test_no_double_burst_around_a_period_boundary(self):
+        take = lambda now: ratelimit.take_token('login', 'ip:test', 2, 60, now=now)
+        self.assertEqual([take(59.9), take(59.9)], [0, 0])
+        self.assertEqual([take(60.1), take(60.1)], [30, 30])
+
+    def test_ip_key(self):
+        self.assertEqual(self.statuses('post', 'login', 3, REMOTE_ADDR='10.0.0.1'), [200, 200, 429])
+        self.assertEqual(self.statuses('post', 'login', 1, REMOTE_ADDR='10.0.0.2'), [200])
+
+    def test_user_key(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.statuses('get', 'User_contact', 1, REMOTE_ADDR='10.0.0.1'), [200])
+        # Another address is the same user's bucket
+        self.assertEqual(self.statuses('get', 'User_contact', 2, REMOTE_ADDR='10.0.0.2'), [200, 429])
+        self.client.force_login(self.other)
+        self.assertEqual(self.statuses('get', 'User_contact', 1, REMOTE_ADDR='10.0.0.1'), [200])
+
+    def test_user_key_falls_back_to_ip_when_anonymous(self):
+        self.assertEqual(self.statuses('get', 'User_contact', 3, REMOTE_ADDR='10.0.0.1')[-1], 429)
+        self.assertNotEqual(self.statuses('get', 'User_contact', 1, REMOTE_ADDR='10.0.0.2'), [429])
+
+
+@override_settings(PASSWORD_HASHERS=['app.hashers.TunedScryptPasswordHasher'], PASSWORD_SCRYPT_WORK_FACTOR=2 ** 14)
+class ScryptCostChangeTests(TestCase):
+    """Hashes made under older costs keep working, and are rehashed at the current cost on login"""
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user('drummer', 'drummer@example.com', 'kulintang')
+
+    def assertLogsInWithWorkFactor(self, work_factor):
+        with self.settings(PASSWORD_SCRYPT_WORK_FACTOR=work_factor):
+            self.assertTrue(self.client.login(username='drummer', password='kulintang'))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password.split('$')[1], str(work_factor))
+
+    def test_lowered_cost(self):
+        self.assertLogsInWithWorkFactor(2 ** 13)
+
+    def test_raised_cost(self):
+        self.assertLogsInWithWorkFactor(2 ** 15)
+
+
+class AdminTableTests(InstrumentContentTestCase):
+    """Keyset paging of the admin panel tables (tables.py), on the forum messages of the chat management panel"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.forum = InstrumentForum.objects.create(instrument=cls.instrument)
+        other_forum = InstrumentForum.objects.create(instrument=cls.other)
+        posted = datetime(2026, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        # Pairs posted at the same moment, so pages have to break ties on the id
+        cls.messages = [
+            InstrumentMessage.objects.create(forum=cls.forum, author=cls.admin, content=f'Message {i}')
+            for i in range(5)
+        ]
+        for i, message in enumerate(cls.messages):
+            InstrumentMessage.objects.filter(pk=message.pk).update(created_at=posted.replace(second=i // 2))
+        InstrumentMessage.objects.create(forum=other_forum, author=cls.admin, content='Elsewhere')
+
+    def forum_page(self, **params):
+        """(message ids, next cursor, prev cursor, total) of one page of the forum"""
+        rows, next_cursor, prev_cursor, total, capped = tables.page(
+            tables.tables()['forum_messages'], {'forum': str(self.forum.pk), 'limit': '2', **params},
+        )
+        return [row.pk for row in rows], next_cursor, prev_cursor, total
+
+    def test_cursor_round_trip(self):
+        field = InstrumentMessage._meta.get_field('created_at')
+        posted = datetime(2026, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        self.assertEqual(tables.decode_cursor(tables.encode_cursor('prev', posted, 7), field), ('prev', posted, 7))
+
+    def test_invalid_cursors(self):
+        field = InstrumentMessage._meta.get_field('created_at')
+        for cursor in ['not a cursor', tables.encode_cursor('sideways', '2026-01-01T12:00:00', 1),
+                       tables.encode_cursor('next', 'not a date', 1)]:
+            with self.subTest(cursor), self.assertRaises(BadRequest):
+                tables.decode_cursor(cursor, field)
+        response = self.client.get(reverse('admin_table', args=['forum_messages']), {'cursor': 'not a cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_next_and_prev_pages(self):
+        ids = [message.pk for message in self.messages]
+        first, next_cursor, prev_cursor, total = self.forum_page()
+        self.assertEqual((first, prev_cursor, total), (ids[:2], None, 5))
+        second, next_cursor, prev_cursor, _ = self.forum_page(cursor=next_cursor)
+        self.assertEqual(second, ids[2:4])
+        last, last_next, last_prev, _ = self.forum_page(cursor=next_cursor)
+        self.assertEqual((last, last_next), (ids[4:], None))
+
+        back, _, prev_cursor, _ = self.forum_page(cursor=last_prev)
+        self.assertEqual(back, ids[2:4])
+        back, _, prev_cursor, _ = self.forum_page(cursor=prev_cursor)
+        self.assertEqual((back, prev_cursor), (ids[:2], None))
+
+    def test_descending_pages(self):
+        ids = [message.pk for message in reversed(self.messages)]
+        first, next_cursor, _, _ = self.forum_page(sort='-posted')
+        self.assertEqual(first, ids[:2])
+        second, _, prev_cursor, _ = self.forum_page(sort='-posted', cursor=next_cursor)
+        self.assertEqual(second, ids[2:4])
+        self.assertEqual(self.forum_page(sort='-posted', cursor=prev_cursor)[0], ids[:2])
+
+    def test_panel_renders_a_page(self):
+        response = self.client.get(reverse('admin_table', args=['forum_messages']), {'forum': self.forum.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total'], 5)
+        self.assertEqual(response.json()['parts']['rows'].count('forum-message-item'), 5)
+
+
+class DeletionTests(InstrumentContentTestCase):
+    """Chunked cascading deletes (deletion.py), inline and as a background job, and the storage cleanup after them"""
+
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media = self.settings(MEDIA_ROOT=media_root.name)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.tutorial = VideoTutorial.objects.create(
+            instrument=self.instrument, title='Basic strokes', video_file='images/videos/tutorials/strokes.mp4',
+        )
+        self.build = f'images/videos/renditions/{self.tutorial.pk}/20260101000000'
+        self.build_files = [
+            default_storage.save(f'{self.build}/{name}', ContentFile(b'media'))
+            for name in ['master.m3u8', '360p/index.m3u8', '360p/segment_000.ts', '360p/segment_001.ts', 'poster.jpg']
+        ]
+        VideoRendition.objects.bulk_create([
+            VideoRendition(video_tutorial=self.tutorial, kind='hls', label='master', file=f'{self.build}/master.m3u8'),
+            VideoRendition(video_tutorial=self.tutorial, kind='variant', label='360p', file=f'{self.build}/360p/index.m3u8'),
+            VideoRendition(video_tutorial=self.tutorial, kind='poster', file=f'{self.build}/poster.jpg'),
+        ])
+        self.other_video = default_storage.save('images/videos/tutorials/other.mp4', ContentFile(b'media'))
+
+    def test_plan_deletes_dependents_first(self):
+        models = [step.queryset.model for step in deletion.plan(Instrument.objects.filter(pk=self.instrument.pk))]
+        self.assertEqual(models[-1], Instrument)
+        for dependent, parent in [(VideoRendition, VideoTutorial), (VideoTutorial, Instrument),
+                                  (PageSection, InstrumentPage), (InstrumentPage, Instrument)]:
+            self.assertLess(models.index(dependent), models.index(parent))
+
+    def test_inline_delete(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertIsNone(deletion.delete_cascade(Instrument, {'pk': self.instrument.pk}, 'instrument', self.admin))
+        self.assertEqual(len(callbacks), 1)  # the storage cleanup
+        self.assertFalse(Instrument.objects.filter(pk=self.instrument.pk).exists())
+        self.assertFalse(VideoTutorial.objects.exists())
+        self.assertFalse(VideoRendition.objects.exists())
+        self.assertFalse(PageSection.objects.filter(pk=self.section.pk).exists())
+        self.assertTrue(Instrument.objects.filter(pk=self.other.pk).exists())
+        self.assertIn(
+            (self.build, True), PendingFileDeletion.objects.values_list('name', 'directory'),
+        )
+
+    @override_settings(DELETION_INLINE_LIMIT=1)
+    def test_background_delete(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            job = deletion.delete_cascade(Instrument, {'pk': self.instrument.pk}, 'instrument', self.admin)
+        self.assertIsInstance(job, DeletionJob)
+        self.assertEqual(len(callbacks), 1)  # the thread running the job
+        self.assertTrue(Instrument.objects.filter(pk=self.instrument.pk).exists())
+        # Asking again reuses the unfinished job
+        self.assertEqual(deletion.delete_cascade(Instrument, {'pk': self.instrument.pk}, 'instrument'), job)
+
+        self.assertTrue(deletion.run_job(job.pk))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.deleted), ('done', job.total))
+        self.assertFalse(Instrument.objects.filter(pk=self.instrument.pk).exists())
+        self.assertFalse(VideoRendition.objects.exists())
+        self.assertFalse(deletion.run_job(job.pk))  # finished jobs are not run again
+
+    def test_file_cleanup_removes_hls_build(self):
+        response = self.client.post(reverse('DeleteTutorial', args=[self.tutorial.pk]))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(VideoTutorial.objects.filter(pk=self.tutorial.pk).exists())
+
+        deletion.delete_pending_files()
+        self.assertFalse(PendingFileDeletion.objects.exists())
+        for name in self.build_files:
+            self.assertFalse(default_storage.exists(name), name)
+        self.assertTrue(default_storage.exists(self.other_video))
+
+    def test_directory_outside_tutorial_build_not_queued(self):
+        rendition = VideoRendition.objects.create(
+            video_tutorial=self.tutorial, kind='hls', file='images/videos/renditions/master.m3u8',
+        )
+        batch = VideoRendition.objects.filter(pk=rendition.pk)
+        self.assertEqual(deletion.directory_names(VideoRendition, batch), [])
+
+
+class VideoTutorialFilterTests(InstrumentContentTestCase):
+    """?category= and ?saved= filter the video tutorial pages before paginating, and the page links keep them"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        strings = InstrumentCategory.objects.create(name='Strings')
+        cls.other.category = strings
+        cls.other.save()
+        cls.strings = strings
+        cls.gong_videos = [
+            VideoTutorial.objects.create(instrument=cls.instrument, title=f'Gongs {n}', video_file='images/videos/tutorials/g.mp4')
+            for n in range(3)
+        ]
+        cls.lute_videos = [  # a page and one more
+            VideoTutorial.objects.create(instrument=cls.other, title=f'Lute {n}', video_file='images/videos/tutorials/l.mp4')
+            for n in range(VIDEOS_PER_PAGE + 1)
+        ]
+
+    def videos(self, **params):
+        response = self.client.get(reverse('video'), params)
+        self.assertEqual(response.status_code, 200)
+        return response, [video.pk for video in response.context['featured_videos']]
+
+    def test_category_filtered_before_paginating(self):
+        lute = sorted((video.pk for video in self.lute_videos), reverse=True)
+        response, first = self.videos(category=self.strings.pk)
+        self.assertEqual(first, lute[:VIDEOS_PER_PAGE])
+        self.assertContains(response, f'href="?category={self.strings.pk}&amp;page=2"')
+        self.assertEqual(self.videos(category=self.strings.pk, page=2)[1], lute[VIDEOS_PER_PAGE:])
+
+    def test_unknown_category(self):
+        self.assertEqual(self.client.get(reverse('video'), {'category': 999}).status_code, 404)
+
+    def test_saved_videos(self):
+        saved = [self.gong_videos[0].pk, self.lute_videos[1].pk]
+        response, ids = self.videos(saved=f'{saved[0]},{saved[1]},x')
+        self.assertEqual(sorted(ids), saved)
+        self.assertContains(response, 'Saved Performances')
+        self.assertEqual(self.videos(saved='')[1], [])
+
+
+class ModerationTests(InstrumentContentTestCase):
+    """moderate/<target>/: per-id results, the one accepted appointment per date rule, and the request checks"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.member = CustomUser.objects.create_user('member', 'member@example.com', 'member')
+        cls.feedback = [Feedback.objects.create(user=cls.member, message=f'Feedback {n}') for n in range(2)]
+
+    def moderate(self, target, ids, state, **data):
+        return self.client.post(
+            reverse('bulk_moderate', args=[target]),
+            json.dumps({'ids': ids, 'state': state, **data}), content_type='application/json',
+        )
+
+    def performance(self, day, status='Pending'):
+        return PerformanceAppointment.objects.create(
+            user=self.member, event_name='Recital', event_type='Festival', event_location='Hall',
+            event_date=date(2026, 11, day), event_time=time(18), status=status,
+        )
+
+    def test_results_per_id(self):
+        ids = [feedback.pk for feedback in self.feedback]
+        response = self.moderate('feedback', [*ids, 999], 'true')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'results': {str(ids[0]): 'updated', str(ids[1]): 'updated', '999': 'not_found'}, 'updated': 2,
+        })
+        self.assertEqual(Feedback.objects.filter(is_suggestion=True).count(), 2)
+
+    def test_form_post(self):
+        response = self.client.post(
+            reverse('bulk_moderate', args=['feedback']), {'ids': [self.feedback[0].pk], 'state': 'on'},
+        )
+        self.assertEqual(response.json()['updated'], 1)
+
+    def test_accept_rejects_taken_dates(self):
+        first, same_day, free_day = self.performance(1), self.performance(1), self.performance(2)
+        LessonAppointment.objects.create(
+            user=self.member, school_name='School', class_size=20, lesson_date=date(2026, 11, 2),
+            lesson_time=time(9), location='Room 1', status='Accepted',
+        )
+        response = self.moderate('performances', [same_day.pk, first.pk, free_day.pk], 'Accepted')
+        self.assertEqual(response.json(), {
+            'results': {str(first.pk): 'updated', str(same_day.pk): 'conflict', str(free_day.pk): 'conflict'},
+            'updated': 1,
+        })
+        statuses = dict(PerformanceAppointment.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses, {first.pk: 'Accepted', same_day.pk: 'Pending', free_day.pk: 'Pending'})
+
+    def test_already_accepted_keeps_its_date(self):
+        accepted, pending = self.performance(1, status='Accepted'), self.performance(1)
+        results = self.moderate('performances', [pending.pk, accepted.pk], 'Accepted').json()['results']
+        self.assertEqual(results, {str(accepted.pk): 'updated', str(pending.pk): 'conflict'})
+
+    def test_decline_keeps_reason(self):
+        appointment = self.performance(1)
+        self.moderate('performances', [appointment.pk], 'Declined', decline_reason=' Fully booked ')
+        appointment.refresh_from_db()
+        self.assertEqual((appointment.status, appointment.decline_reason), ('Declined', 'Fully booked'))
+
+    def test_non_admin_forbidden(self):
+        self.client.force_login(self.member)
+        self.assertEqual(self.moderate('feedback', [self.feedback[0].pk], 'true').status_code, 403)
+        self.assertFalse(Feedback.objects.filter(is_suggestion=True).exists())
+
+    def test_post_only(self):
+        self.assertEqual(self.client.get(reverse('bulk_moderate', args=['feedback'])).status_code, 405)
+
+    @override_settings(MODERATION_MAX_IDS=2)
+    def test_over_limit(self):
+        response = self.moderate('feedback', [self.feedback[0].pk, self.feedback[1].pk, 999], 'true')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'At most 2 ids per request'})
+        self.assertFalse(Feedback.objects.filter(is_suggestion=True).exists())
+
+    def test_bad_requests(self):
+        for target, ids, state in [('feedback', [], 'true'), ('feedback', ['x'], 'true'),
+                                   ('feedback', [1], 'maybe'), ('performances', [1], 'Lost')]:
+            with self.subTest(target=target, ids=ids, state=state):
+                self.assertEqual(self.moderate(target, ids, state).status_code, 400)
+        self.assertEqual(self.moderate('nothing', [1], 'true').status_code, 404)
+
+
+class MetricsAccessTests(TestCase):
+    """/metrics/ wants the bearer token when one is set, and is not served without one in production"""
+
+    def get(self, token=None):
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        return self.client.get(reverse('metrics'), headers=headers)
+
+    @override_settings(METRICS_TOKEN='', METRICS_REQUIRE_TOKEN=False)
+    def test_open_in_development(self):
+        self.assertEqual(self.get().status_code, 200)
+
+    @override_settings(METRICS_TOKEN='', METRICS_REQUIRE_TOKEN=True)
+    def test_disabled_without_token_in_production(self):
+        self.assertEqual(self.get().status_code, 404)
+
+    @override_settings(METRICS_TOKEN='secret', METRICS_REQUIRE_TOKEN=True)
+    def test_token_checked(self):
+        self.assertEqual(self.get().status_code, 401)
+        self.assertEqual(self.get('wrong').status_code, 401)
+        self.assertEqual(self.get('secret').status_code, 200)
+
+
+class ExportTests(InstrumentContentTestCase):
+    """export/<name>.<fmt> streams the rows, as an async iterator when served under ASGI"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.feedback = [
+            Feedback.objects.create(user=cls.admin, instrument=cls.instrument, message=message)
+            for message in ['Lovely gongs', '=HYPERLINK("x")']
+        ]
+
+    def expected_csv(self):
+        return [
+            'id,user,instrument,is_suggestion,message,date_submitted',
+            *[f'{feedback.pk},admin,Kulintang,False,{message},{feedback.date_submitted.isoformat()}'
+              for feedback, message in zip(self.feedback, ['Lovely gongs', '"\'=HYPERLINK(""x"")"'])],
+        ]
+
+    def test_csv(self):
+        response = self.client.get(reverse('export_data', args=['feedback', 'csv']))
+        self.assertFalse(response.is_async)
+        self.assertEqual(b''.join(response.streaming_content).decode().splitlines(), self.expected_csv())
+
+    def test_json(self):
+        response = self.client.get(reverse('export_data', args=['feedback', 'json']))
+        rows = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([row['message'] for row in rows], ['Lovely gongs', '=HYPERLINK("x")'])
+
+    @override_settings(SERVE_ASGI=True)
+    async def test_async_iterator_under_asgi(self):
+        await self.async_client.aforce_login(self.admin)
+        response = await self.async_client.get(reverse('export_data', args=['feedback', 'csv']))
+        self.assertTrue(response.is_async)
+        content = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(content.decode().splitlines(), self.expected_csv())
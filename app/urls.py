@@ -1,5 +1,5 @@
 from django.urls import path, include
-from app.views import health_check  # ADD THIS LINE
+from app.views import health_check, readiness_check  # ADD THIS LINE
 from django.conf import settings
 from django.conf.urls.static import static
 from . import views
@@ -43,7 +43,7 @@ from .views import (user_main, AboutPageView, Models3d ,ContactPageView ,VideoTu
                     admin_3dContent, Create3dContent, Update3dContent, Delete3dContent,
                     admin_InsLink, CreateInsLink, UpdateInsLink, DeleteInsLink,
                     UserDeleteLesson, UserDeletePerformance, UserUpdateLesson, UserUpdatePerformance,
-                    get_chart_data, get_category_chart_data, get_login_chart_data, check_auth_status, get_user_info)
+                    get_chart_data, get_category_chart_data, get_login_chart_data, get_dashboard_stats, autocomplete_search, admin_table, export_data, bulk_moderate, deletion_job_status, check_auth_status, get_user_info)
 
 
 
@@ -51,6 +51,10 @@ urlpatterns = [
 # GOOGLE ACCOUNT
     path('accounts/', include('allauth.urls')),
     path('health/', health_check, name='health_check'),  # ADD THIS LINE
+    path('health/live/', health_check, name='health_live'),
+    path('health/ready/', readiness_check, name='health_ready'),
+    path('metrics/', views.metrics_view, name='metrics'),
+    path('admin_slow_requests/', views.admin_slow_requests, name='admin_slow_requests'),
     path('check-auth-status/', check_auth_status, name='check_auth_status'),
     path('get-user-info/', get_user_info, name='get_user_info'),
 
@@ -97,6 +101,7 @@ urlpatterns = [
     # Philippine Instrument Html
     path('admin_instrument/', admin_instrument, name='admin_instrument'),
     path('admin_instrument/<int:pk>/', InstrumentDetailView.as_view(), name='detail'),
+    path('admin_instrument/<int:pk>/messages/', views.post_forum_message, name='post_forum_message'),
     path('admin_instrument/create/', CreateInstrument.as_view(), name='CreateInstrument'),
     path('admin_instrument/<int:pk>/edit/', UpdateInstrument.as_view(), name='updateInstrument'),
     path('admin_instrument/<int:pk>/delete/', DeleteInstrument.as_view(), name='deleteInstrument'),
@@ -319,6 +324,12 @@ urlpatterns = [
     path('get_chart_data/', get_chart_data, name='get_chart_data'),
     path('get_category_chart_data/', get_category_chart_data, name='get_category_chart_data'),
     path("get_login_chart_data/", get_login_chart_data, name="get_login_chart_data"),
+    path('get_dashboard_stats/', get_dashboard_stats, name='get_dashboard_stats'),
+    path('autocomplete/<str:source>/', autocomplete_search, name='autocomplete_search'),
+    path('admin_table/<str:name>/', admin_table, name='admin_table'),
+    path('export/<str:name>.<str:fmt>', export_data, name='export_data'),
+    path('moderate/<str:target>/', bulk_moderate, name='bulk_moderate'),
+    path('deletion_jobs/<int:pk>/', deletion_job_status, name='deletion_job_status'),
 
     path('update-performance/<int:pk>/', views.update_performance, name='update_performance'),
     path('update-lesson/<int:pk>/', views.update_lesson, name='update_lesson'),
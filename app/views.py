@@ -1,16 +1,18 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse
-from django.db.models import Count
+from django.http import Http404, JsonResponse
+from django.db.models import Count, F
 from django.utils import timezone
 from django.http import JsonResponse
 from django.utils.timezone import now, timedelta
+from django.utils.functional import SimpleLazyObject
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
 from django.views.decorators.csrf import csrf_exempt
 import json
+import logging
 from django.urls import reverse
 # LOGIN
-from django.contrib.auth import login, authenticate, logout
+from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 
@@ -18,10 +20,19 @@ from django.contrib import messages
 from .forms import UserRegisterForm, UserLoginForm, CustomUserForm, InstrumentForm, CategoryForm, RegionForm, MaterialForm, StepForm ,FeedbackForm, TestimonialForm ,TutorialForm, TechniqueForm ,InsMaterialForm, InstructorForm, PrincipleForm, PrincipleCardForm, SoundForm, ContactPageForm, OfferingForm, ImportanceForm, AudienceForm, MemberForm, LinkForm, ViewForm, SignificanceForm, FunFactForm, SocialMediaForm, FootersForm, HomePageForm, TaglineForm, PageForm, SectionForm, PerformanceForm, LessonForm, threeDForm, sitecontentForm, InsLinkForm, UserPerformanceForm, UserLessonForm, PerformanceAppointmentForm, LessonAppointmentForm
 
 # FROM MODELS.PY
-from .models import CustomUser, InstrumentCategory, Region, Material, InstrumentMaterial ,Instrument, Sound ,Feedback, Testimonial, UserLogin, VideoTutorial,GuidingPrinciples, PrincipleCard ,DiscoverSection, ContactPage, ContactMessage, Offering, CulturalImportance, TargetAudience, TeamMember, SocialLink, TechniqueStep, ConstructionStep, InstrumentImage, CulturalSignificance, Funfact, HomePage, Tagline, FooterSettings, SocialMediaLink, InstrumentPage, PageSection, PerformanceAppointment, LessonAppointment, InstrumentForum, InstrumentMessage, Instrument3DModel, Site3DContent, InstrumentLink
+from .models import CustomUser, InstrumentCategory, Region, Material, InstrumentMaterial ,Instrument, Sound ,Feedback, Testimonial, UserLogin, VideoTutorial,GuidingPrinciples, PrincipleCard ,DiscoverSection, ContactPage, ContactMessage, Offering, CulturalImportance, TargetAudience, TeamMember, SocialLink, TechniqueStep, ConstructionStep, InstrumentImage, CulturalSignificance, Funfact, HomePage, Tagline, FooterSettings, SocialMediaLink, InstrumentPage, PageSection, PerformanceAppointment, LessonAppointment, InstrumentForum, InstrumentMessage, Instrument3DModel, Site3DContent, InstrumentLink, DeletionJob
+
+logger = logging.getLogger(__name__)
 
 from django.views.generic import TemplateView, DetailView, CreateView, UpdateView, DeleteView
+from .mixins import CachedObjectMixin
+from . import deletion
+from django.core.paginator import Paginator
 
+# Video cards per page on the video tutorial pages
+VIDEOS_PER_PAGE = 12
+# Most saved video ids one ?saved= list filters on
+SAVED_VIDEOS_LIMIT = 200
 
 
 def register(request):
@@ -50,19 +61,15 @@ def login_view(request):
     if request.method == 'POST':
         form = UserLoginForm(data=request.POST)
         if form.is_valid():
-            user = authenticate(
-                username=form.cleaned_data['username'],
-                password=form.cleaned_data['password']
-            )
-            if user:
-                login(request, user)
-                redirect_url = reverse('admin_main') if user.role == 'admin' else reverse('user_home')
-                return JsonResponse({
-                    'success': True,
-                    'redirect_url': redirect_url
-                })
-            else:
-                form.add_error(None, "Invalid username or password.")
+            # The form authenticated the user already; checking the password
+            # again would only repeat the (deliberately slow) hash
+            user = form.get_user()
+            login(request, user)
+            redirect_url = reverse('admin_main') if user.role == 'admin' else reverse('user_home')
+            return JsonResponse({
+                'success': True,
+                'redirect_url': redirect_url
+            })
         
         # Prepare error response
         errors = {field: error.get_json_data()[0]['message'] 
@@ -78,12 +85,13 @@ def login_view(request):
 
 
 @csrf_exempt
-def check_auth_status(request):
+async def check_auth_status(request):
     """Check if user is authenticated"""
-    if request.user.is_authenticated:
+    user = await request.auser()
+    if user.is_authenticated:
         return JsonResponse({
             'authenticated': True,
-            'username': request.user.username,
+            'username': user.username,
             'redirect_url': '/user_home/'  # Change to your desired redirect
         })
     return JsonResponse({'authenticated': False})
@@ -162,8 +170,11 @@ def delete_user(request, user_id):
     if request.method == 'POST':
         if user == request.user:
             messages.error(request, "You cannot delete your own account.")
+        elif deletion.delete_cascade(CustomUser, {'pk': user.pk}, f"user {user.username}", request.user):
+            # Keep them out while the background job works through their rows
+            CustomUser.objects.filter(pk=user.pk).update(is_active=False)
+            messages.info(request, f"{user.username}'s account is being deleted in the background.")
         else:
-            user.delete()
             messages.success(request, f"{user.username}'s account has been deleted.")
         
         # Redirect after deletion
@@ -241,6 +252,101 @@ def get_login_chart_data(request):
 
     return JsonResponse({"labels": labels, "data": data})
 
+# STAT CARDS
+from .dashboard import dashboard_stats
+
+@login_required
+def get_dashboard_stats(request):
+    if request.user.role != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    return JsonResponse(dashboard_stats())
+
+# FORM AUTOCOMPLETE
+from . import autocomplete
+
+@login_required
+def autocomplete_search(request, source):
+    if request.user.role != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    try:
+        limit = min(max(int(request.GET.get('limit', autocomplete.DEFAULT_LIMIT)), 1), autocomplete.MAX_LIMIT)
+        offset = max(int(request.GET.get('offset', 0)), 0)
+    except ValueError:
+        return JsonResponse({'error': 'limit and offset must be integers'}, status=400)
+    data = autocomplete.search(source, request.GET.get('q', ''), limit, offset)
+    if data is None:
+        return JsonResponse({'error': 'Not found'}, status=404)
+    return JsonResponse(data)
+
+
+from django.core.exceptions import BadRequest
+from .tables import render_page
+
+@login_required
+def admin_table(request, name):
+    if request.user.role != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    try:
+        data = render_page(request, name)
+    except BadRequest as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if data is None:
+        return JsonResponse({'error': 'Not found'}, status=404)
+    return JsonResponse(data)
+
+
+from .exports import export_response
+
+@login_required
+def export_data(request, name, fmt):
+    if request.user.role != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    try:
+        response = export_response(request, name, fmt)
+    except BadRequest as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if response is None:
+        return JsonResponse({'error': 'Not found'}, status=404)
+    return response
+
+
+from django.views.decorators.http import require_POST
+from .moderation import moderate
+
+@login_required
+@require_POST
+def bulk_moderate(request, target):
+    if request.user.role != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    if request.content_type == 'application/json':
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+        if not isinstance(data, dict):
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+        ids = data.get('ids')
+        ids = ids if isinstance(ids, list) else []
+    else:
+        data = request.POST
+        ids = request.POST.getlist('ids')
+    try:
+        result = moderate(target, ids, data.get('state', ''), str(data.get('decline_reason') or ''))
+    except BadRequest as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    if result is None:
+        return JsonResponse({'error': 'Not found'}, status=404)
+    return JsonResponse(result)
+
+
+@login_required
+def deletion_job_status(request, pk):
+    if request.user.role != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    job = get_object_or_404(DeletionJob, pk=pk)
+    return JsonResponse({'id': job.pk, 'label': job.label, 'status': job.status,
+                         'deleted': job.deleted, 'total': job.total, 'error': job.error})
+
 
 
 
@@ -250,38 +356,30 @@ def admin_main(request):
     if request.user.role != 'admin':  # Check role directly
         return redirect('user_home')
     
-    # Chat Management Context
+    # Chat Management Context; the selected forum's messages are paged in by admin_table/forum_messages/
+    instrument_forums = InstrumentForum.objects.select_related('instrument').annotate(message_count=Count('messages'))
     selected_forum_id = request.GET.get('forum_id')
     if selected_forum_id:
-        selected_forum = get_object_or_404(InstrumentForum, id=selected_forum_id)
+        selected_forum = get_object_or_404(instrument_forums, id=selected_forum_id)
     else:
-        selected_forum = InstrumentForum.objects.first()
-
-    # Get messages for selected forum
-    forum_messages = []
-    if selected_forum:
-        forum_messages = selected_forum.messages.select_related('author').order_by('created_at')
+        selected_forum = instrument_forums.first()
 
-    users = CustomUser.objects.all()
     categorys = InstrumentCategory.objects.all()
     regions = Region.objects.all()
     Materials = Material.objects.all()
     InsMaterials = InstrumentMaterial.objects.all()
-    Instruments = Instrument.objects.all()
     Sounds = Sound.objects.all()
     Feedbacks = Feedback.objects.all()
-    Tutorials = VideoTutorial.objects.all()
-    Testimonials = Testimonial.objects.all()
+    Tutorials = VideoTutorial.objects.for_card()
     Principles = GuidingPrinciples.objects.all()
     PrincipleCards  = PrincipleCard.objects.all()
-    Instructor = DiscoverSection.objects.all()
+    Instructor = DiscoverSection.objects.for_list()
     Offerings = Offering.objects.all()
     Importances = CulturalImportance.objects.all()
     Audiences = TargetAudience.objects.all()
-    Members = TeamMember.objects.all()
+    Members = TeamMember.objects.for_list()
     SocialLinks = SocialLink.objects.all()
     ContactPages = ContactPage.objects.all()
-    ContactMessages = ContactMessage.objects.all()
     technique_steps = TechniqueStep.objects.all()
     ConstructionSteps = ConstructionStep.objects.all()
     InsImage = InstrumentImage.objects.all()
@@ -292,11 +390,8 @@ def admin_main(request):
     footers = FooterSettings.objects.all()
     socialMedia = SocialMediaLink.objects.all()
     pages = InstrumentPage.objects.all()
-    sections = PageSection.objects.all()
-    Performances = PerformanceAppointment.objects.all()
-    Lessons = LessonAppointment.objects.all()
+    sections = PageSection.objects.for_list()
     threeD = Instrument3DModel.objects.all()
-    instrument_forums = InstrumentForum.objects.all()
     sitecontent = Site3DContent.objects.all()
     InsLink = InstrumentLink.objects.all()
     # Removed the duplicate messages variable
@@ -304,19 +399,21 @@ def admin_main(request):
     #Table on forms
     form = CustomUserForm()  
     return render(request, 'app/admin/admin_main.html', 
-                {'users': users, 'categorys': categorys, 
+                {'categorys': categorys, 
                 'regions': regions, 'Materials' : Materials, 
-                'InsMaterials' : InsMaterials ,'Instruments' : Instruments,
-                'Feedbacks' : Feedbacks, 'Testimonials' : Testimonials, 
+                'InsMaterials' : InsMaterials,
+                'Feedbacks' : Feedbacks, 
                 'Principles' : Principles, 'PrincipleCards' : PrincipleCards,
                 'Instructor' : Instructor,'Tutorials' : Tutorials, 'Sounds' : Sounds,
-                'ContactPages' : ContactPages, 'ContactMessages' : ContactMessages,
+                'ContactPages' : ContactPages,
                 'Offerings' : Offerings, 'Importances' : Importances, 'Audiences' : Audiences, 'Members' : Members, 
                 'technique_steps' : technique_steps, 'ConstructionSteps' : ConstructionSteps, 'SocialLinks' : SocialLinks,
                 'InsImage' : InsImage, 'Significance' : Significance, 'funfacts' : funfacts, 'homepages' : homepages, 'taglines' : taglines,
-                'footers' : footers, 'socialMedia' : socialMedia, 'pages' : pages, 'sections' : sections, 'Performances' : Performances,
-                'Lessons' : Lessons, 'threeD' : threeD, 'instrument_forums' : instrument_forums, 'InsLink' : InsLink,
-                'selected_forum': selected_forum, 'messages': forum_messages, 'sitecontent' : sitecontent })  # Use forum_messages here
+                'footers' : footers, 'socialMedia' : socialMedia, 'pages' : pages, 'sections' : sections,
+                'threeD' : threeD, 'instrument_forums' : instrument_forums, 'InsLink' : InsLink,
+                'selected_forum': selected_forum, 'sitecontent' : sitecontent,
+                'stats': dashboard_stats(), 'stats_refresh_seconds': settings.DASHBOARD_STATS_CACHE_SECONDS,
+                'deletion_jobs': DeletionJob.objects.exclude(status='done') })
 
 @login_required
 def toggle_forum_status(request, forum_id):
@@ -350,8 +447,8 @@ def delete_all_forum_messages(request, forum_id):
     if request.user.role != 'admin':
         return redirect('user_home')
         
-    forum = get_object_or_404(InstrumentForum, id=forum_id)
-    forum.messages.all().delete()
+    forum = get_object_or_404(InstrumentForum.objects.select_related('instrument'), id=forum_id)
+    deletion.delete_cascade(InstrumentMessage, {'forum_id': forum.pk}, f"messages of the {forum.instrument.name} forum", request.user)
     
     # Redirect back to admin_main with the current forum
     return redirect(f'{reverse("admin_main")}?forum_id={forum_id}')
@@ -362,11 +459,11 @@ def admin_instrument(request):
     if request.user.role != 'admin':
         return redirect('user_home')
 
-    Instruments = Instrument.objects.all()
-    return render(request, 'app/admin/Instrument/admin_Instrument.html', {'Instruments': Instruments})
+    categorys = InstrumentCategory.objects.all()
+    return render(request, 'app/admin/Instrument/admin_Instrument.html', {'categorys': categorys})
 
 
-def provinces_with_instruments(request):
+async def provinces_with_instruments(request):
     provinces = (
         Instrument.objects
         .filter(province__isnull=False)
@@ -374,16 +471,16 @@ def provinces_with_instruments(request):
         .values_list('province', flat=True)
         .distinct()
     )
-    return JsonResponse(list(provinces), safe=False)
+    return JsonResponse([province async for province in provinces], safe=False)
 
 
-def instruments_by_province(request):
+async def instruments_by_province(request):
     province_name = request.GET.get('province_name')
 
-    instruments = Instrument.objects.filter(province__iexact=province_name)
+    instruments = Instrument.objects.filter(province__iexact=province_name).select_related('region')
 
     data = []
-    for instrument in instruments:
+    async for instrument in instruments:
         image_url = instrument.image.url if instrument.image else None
         full_image_url = request.build_absolute_uri(image_url) if image_url else None
 
@@ -397,8 +494,9 @@ def instruments_by_province(request):
     return JsonResponse(data, safe=False)
 
 
-class InstrumentDetailView(LoginRequiredMixin, DetailView):
+class InstrumentDetailView(LoginRequiredMixin, CachedObjectMixin, DetailView):
     model = Instrument
+    select_related = ['category', 'region']
     template_name = "app/admin/Instrument/instrument_detail.html"
     context_object_name = "instrument"
 
@@ -434,52 +532,48 @@ class InstrumentDetailView(LoginRequiredMixin, DetailView):
 
         return context
 
-    def post(self, request, *args, **kwargs):
-        """Handle chat message posting"""
-        instrument = self.get_object()
-        
-        # Get the forum and check if it's active
-        forum, created = InstrumentForum.objects.get_or_create(instrument=instrument)
-        
-        # Check if forum is inactive
-        if not forum.is_active:
-            return JsonResponse({
-                'success': False,
-                'error': 'This forum is currently inactive. You cannot send messages at this time.'
-            })
-        
-        # Get the message content
-        content = request.POST.get('content', '').strip()
-        
-        # Simple validation
-        if not content:
-            return JsonResponse({
-                'success': False,
-                'error': 'Please type a message'
-            })
-        
-        # Create the message
-        message = InstrumentMessage.objects.create(
-            forum=forum,
-            author=request.user,
-            content=content
-        )
-        
-        # Return success response
+    def fetch_object(self):
+        instrument = super().fetch_object()
+        Instrument.objects.filter(pk=instrument.pk).update(views=F('views') + 1)
+        instrument.views += 1
+        return instrument
+
+async def post_forum_message(request, pk):
+    """Post a chat message to an instrument's forum (AJAX from the detail page)"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Invalid request method'}, status=405)
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({'success': False, 'error': 'Please log in to chat'}, status=403)
+
+    if not await Instrument.objects.filter(pk=pk).aexists():
+        raise Http404("No instrument matches the given query.")
+    forum, created = await InstrumentForum.objects.aget_or_create(instrument_id=pk)
+
+    # Check if forum is inactive
+    if not forum.is_active:
         return JsonResponse({
-            'success': True,
-            'username': request.user.username,
-            'content': content,
-            'timestamp': 'just now',
-            'user_initial': request.user.username[0].upper(),
-            'profile_picture': request.user.profile_picture.url if request.user.profile_picture else ''
+            'success': False,
+            'error': 'This forum is currently inactive. You cannot send messages at this time.'
         })
 
-    def get_object(self):
-        instrument = super().get_object()
-        instrument.views += 1
-        instrument.save()
-        return instrument
+    content = request.POST.get('content', '').strip()
+    if not content:
+        return JsonResponse({
+            'success': False,
+            'error': 'Please type a message'
+        })
+
+    await InstrumentMessage.objects.acreate(forum=forum, author=user, content=content)
+
+    return JsonResponse({
+        'success': True,
+        'username': user.username,
+        'content': content,
+        'timestamp': 'just now',
+        'user_initial': user.username[0].upper(),
+        'profile_picture': user.profile_picture.url if user.profile_picture else ''
+    })
 
 class CreateInstrument(LoginRequiredMixin, CreateView):
     model = Instrument
@@ -501,7 +595,7 @@ class CreateInstrument(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
     
 
-class UpdateInstrument(LoginRequiredMixin, UpdateView):
+class UpdateInstrument(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Instrument
     form_class = InstrumentForm
     template_name = 'app/admin/Instrument/UpdateInstrument.html'
@@ -517,13 +611,18 @@ class UpdateInstrument(LoginRequiredMixin, UpdateView):
     
    
 
-class DeleteInstrument(LoginRequiredMixin, DeleteView):
+class DeleteInstrument(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Instrument
     template_name = 'app/admin/Instrument/DeleteInstrument.html'
 
     def get_success_url(self):
         return reverse('admin_main') + '#admin-Instrument'
 
+    def form_valid(self, form):
+        # Chunked, and in the background for instruments with a lot of content
+        deletion.delete_cascade(Instrument, {'pk': self.object.pk}, f"instrument {self.object.name}", self.request.user)
+        return redirect(self.get_success_url())
+
 # INSTRUMENT HISTORY
 @login_required
 def admin_History(request):
@@ -531,7 +630,7 @@ def admin_History(request):
         return redirect('user_home')
 
     pages = InstrumentPage.objects.all()
-    sections = PageSection.objects.all()
+    sections = PageSection.objects.for_list()
     
     return render(request, 'app/admin/History/admin_History.html', {'pages' : pages, 'sections' : sections })
 
@@ -546,25 +645,18 @@ class CreatePage(LoginRequiredMixin, CreateView):
             return super().form_valid(form)
         return super().form_invalid(form)
     
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
-        return context   
-    
-class UpdatePage(LoginRequiredMixin, UpdateView):
+class UpdatePage(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = InstrumentPage
     form_class = PageForm
     template_name = 'app/admin/History/Page/UpdatePage.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "pages"
+    select_related = ['instrument']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         page = self.get_object()
         
-        # Get all instruments for the dropdown
-        context['Instruments'] = Instrument.objects.all()
-        
         # Get the maximum order value for the current instrument's pages
         context['max_order'] = InstrumentPage.objects.filter(
             instrument=page.instrument
@@ -573,17 +665,18 @@ class UpdatePage(LoginRequiredMixin, UpdateView):
         return context
 
     def form_valid(self, form):
-        # Get the original page before update
-        original_page = self.get_object()
+        # The saved values; the form has already put the new ones on the page
+        original_order = form.initial['order']
+        original_instrument_id = form.initial['instrument']
         
         # Get the new order value from the form
-        new_order = form.cleaned_data.get('order', original_page.order)
+        new_order = form.cleaned_data.get('order', original_order)
         
         # Get the new instrument from the form
-        new_instrument = form.cleaned_data.get('instrument', original_page.instrument)
+        new_instrument = form.cleaned_data['instrument']
         
         # If order or instrument changed, we need to reorder pages
-        if new_order != original_page.order or new_instrument != original_page.instrument:
+        if new_order != original_order or new_instrument.pk != original_instrument_id:
             # First, save with the original order to avoid unique constraint issues
             form.instance.order = 0
             response = super().form_valid(form)
@@ -616,11 +709,12 @@ class UpdatePage(LoginRequiredMixin, UpdateView):
             current_order += 1  
 
 
-class DeletePage(LoginRequiredMixin, DeleteView):
+class DeletePage(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = InstrumentPage
     template_name = 'app/admin/History/Page/DeletePage.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "pages"
+    select_related = ['instrument']
 
 
 class CreateSection(LoginRequiredMixin, CreateView):
@@ -636,49 +730,53 @@ class CreateSection(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['pages'] = InstrumentPage.objects.all()
         context['SECTION_TYPE_CHOICES'] = PageSection.SECTION_TYPE_CHOICES
         return context  
     
-class UpdateSection(LoginRequiredMixin, UpdateView):
+class UpdateSection(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = PageSection
     form_class = SectionForm
     template_name = 'app/admin/History/UpdateSection.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "section"
+    select_related = ['page__instrument']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         section = self.get_object()
-        
-        # Get all pages for the dropdown
-        context['pages'] = InstrumentPage.objects.all()
+        # The saved page: after an invalid POST the form has put the submitted one on the section
+        page_id = context['form'].initial['page']
+        if section.page_id == page_id:
+            page = section.page
+        else:
+            page = InstrumentPage.objects.select_related('instrument').get(pk=page_id)
         
         # Get the maximum order value for the current page's sections
         context['max_order'] = PageSection.objects.filter(
-            page=section.page
+            page=page
         ).count()
         
         # Add section type choices
         context['SECTION_TYPE_CHOICES'] = PageSection.SECTION_TYPE_CHOICES
         
         # Add current page to context
-        context['page'] = section.page
+        context['page'] = page
         
         return context
 
     def form_valid(self, form):
-        # Get the original section before update
-        original_section = self.get_object()
+        # The saved values; the form has already put the new ones on the section
+        original_order = form.initial['order']
+        original_page_id = form.initial['page']
         
         # Get the new order value from the form
-        new_order = form.cleaned_data.get('order', original_section.order)
+        new_order = form.cleaned_data.get('order', original_order)
         
         # Get the new page from the form
-        new_page = form.cleaned_data.get('page', original_section.page)
+        new_page = form.cleaned_data['page']
         
         # If order or page changed, we need to reorder sections
-        if new_order != original_section.order or new_page != original_section.page:
+        if new_order != original_order or new_page.pk != original_page_id:
             # First, save with the original order to avoid unique constraint issues
             form.instance.order = 0
             response = super().form_valid(form)
@@ -710,11 +808,12 @@ class UpdateSection(LoginRequiredMixin, UpdateView):
             sec.save()
             current_order += 1
 
-class DeleteSection(LoginRequiredMixin, DeleteView):
+class DeleteSection(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = PageSection
     template_name = 'app/admin/History/DeleteSection.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "sections"
+    select_related = ['page']
 
     def get_success_url(self):
         return reverse_lazy('admin_main') + '#admin-Instrument'
@@ -730,7 +829,7 @@ def admin_category(request):
     return render(request, 'app/admin/Category/admin_Category.html', {'categorys': categorys})
 
 
-class CategoryDetailView(LoginRequiredMixin, DetailView):
+class CategoryDetailView(LoginRequiredMixin, CachedObjectMixin, DetailView):
     model = InstrumentCategory
     template_name = "app/admin/Category/CategoryDetail.html"
     context_object_name = "category"
@@ -749,7 +848,7 @@ class CreateCategory(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
     
 
-class UpdateCategory(LoginRequiredMixin, UpdateView):
+class UpdateCategory(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = InstrumentCategory
     form_class = CategoryForm
     template_name = 'app/admin/Category/UpdateCategory.html'
@@ -757,7 +856,7 @@ class UpdateCategory(LoginRequiredMixin, UpdateView):
     context_object_name = "category"
 
    
-class DeleteCategory(LoginRequiredMixin, DeleteView):
+class DeleteCategory(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = InstrumentCategory
     template_name = 'app/admin/Category/DeleteCategory.html'
     success_url = reverse_lazy('admin_main')
@@ -775,7 +874,7 @@ def admin_tribe(request):
     return render(request, 'app/admin/Tribe/admin_Tribe.html', {'regions': regions})
 
 
-class TribeDetailView(LoginRequiredMixin, DetailView):
+class TribeDetailView(LoginRequiredMixin, CachedObjectMixin, DetailView):
     model = Region
     template_name = "app/admin/Tribe/TribeDetail.html"
     context_object_name = "tribe"
@@ -794,7 +893,7 @@ class CreateTribe(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
     
 
-class UpdateTribe(LoginRequiredMixin, UpdateView):
+class UpdateTribe(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Region
     form_class = RegionForm
     template_name = 'app/admin/Tribe/UpdateTribe.html'
@@ -802,7 +901,7 @@ class UpdateTribe(LoginRequiredMixin, UpdateView):
     context_object_name = "tribe"
 
    
-class DeleteTribe(LoginRequiredMixin, DeleteView):
+class DeleteTribe(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Region
     template_name = 'app/admin/Tribe/DeleteTribe.html'
     success_url = reverse_lazy('admin_main')
@@ -821,7 +920,7 @@ def admin_material(request):
     return render(request, 'app/admin/Material/admin_Material.html', {'Materials': Materials, 'InsMaterials' : InsMaterials})
 
 
-class MaterialDetailView(LoginRequiredMixin, DetailView):
+class MaterialDetailView(LoginRequiredMixin, CachedObjectMixin, DetailView):
     model = Material
     template_name = "app/admin/Material/MaterialDetail.html"
     context_object_name = "material"
@@ -841,7 +940,7 @@ class CreateMaterial(LoginRequiredMixin, CreateView):
     
     
 
-class UpdateMaterial(LoginRequiredMixin, UpdateView):
+class UpdateMaterial(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Material
     form_class = MaterialForm
     template_name = 'app/admin/Material/UpdateMaterial.html'
@@ -850,7 +949,7 @@ class UpdateMaterial(LoginRequiredMixin, UpdateView):
 
 
    
-class DeleteMaterial(LoginRequiredMixin, DeleteView):
+class DeleteMaterial(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Material
     template_name = 'app/admin/Material/DeleteMaterial.html'
     success_url = reverse_lazy('admin_main')
@@ -872,29 +971,31 @@ class CreateInsMaterial(LoginRequiredMixin, CreateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['Materials'] = Material.objects.all()
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context    
     
 
-class UpdateInsMaterial(LoginRequiredMixin, UpdateView):
+class UpdateInsMaterial(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = InstrumentMaterial
     form_class = InsMaterialForm
     template_name = 'app/admin/Material/InstrumentMaterial/UpdateMaterials.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "insmaterial"
+    select_related = ['instrument']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['Materials'] = Material.objects.all()
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context   
 
 
-class DeleteInsMaterial(LoginRequiredMixin, DeleteView):
+class DeleteInsMaterial(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = InstrumentMaterial
     template_name = 'app/admin/Material/InstrumentMaterial/DeleteMaterials.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "insmaterial"
+    select_related = ['instrument']
 
 
 # INSTRUMENT MATERIAL STEPS
@@ -919,21 +1020,22 @@ class CreateStep(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context  
     
-class UpdateStep(LoginRequiredMixin, UpdateView):
+class UpdateStep(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = ConstructionStep
     template_name = 'app/admin/Construction/UpdateStep.html'
     success_url = reverse_lazy('admin_main')
     fields = ['title', 'description', 'order']
     context_object_name = 'step'
+    select_related = ['instrument']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         step = self.get_object()
         total_steps = ConstructionStep.objects.filter(
-            instrument=step.instrument
+            instrument_id=step.instrument_id
         ).count()
         context['step_range'] = range(1, total_steps + 1)
         return context
@@ -941,22 +1043,24 @@ class UpdateStep(LoginRequiredMixin, UpdateView):
     def form_valid(self, form):
         step = self.get_object()
         new_order = form.cleaned_data['order']
-        current_order = step.order
+        # The saved order; the form has already put the new one on the step
+        current_order = form.initial['order']
         
         if new_order != current_order:
             # Find and swap with the step that has the new order position
             ConstructionStep.objects.filter(
-                instrument=step.instrument,
+                instrument_id=step.instrument_id,
                 order=new_order
             ).update(order=current_order)
             
         return super().form_valid(form)
    
-class DeleteStep(LoginRequiredMixin, DeleteView):
+class DeleteStep(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = ConstructionStep
     template_name = 'app/admin/Construction/DeleteStep.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "Step"
+    select_related = ['instrument']
 
 
 # FEEDBACK
@@ -978,10 +1082,11 @@ def feedback_approval(request, pk):
     feedback.save()
     return redirect(request.META.get('HTTP_REFERER', 'admin_feedback'))
 
-class FeedbackDetailView(LoginRequiredMixin, DetailView):
+class FeedbackDetailView(LoginRequiredMixin, CachedObjectMixin, DetailView):
     model = Feedback
     template_name = "app/admin/Feedback/FeedbackDetail.html"
     context_object_name = "feedback"
+    select_related = ('user', 'instrument')
 
 
 
@@ -999,27 +1104,29 @@ class CreateFeedback(LoginRequiredMixin, CreateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['Users'] = CustomUser.objects.all()
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
     
-class UpdateFeedback(LoginRequiredMixin, UpdateView):
+class UpdateFeedback(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Feedback
     form_class = FeedbackForm
     template_name = 'app/admin/Feedback/UpdateFeedback.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "feedback"
+    select_related = ['user', 'instrument']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['Users'] = CustomUser.objects.all()
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
    
-class DeleteFeedback(LoginRequiredMixin, DeleteView):
+class DeleteFeedback(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Feedback
     template_name = 'app/admin/Feedback/DeleteFeedback.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "feedback"
+    select_related = ['user']
 
 
 
@@ -1060,28 +1167,24 @@ class CreateTestimonial(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # You might not need all users anymore, but keeping if needed elsewhere
-        context['Users'] = CustomUser.objects.all()
         context['current_user'] = self.request.user
         return context
     
-class UpdateTestimonial(LoginRequiredMixin, UpdateView):
+class UpdateTestimonial(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Testimonial
     form_class = TestimonialForm
     template_name = 'app/admin/Testimonial/UpdateTestimonial.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "testimonial"
+    select_related = ['user']
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['Users'] = CustomUser.objects.all()
-        return context
    
-class DeleteTestimonial(LoginRequiredMixin, DeleteView):
+class DeleteTestimonial(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Testimonial
     template_name = 'app/admin/Testimonial/DeleteTestimonial.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "testimonial"
+    select_related = ['user']
 
 
 
@@ -1091,14 +1194,15 @@ def admin_tutorial(request):
     if request.user.role != 'admin':  # Restrict to admin users only
         return redirect('user_home')
 
-    Tutorials = VideoTutorial.objects.all()
+    Tutorials = VideoTutorial.objects.for_card()
     return render(request, 'app/admin/Tutorial/admin_Tutorial.html', {'Tutorials': Tutorials })
 
 
-class TutorialDetailView(LoginRequiredMixin, DetailView):
+class TutorialDetailView(LoginRequiredMixin, CachedObjectMixin, DetailView):
     model = VideoTutorial
     template_name = "app/admin/Tutorial/TutorialDetail.html"
     context_object_name = "tutorial"
+    select_related = ('instrument',)
 
 
 
@@ -1115,29 +1219,35 @@ class CreateTutorial(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
     
     
 
-class UpdateTutorial(LoginRequiredMixin, UpdateView):
+class UpdateTutorial(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = VideoTutorial
     form_class = TutorialForm
     template_name = 'app/admin/Tutorial/UpdateTutorial.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "tutorial"
+    select_related = ['instrument']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
    
-class DeleteTutorial(LoginRequiredMixin, DeleteView):
+class DeleteTutorial(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = VideoTutorial
     template_name = 'app/admin/Tutorial/DeleteTutorial.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "tutorial"
 
+    def form_valid(self, form):
+        # Through deletion so the renditions' files and HLS segments leave storage too
+        deletion.delete_cascade(VideoTutorial, {'pk': self.object.pk}, f"tutorial {self.object.title}", self.request.user)
+        return redirect(self.get_success_url())
+
 # TUTORIAL Technique
 @login_required
 def admin_Technique(request):
@@ -1160,22 +1270,23 @@ class CreateTechnique(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Tutorials'] = VideoTutorial.objects.all()
+        context['Tutorials'] = VideoTutorial.objects.for_choices()
         return context
 
-class UpdateTechnique(LoginRequiredMixin, UpdateView):
+class UpdateTechnique(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = TechniqueStep
     form_class = TechniqueForm
     template_name = 'app/admin/PlayingGuide/UpdateTechnique.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "Technique"
+    select_related = ['video_tutorial']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Tutorials'] = VideoTutorial.objects.all()
+        context['Tutorials'] = VideoTutorial.objects.for_choices()
         return context
    
-class DeleteTechnique(LoginRequiredMixin, DeleteView):
+class DeleteTechnique(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = TechniqueStep
     template_name = 'app/admin/PlayingGuide/DeleteTechnique.html'
     success_url = reverse_lazy('admin_main')
@@ -1188,7 +1299,7 @@ def admin_instructor(request):
     if request.user.role != 'admin':  # Restrict to admin users only
         return redirect('user_home')
 
-    Instructors = DiscoverSection.objects.all()
+    Instructors = DiscoverSection.objects.for_list()
     return render(request, 'app/admin/Instructor/admin_Instructor.html', {'Instructors': Instructors })
 
 
@@ -1204,7 +1315,7 @@ class CreateInstructor(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
         
 
-class UpdateInstructor(LoginRequiredMixin, UpdateView):
+class UpdateInstructor(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = DiscoverSection
     form_class = InstructorForm
     template_name = 'app/admin/Instructor/UpdateInstructor.html'
@@ -1212,7 +1323,7 @@ class UpdateInstructor(LoginRequiredMixin, UpdateView):
     context_object_name = "instructor"
 
    
-class DeleteInstructor(LoginRequiredMixin, DeleteView):
+class DeleteInstructor(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = DiscoverSection
     template_name = 'app/admin/Instructor/DeleteInstructor.html'
     success_url = reverse_lazy('admin_main')
@@ -1243,7 +1354,7 @@ class CreatePrinciple(LoginRequiredMixin, CreateView):
     
         
 
-class UpdatePrinciple(LoginRequiredMixin, UpdateView):
+class UpdatePrinciple(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = GuidingPrinciples
     form_class = PrincipleForm
     template_name = 'app/admin/Principle/UpdatePrinciple.html'
@@ -1251,7 +1362,7 @@ class UpdatePrinciple(LoginRequiredMixin, UpdateView):
     context_object_name = "principle"
 
    
-class DeletePrinciple(LoginRequiredMixin, DeleteView):
+class DeletePrinciple(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = GuidingPrinciples
     template_name = 'app/admin/Principle/DeletePrinciple.html'
     success_url = reverse_lazy('admin_main')
@@ -1275,12 +1386,13 @@ class CreatePrincipleCard(LoginRequiredMixin, CreateView):
         return context
         
 
-class UpdatePrincipleCard(LoginRequiredMixin, UpdateView):
+class UpdatePrincipleCard(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = PrincipleCard
     form_class = PrincipleCardForm
     template_name = 'app/admin/Principle/PrincipleCard/UpdatePrincipleCard.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "card"
+    select_related = ['guiding_principles']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -1288,11 +1400,12 @@ class UpdatePrincipleCard(LoginRequiredMixin, UpdateView):
         return context
 
    
-class DeletePrincipleCard(LoginRequiredMixin, DeleteView):
+class DeletePrincipleCard(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = PrincipleCard
     template_name = 'app/admin/Principle/PrincipleCard/DeletePrincipleCard.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "card"
+    select_related = ['guiding_principles']
 
 
  
@@ -1318,12 +1431,12 @@ class CreateSound(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
     
     
 
-class UpdateSound(LoginRequiredMixin, UpdateView):
+class UpdateSound(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Sound
     form_class = SoundForm
     template_name = 'app/admin/Sound/UpdateSound.html'
@@ -1337,14 +1450,15 @@ class UpdateSound(LoginRequiredMixin, UpdateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
    
-class DeleteSound(LoginRequiredMixin, DeleteView):
+class DeleteSound(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Sound
     template_name = 'app/admin/Sound/DeleteSound.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "sound"
+    select_related = ['instrument']
 
 
 # INSTRUMENT CONTACT PAGE
@@ -1368,7 +1482,7 @@ class CreateContactPage(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
       
 
-class UpdateContactPage(LoginRequiredMixin, UpdateView):
+class UpdateContactPage(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = ContactPage
     form_class = ContactPageForm
     template_name = 'app/admin/ContactPage/UpdateContactPage.html'
@@ -1381,7 +1495,7 @@ class UpdateContactPage(LoginRequiredMixin, UpdateView):
         return super().form_invalid(form)
 
    
-class DeleteContactPage(LoginRequiredMixin, DeleteView):
+class DeleteContactPage(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = ContactPage
     template_name = 'app/admin/ContactPage/DeleteContactPage.html'
     success_url = reverse_lazy('admin_main')
@@ -1411,7 +1525,7 @@ class CreateOffering(LoginRequiredMixin, CreateView):
     
     
 
-class UpdateOffering(LoginRequiredMixin, UpdateView):
+class UpdateOffering(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Offering
     form_class = OfferingForm
     template_name = 'app/admin/Offering/UpdateOffering.html'
@@ -1420,7 +1534,7 @@ class UpdateOffering(LoginRequiredMixin, UpdateView):
 
 
    
-class DeleteOffering(LoginRequiredMixin, DeleteView):
+class DeleteOffering(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Offering
     template_name = 'app/admin/Offering/DeleteOffering.html'
     success_url = reverse_lazy('admin_main')
@@ -1450,7 +1564,7 @@ class CreateImportance(LoginRequiredMixin, CreateView):
     
     
 
-class UpdateImportance(LoginRequiredMixin, UpdateView):
+class UpdateImportance(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = CulturalImportance
     form_class = ImportanceForm
     template_name = 'app/admin/CulturalImportance/UpdateImportance.html'
@@ -1459,7 +1573,7 @@ class UpdateImportance(LoginRequiredMixin, UpdateView):
 
 
    
-class DeleteImportance(LoginRequiredMixin, DeleteView):
+class DeleteImportance(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = CulturalImportance
     template_name = 'app/admin/CulturalImportance/DeleteImportance.html'
     success_url = reverse_lazy('admin_main')
@@ -1490,7 +1604,7 @@ class CreateAudience(LoginRequiredMixin, CreateView):
     
     
 
-class UpdateAudience(LoginRequiredMixin, UpdateView):
+class UpdateAudience(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = TargetAudience
     form_class = AudienceForm
     template_name = 'app/admin/TargetAudience/UpdateAudience.html'
@@ -1499,7 +1613,7 @@ class UpdateAudience(LoginRequiredMixin, UpdateView):
 
 
    
-class DeleteAudience(LoginRequiredMixin, DeleteView):
+class DeleteAudience(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = TargetAudience
     template_name = 'app/admin/TargetAudience/DeleteAudience.html'
     success_url = reverse_lazy('admin_main')
@@ -1511,7 +1625,7 @@ def admin_Member(request):
     if request.user.role != 'admin':  # Restrict to admin users only
         return redirect('user_home')
 
-    Members = TeamMember.objects.all()
+    Members = TeamMember.objects.for_list()
     
     return render(request, 'app/admin/TeamMember/admin_TeamMember.html', {'Members' : Members})
 
@@ -1529,7 +1643,7 @@ class CreateMember(LoginRequiredMixin, CreateView):
     
     
 
-class UpdateMember(LoginRequiredMixin, UpdateView):
+class UpdateMember(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = TeamMember
     form_class = MemberForm
     template_name = 'app/admin/TeamMember/UpdateMember.html'
@@ -1538,7 +1652,7 @@ class UpdateMember(LoginRequiredMixin, UpdateView):
 
 
    
-class DeleteMember(LoginRequiredMixin, DeleteView):
+class DeleteMember(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = TeamMember
     template_name = 'app/admin/TeamMember/DeleteMember.html'
     success_url = reverse_lazy('admin_main')
@@ -1558,29 +1672,31 @@ class CreateLink(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Member'] = TeamMember.objects.all()
+        context['Member'] = TeamMember.objects.for_choices()
         return context
     
 
-class UpdateLink(LoginRequiredMixin, UpdateView):
+class UpdateLink(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = SocialLink
     form_class = LinkForm  # Use the simplified form
     template_name = 'app/admin/TeamMember/Link/UpdateLink.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "Link"
+    select_related = ['member']
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Member'] = TeamMember.objects.all()
+        context['Member'] = TeamMember.objects.for_choices()
         context['PLATFORM_CHOICES'] = SocialLink.PLATFORM_CHOICES
         return context
 
 
-class DeleteLink(LoginRequiredMixin, DeleteView):
+class DeleteLink(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = SocialLink
     template_name = 'app/admin/TeamMember/Link/DeleteLink.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "Link"
+    select_related = ['member']
 
  
 # INSTRUMENT Image
@@ -1605,17 +1721,18 @@ class CreateInsView(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
     
     
 
-class UpdateInsView(LoginRequiredMixin, UpdateView):
+class UpdateInsView(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = InstrumentImage
     form_class = ViewForm
     template_name = 'app/admin/InstrumentImage/UpdateView.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "View"
+    select_related = ['instrument']
 
     def form_valid(self, form):
         if form.is_valid():
@@ -1624,14 +1741,15 @@ class UpdateInsView(LoginRequiredMixin, UpdateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
    
-class DeleteInsView(LoginRequiredMixin, DeleteView):
+class DeleteInsView(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = InstrumentImage
     template_name = 'app/admin/InstrumentImage/DeleteView.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "View"
+    select_related = ['instrument']
 
 # SIGNIFICANCE
 @login_required
@@ -1657,11 +1775,11 @@ class CreateSignificance(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
     
     
-class UpdateSignificance(LoginRequiredMixin, UpdateView):
+class UpdateSignificance(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = CulturalSignificance
     form_class = SignificanceForm
     template_name = 'app/admin/Significance/UpdateSignificance.html'
@@ -1670,11 +1788,11 @@ class UpdateSignificance(LoginRequiredMixin, UpdateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
 
 
-class DeleteSignificance(LoginRequiredMixin, DeleteView):
+class DeleteSignificance(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = CulturalSignificance
     template_name = 'app/admin/Significance/DeleteSignificance.html'
     success_url = reverse_lazy('admin_main')
@@ -1705,11 +1823,11 @@ class CreateFunFact(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
     
     
-class UpdateFunFact(LoginRequiredMixin, UpdateView):
+class UpdateFunFact(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Funfact
     form_class = FunFactForm
     template_name = 'app/admin/FunFact/UpdateFunfact.html'
@@ -1718,11 +1836,11 @@ class UpdateFunFact(LoginRequiredMixin, UpdateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_choices()
         return context
 
 
-class DeleteFunFact(LoginRequiredMixin, DeleteView):
+class DeleteFunFact(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Funfact
     template_name = 'app/admin/FunFact/DeleteFunfact.html'
     success_url = reverse_lazy('admin_main')
@@ -1750,7 +1868,7 @@ class CreateTagline(LoginRequiredMixin, CreateView):
             return super().form_valid(form)
         return super().form_invalid(form)
     
-class UpdateTagline(LoginRequiredMixin, UpdateView):
+class UpdateTagline(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Tagline
     form_class = TaglineForm
     template_name = 'app/admin/HomePage/Tagline/UpdateTagline.html'
@@ -1758,7 +1876,7 @@ class UpdateTagline(LoginRequiredMixin, UpdateView):
     context_object_name = "tagline"
 
 
-class DeleteTagline(LoginRequiredMixin, DeleteView):
+class DeleteTagline(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Tagline
     template_name = 'app/admin/HomePage/Tagline/DeleteTagline.html'
     success_url = reverse_lazy('admin_main')
@@ -1776,7 +1894,7 @@ class CreateHomePage(LoginRequiredMixin, CreateView):
             return super().form_valid(form)
         return super().form_invalid(form)
     
-class UpdateHomePage(LoginRequiredMixin, UpdateView):
+class UpdateHomePage(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = HomePage
     form_class = HomePageForm
     template_name = 'app/admin/HomePage/UpdateHomePage.html'
@@ -1784,7 +1902,7 @@ class UpdateHomePage(LoginRequiredMixin, UpdateView):
     context_object_name = "HomePage"
 
 
-class DeleteHomePage(LoginRequiredMixin, DeleteView):
+class DeleteHomePage(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = HomePage
     template_name = 'app/admin/HomePage/DeleteHomePage.html'
     success_url = reverse_lazy('admin_main')
@@ -1817,7 +1935,7 @@ class CreateFooters(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
 
     
-class UpdateFooters(LoginRequiredMixin, UpdateView):
+class UpdateFooters(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = FooterSettings
     form_class = FootersForm
     template_name = 'app/admin/Footers/UpdateFooters.html'
@@ -1825,7 +1943,7 @@ class UpdateFooters(LoginRequiredMixin, UpdateView):
     context_object_name = "Footers"
 
    
-class DeleteFooters(LoginRequiredMixin, DeleteView):
+class DeleteFooters(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = FooterSettings
     template_name = 'app/admin/Footers/DeleteFooters.html'
     success_url = reverse_lazy('admin_main')
@@ -1855,7 +1973,7 @@ class CreatesocialMedia(LoginRequiredMixin, CreateView):
         return super().form_invalid(form)
 
     
-class UpdatesocialMedia(LoginRequiredMixin, UpdateView):
+class UpdatesocialMedia(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = SocialMediaLink
     form_class = SocialMediaForm
     template_name = 'app/admin/Footers/Link/UpdateLink.html'
@@ -1863,7 +1981,7 @@ class UpdatesocialMedia(LoginRequiredMixin, UpdateView):
     context_object_name = "socialMedia"
 
    
-class DeletesocialMedia(LoginRequiredMixin, DeleteView):
+class DeletesocialMedia(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = SocialMediaLink
     template_name = 'app/admin/Footers/Link/DeleteLink.html'
     success_url = reverse_lazy('admin_main')
@@ -1898,22 +2016,16 @@ class CreatePerformance(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # You might not need all users anymore, but keeping if needed elsewhere
-        context['Users'] = CustomUser.objects.all()
         context['current_user'] = self.request.user
         return context
     
-class UpdatePerformance(LoginRequiredMixin, UpdateView):
+class UpdatePerformance(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = PerformanceAppointment
     form_class = PerformanceForm
     template_name = 'app/admin/Appointment/Performance/UpdatePerformance.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "performances"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['Users'] = CustomUser.objects.all()
-        return context
  
 @login_required
 def performance_Status(request, pk):
@@ -1947,7 +2059,7 @@ def performance_Status(request, pk):
     
     return render(request, 'app/admin/Appointment/Performance/PerformanceStatus.html', {'Performance': Performance})
 
-class DeletePerformance(LoginRequiredMixin, DeleteView):
+class DeletePerformance(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = PerformanceAppointment
     template_name = 'app/admin/Appointment/Performance/DeletePerformance.html'
     success_url = reverse_lazy('admin_main')
@@ -1971,22 +2083,16 @@ class CreateLesson(LoginRequiredMixin, CreateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # You might not need all users anymore, but keeping if needed elsewhere
-        context['Users'] = CustomUser.objects.all()
         context['current_user'] = self.request.user
         return context
     
-class UpdateLesson(LoginRequiredMixin, UpdateView):
+class UpdateLesson(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = LessonAppointment
     form_class = LessonForm
     template_name = 'app/admin/Appointment/Lesson/UpdateLesson.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "Lesson"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['Users'] = CustomUser.objects.all()
-        return context
    
 @login_required
 def Lesson_Status(request, pk):
@@ -2020,7 +2126,7 @@ def Lesson_Status(request, pk):
     
     return render(request, 'app/admin/Appointment/Lesson/LessonStatus.html', {'Lesson': Lesson})
 
-class DeleteLesson(LoginRequiredMixin, DeleteView):
+class DeleteLesson(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = LessonAppointment
     template_name = 'app/admin/Appointment/Lesson/DeleteLesson.html'
     success_url = reverse_lazy('admin_main')
@@ -2032,7 +2138,7 @@ def admin_threeD(request):
     if request.user.role != 'admin':  # Restrict to admin users only
         return redirect('user_home')
 
-    threeD = Instrument3DModel.objects.all()
+    threeD = Instrument3DModel.objects.select_related('instrument')
     return render(request, 'app/admin/3D Model/admin_3DModel.html', {'threeD': threeD })
 
 class CreatethreeD(LoginRequiredMixin, CreateView):
@@ -2055,26 +2161,28 @@ class CreatethreeD(LoginRequiredMixin, CreateView):
         context = super().get_context_data(**kwargs)
         # Get instruments that don't have 3D models yet
         instruments_with_3d = Instrument3DModel.objects.values_list('instrument_id', flat=True)
-        context['Instruments'] = Instrument.objects.exclude(id__in=instruments_with_3d)
+        context['Instruments'] = Instrument.objects.for_choices().exclude(id__in=instruments_with_3d)
         return context
     
 
-class UpdatethreeD(LoginRequiredMixin, UpdateView):
+class UpdatethreeD(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Instrument3DModel
     form_class = threeDForm
     template_name = 'app/admin/3D Model/Update3D.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = 'threeD'
+    select_related = ['instrument']
 
     def form_valid(self, form):
         if form.is_valid():
             # For update, we need to handle the case where instrument is changed
             # but check if the new instrument already has a 3D model
             new_instrument = form.cleaned_data['instrument']
-            current_3d_model = self.get_object()
+            # The saved instrument; the form has already put the new one on the model
+            current_instrument_id = form.initial['instrument']
             
             # If instrument is being changed to one that already has a 3D model
-            if new_instrument != current_3d_model.instrument:
+            if new_instrument.pk != current_instrument_id:
                 if Instrument3DModel.objects.filter(instrument=new_instrument).exists():
                     form.add_error('instrument', 'This instrument already has a 3D model. Please choose a different instrument.')
                     return self.form_invalid(form)
@@ -2084,31 +2192,30 @@ class UpdatethreeD(LoginRequiredMixin, UpdateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Get instruments that don't have 3D models yet, plus the current instrument
-        current_3d_model = self.get_object()
+        # Get instruments that don't have 3D models yet, plus the current (saved) instrument
         instruments_with_3d = Instrument3DModel.objects.exclude(
-            instrument=current_3d_model.instrument
+            instrument_id=context['form'].initial['instrument']
         ).values_list('instrument_id', flat=True)
         
-        context['Instruments'] = Instrument.objects.exclude(id__in=instruments_with_3d)
+        context['Instruments'] = Instrument.objects.for_choices().exclude(id__in=instruments_with_3d)
         return context
 
     def get_form(self, form_class=None):
         form = super().get_form(form_class)
         # Set the initial queryset for the instrument field
-        current_3d_model = self.get_object()
         instruments_with_3d = Instrument3DModel.objects.exclude(
-            instrument=current_3d_model.instrument
+            instrument_id=form.initial['instrument']
         ).values_list('instrument_id', flat=True)
         
         form.fields['instrument'].queryset = Instrument.objects.exclude(id__in=instruments_with_3d)
         return form
     
-class DeletethreeD(LoginRequiredMixin, DeleteView):
+class DeletethreeD(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Instrument3DModel
     template_name = 'app/admin/3D Model/Delete3D.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "threeD"
+    select_related = ['instrument']
 
 
 # PRINCIPLE
@@ -2134,7 +2241,7 @@ class Create3dContent(LoginRequiredMixin, CreateView):
     
         
 
-class Update3dContent(LoginRequiredMixin, UpdateView):
+class Update3dContent(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = Site3DContent
     form_class = sitecontentForm
     template_name = 'app/admin/3D Content/Update3dContent.html'
@@ -2142,7 +2249,7 @@ class Update3dContent(LoginRequiredMixin, UpdateView):
     context_object_name = "sitecontent"
 
    
-class Delete3dContent(LoginRequiredMixin, DeleteView):
+class Delete3dContent(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = Site3DContent
     template_name = 'app/admin/3D Content/Delete3dContent.html'
     success_url = reverse_lazy('admin_main')
@@ -2168,11 +2275,6 @@ class CreateInsLink(LoginRequiredMixin, CreateView):
         if form.is_valid():
             return super().form_valid(form)
         return super().form_invalid(form)
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
-        return context
      
 @login_required
 def primary_source_approve(request, pk):
@@ -2189,20 +2291,16 @@ def primary_source_approve(request, pk):
     
     return redirect(request.META.get('HTTP_REFERER', 'admin_InsLink'))
 
-class UpdateInsLink(LoginRequiredMixin, UpdateView):
+class UpdateInsLink(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = InstrumentLink
     form_class = InsLinkForm
     template_name = 'app/admin/InstrumentLinks/UpdateInsLink.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "link"
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['Instruments'] = Instrument.objects.all()
-        return context
+    select_related = ['instrument']
 
    
-class DeleteInsLink(LoginRequiredMixin, DeleteView):
+class DeleteInsLink(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = InstrumentLink
     template_name = 'app/admin/InstrumentLinks/DeleteInsLink.html'
     success_url = reverse_lazy('admin_main')
@@ -2229,11 +2327,11 @@ def user_main(request):
         categorys = InstrumentCategory.objects.all()
         regions = Region.objects.all()
         Materials = Material.objects.all()
-        Instruments = Instrument.objects.all()
+        Instruments = Instrument.objects.for_card()
         Feedbacks = Feedback.objects.all()
-        testimonials = Testimonial.objects.filter(approved=True).order_by('-date_submitted')[:5]
+        testimonials = Testimonial.objects.filter(approved=True).select_related('user').order_by('-date_submitted')[:5]
         Tutorials = VideoTutorial.objects.all()
-        popular_instruments = Instrument.objects.order_by('-views')[:4]
+        popular_instruments = Instrument.objects.for_card().order_by('-views')[:4]
         
         # Use get_or_create to ensure these exist
         contact, _ = ContactPage.objects.get_or_create(
@@ -2261,8 +2359,8 @@ def user_main(request):
         Lesson = LessonAppointment.objects.all()
         section = DiscoverSection.objects.all()
         
-        # Guiding principle might not exist
-        guiding_principle = GuidingPrinciples.objects.prefetch_related('cards').first()
+        # Guiding principle might not exist; lazy so a cached fragment skips it
+        guiding_principle = SimpleLazyObject(GuidingPrinciples.objects.prefetch_related('cards').first)
 
         return render(request, 'app/user/home.html', {
             'users': users,
@@ -2287,9 +2385,7 @@ def user_main(request):
         
     except Exception as e:
         # Log the error and show a simple page
-        print(f"Error in user_main: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in user_main")
         
         # Return a simple error page or redirect
         from django.http import HttpResponse
@@ -2364,46 +2460,28 @@ from django.views.decorators.http import require_POST
 
 @require_POST
 @csrf_exempt
-def check_date_availability(request):
+async def check_date_availability(request):
     """API endpoint to check if a date is already booked"""
     try:
         data = json.loads(request.body)
         date_str = data.get('date')
-        appointment_type = data.get('appointment_type', 'performance')
         
         if not date_str:
             return JsonResponse({'available': True})  # Default to available if no date provided
         
         from datetime import datetime
-        from django.utils import timezone
         check_date = datetime.strptime(date_str, '%Y-%m-%d').date()
         
-        # Check for existing appointments on the same date
-        existing_performance = False
-        existing_lesson = False
+        # Performance and lesson forms both block on either kind of accepted appointment
+        existing_performance = await PerformanceAppointment.objects.filter(
+            event_date=check_date,
+            status='Accepted'
+        ).aexists()
         
-        if appointment_type == 'performance':
-            # For performance form, check both performance and lesson appointments
-            existing_performance = PerformanceAppointment.objects.filter(
-                event_date=check_date,
-                status='Accepted'
-            ).exists()
-            
-            existing_lesson = LessonAppointment.objects.filter(
-                lesson_date=check_date,
-                status='Accepted'
-            ).exists()
-        else:
-            # For lesson form, check both performance and lesson appointments
-            existing_performance = PerformanceAppointment.objects.filter(
-                event_date=check_date,
-                status='Accepted'
-            ).exists()
-            
-            existing_lesson = LessonAppointment.objects.filter(
-                lesson_date=check_date,
-                status='Accepted'
-            ).exists()
+        existing_lesson = not existing_performance and await LessonAppointment.objects.filter(
+            lesson_date=check_date,
+            status='Accepted'
+        ).aexists()
         
         if existing_performance:
             return JsonResponse({
@@ -2420,26 +2498,22 @@ def check_date_availability(request):
         return JsonResponse({'available': True})
         
     except Exception as e:
-        print(f"Error checking date availability: {e}")
+        logger.exception("Error checking date availability")
         return JsonResponse({'available': True})  # Default to available on error
 # Update user profile (including photo)
 @login_required
 def update_profile(request, user_id):
     try:
-        print(f"DEBUG: Starting update_profile view for user_id: {user_id}, request.user: {request.user}")
-        
         # Get the user object
         user = get_object_or_404(CustomUser, id=user_id)
-        print(f"DEBUG: Found user: {user.username}, role: {user.role}")
         
         # Ensure users can only see their own profile
         if request.user != user:
-            print(f"DEBUG: Permission denied - request.user ({request.user}) != target user ({user})")
+            logger.debug("update_profile: %s tried to open the profile of %s", request.user, user)
             return redirect('user_home' if request.user.role == 'user' else 'admin_main')
 
         # Get the logged-in user's appointments
         try:
-            print(f"DEBUG: Fetching appointments for user: {request.user}")
             from .models import PerformanceAppointment, LessonAppointment
             
             # Get performance appointments for the logged-in user
@@ -2453,34 +2527,23 @@ def update_profile(request, user_id):
             ).order_by('-created_at')[:5]  # Show latest 5 appointments
             
             has_appointments = performance_appointments.exists() or lesson_appointments.exists()
-            print(f"DEBUG: Found {performance_appointments.count()} performance appointments, {lesson_appointments.count()} lesson appointments")
             
         except Exception as e:
-            print(f"ERROR: Error fetching appointments: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("update_profile: error fetching appointments")
             performance_appointments = None
             lesson_appointments = None
             has_appointments = False
 
         if request.method == 'POST':
-            print(f"DEBUG: POST request received")
-            print(f"DEBUG: POST data: {request.POST}")
-            print(f"DEBUG: FILES data: {request.FILES}")
-            
             form = CustomUserForm(request.POST, request.FILES, instance=user)
             if form.is_valid():
-                print(f"DEBUG: Form is valid, saving...")
                 form.save()
                 messages.success(request, "Your profile has been updated successfully.")
                 return redirect('user_home')
             else:
-                print(f"DEBUG: Form errors: {form.errors}")
-                print(f"DEBUG: Form non-field errors: {form.non_field_errors()}")
+                logger.debug("update_profile: form errors %s", form.errors.as_json())
         else:
-            print(f"DEBUG: GET request, creating form instance")
             form = CustomUserForm(instance=user)
-            print(f"DEBUG: Form instance created for user {user.username}")
 
         context = {
             'form': form,
@@ -2490,23 +2553,11 @@ def update_profile(request, user_id):
             'has_appointments': has_appointments,
         }
         
-        print(f"DEBUG: Rendering template 'app/user/update-profile.html' with context keys: {list(context.keys())}")
-        
         return render(request, 'app/user/update-profile.html', context)
         
     except Exception as e:
         # Log the error with detailed information
-        print(f"CRITICAL ERROR in update_profile:")
-        print(f"Error type: {type(e).__name__}")
-        print(f"Error message: {str(e)}")
-        print(f"User: {request.user if hasattr(request, 'user') else 'No user'}")
-        print(f"User ID requested: {user_id}")
-        print(f"Request method: {request.method if hasattr(request, 'method') else 'Unknown'}")
-        
-        # Print full traceback
-        import traceback
-        print("Full traceback:")
-        traceback.print_exc()
+        logger.exception("update_profile failed for user_id=%s (request.user=%s, %s)", user_id, request.user, request.method)
         
         # Return a simple error response to see in browser
         from django.http import HttpResponse
@@ -2637,38 +2688,30 @@ def cancel_lesson(request, appointment_id):
     return redirect('user_home')
 
     
-class UserUpdatePerformance(LoginRequiredMixin, UpdateView):
+class UserUpdatePerformance(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = PerformanceAppointment
     form_class = UserPerformanceForm
     template_name = 'app/user/appointment/UpdatePerformance.html'
     success_url = reverse_lazy('user_home')
     context_object_name = "performance"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['Users'] = CustomUser.objects.all()
-        return context
 
-class UserDeletePerformance(LoginRequiredMixin, DeleteView):
+class UserDeletePerformance(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = PerformanceAppointment
     template_name = 'app/user/appointment/DeletePerformance.html'
     success_url = reverse_lazy('user_home')
     context_object_name = "Performance"
 
     
-class UserUpdateLesson(LoginRequiredMixin, UpdateView):
+class UserUpdateLesson(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = LessonAppointment
     form_class = UserLessonForm
     template_name = 'app/user/appointment/UpdateLesson.html'
     success_url = reverse_lazy('user_home')
     context_object_name = "Lesson"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['Users'] = CustomUser.objects.all()
-        return context
 
-class UserDeleteLesson(LoginRequiredMixin, DeleteView):
+class UserDeleteLesson(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = LessonAppointment
     template_name = 'app/user/appointment/DeleteLesson.html'
     success_url = reverse_lazy('user_home')
@@ -2688,22 +2731,18 @@ class UserVideoTutorialPageView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-       
-        context['categories'] = InstrumentCategory.objects.all()
-        context['featured_videos'] = VideoTutorial.objects.all().order_by('-uploaded_at')
-
+        context.update(video_tutorials_context(self.request))
         return context
     
 @csrf_exempt
-def increment_video_view(request, video_id):
+async def increment_video_view(request, video_id):
     if request.method == 'POST':
-        try:
-            video = VideoTutorial.objects.get(id=video_id)
-            video.views += 1
-            video.save()
-            return JsonResponse({'status': 'success', 'views': video.views})
-        except VideoTutorial.DoesNotExist:
+        # Increment in the database so concurrent views are not lost
+        videos = VideoTutorial.objects.filter(id=video_id)
+        if not await videos.aupdate(views=F('views') + 1):
             return JsonResponse({'status': 'error', 'message': 'Video not found'})
+        views = await videos.values_list('views', flat=True).aget()
+        return JsonResponse({'status': 'success', 'views': views})
     return JsonResponse({'status': 'error', 'message': 'Invalid request'})
 
 class UserAboutPageView(TemplateView):
@@ -2712,31 +2751,7 @@ class UserAboutPageView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Get the GuidingPrinciples instance (assuming you have one)
-        guiding_principles = GuidingPrinciples.objects.first()
-        
-        # Add to template context
-        context['guiding_principles'] = guiding_principles
-        context['Offerings'] = Offering.objects.all()
-        context['CulturalImportances'] = CulturalImportance.objects.all()
-        context['Instruments'] = Instrument.objects.all()
-        context['TargetAudiences'] = TargetAudience.objects.all()
-        context['TeamMembers'] = TeamMember.objects.all()
-        context['SocialLinks'] = SocialLink.objects.all()
-        context['contact'] = ContactPage.objects.first()
-        context['taglines'] = Tagline.objects.first()
-        context['homepages'] = HomePage.objects.first()
-        context['testimonials'] = Testimonial.objects.filter(approved=True).order_by('-date_submitted')[:5]
-        context['social_links'] = SocialMediaLink.objects.all()
-        context['footer_settings'] = FooterSettings.objects.first()
-        
-        # Alternatively, if you want to get Mission and Vision cards directly:
-        mission = PrincipleCard.objects.filter(card_type='Mission').first()
-        vision = PrincipleCard.objects.filter(card_type='Vision').first()
-        
-        context['mission'] = mission
-        context['vision'] = vision
-        
+        context.update(about_page_context())
         return context
     
 class UserContactPageView(TemplateView):
@@ -2749,7 +2764,7 @@ class UserContactPageView(TemplateView):
         contact_config, created = ContactPage.objects.get_or_create(pk=1)
         
         # Add instruments and contact configuration to context
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_card()
         context['contact_config'] = contact_config
         context['subject_choices'] = ContactMessage.Subject  # Add subject choices to context
         
@@ -2789,17 +2804,16 @@ def admin_ContactMessage(request):
     if request.user.role != 'admin':  # Restrict to admin users only
         return redirect('user_home')
 
-    ContactMessages = ContactMessage.objects.all()
-    
-    return render(request, 'app/admin/ContactMessages/admin_ContactMessages.html', {'ContactMessages' : ContactMessages })
+    # The rows come from admin_table/contact_messages/ (app/tables.py)
+    return render(request, 'app/admin/ContactMessage/admin_ContactMessage.html')
 
-class DeleteContactMessage(LoginRequiredMixin, DeleteView):
+class DeleteContactMessage(LoginRequiredMixin, CachedObjectMixin, DeleteView):
     model = ContactMessage
     template_name = 'app/admin/ContactMessage/DeleteContact.html'
     success_url = reverse_lazy('admin_main')
     context_object_name = "contact"
 
-class ViewContactMessage(LoginRequiredMixin, UpdateView):
+class ViewContactMessage(LoginRequiredMixin, CachedObjectMixin, UpdateView):
     model = ContactMessage
     fields = ['name','email', 'subject', 'message', 'submitted_at' ]
     template_name = 'app/admin/ContactMessage/VIewContact.html'
@@ -2821,7 +2835,11 @@ class UserModels3d(TemplateView):
             context['Offerings'] = Offering.objects.all()
             context['CulturalImportances'] = CulturalImportance.objects.all()
             context['TargetAudiences'] = TargetAudience.objects.all()
-            context['Instruments'] = Instrument.objects.all()
+            context['Instruments'] = (
+                Instrument.objects
+                .select_related('category', 'region', 'three_d')
+                .prefetch_related('sound_set')
+            )
             context['three_d'] = Instrument3DModel.objects.all()
             context['TeamMembers'] = TeamMember.objects.all()
             context['SocialLinks'] = SocialLink.objects.all()
@@ -2860,23 +2878,24 @@ class FrontPageView(TemplateView):
         context['categorys'] = InstrumentCategory.objects.all()
         context['regions'] = Region.objects.all()
         context['Materials'] = Material.objects.all()
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_card()
         context['Feedbacks'] = Feedback.objects.all()
-        context['testimonials'] = Testimonial.objects.filter(approved=True).order_by('-date_submitted')[:5]
+        context['testimonials'] = Testimonial.objects.filter(approved=True).select_related('user').order_by('-date_submitted')[:5]
         context['Tutorials'] = VideoTutorial.objects.all()
-        context['popular_instruments'] = Instrument.objects.order_by('-views')[:4]
+        context['popular_instruments'] = Instrument.objects.for_card().order_by('-views')[:4]
         context['section'] = DiscoverSection.objects.all()
-        context['guiding_principle'] = GuidingPrinciples.objects.prefetch_related('cards').first()
+        # Lazy: only queried when the cached principle / footer fragments miss
+        context['guiding_principle'] = SimpleLazyObject(GuidingPrinciples.objects.prefetch_related('cards').first)
         context['Offerings'] = Offering.objects.all()
         context['CulturalImportances'] = CulturalImportance.objects.all()
         context['TargetAudiences'] = TargetAudience.objects.all()
-        context['TeamMembers'] = TeamMember.objects.all()
+        context['TeamMembers'] = TeamMember.objects.prefetch_related('social_links')
         context['SocialLinks'] = SocialLink.objects.all()
-        context['contact'] = ContactPage.objects.first()
+        context['contact'] = SimpleLazyObject(ContactPage.objects.first)
         context['taglines'] = Tagline.objects.first()
         context['homepages'] = HomePage.objects.first()
         context['social_links'] = SocialMediaLink.objects.all()
-        context['footer_settings'] = FooterSettings.objects.first()
+        context['footer_settings'] = SimpleLazyObject(FooterSettings.objects.first)
 
 
         return context
@@ -2886,43 +2905,73 @@ class VideoTutorialPageView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-       
-        context['categories'] = InstrumentCategory.objects.all()
-        context['featured_videos'] = VideoTutorial.objects.all().order_by('-uploaded_at')
-
+        context.update(video_tutorials_context(self.request))
         return context
-    
+
+def video_tutorials_context(request):
+    """
+    Context of the public and user video tutorial pages: one page
+    (?page=) of videos, newest first, so page weight does not grow with
+    the catalogue. ?category=<pk> keeps the instruments of one category
+    and ?saved=<id>,<id> the videos the browser saved, before paginating,
+    so every page of a filtered list is full.
+    """
+    videos = (
+        VideoTutorial.objects
+        .select_related('instrument__category')
+        .prefetch_related('renditions')
+        .order_by('-uploaded_at', '-pk')
+    )
+    categories = InstrumentCategory.objects.all()
+    selected_category = None
+    saved = None
+    if 'saved' in request.GET:
+        saved = [int(pk) for pk in request.GET['saved'].split(',')[:SAVED_VIDEOS_LIMIT] if pk.isdigit()]
+        videos = videos.filter(pk__in=saved)
+    elif request.GET.get('category', '').isdigit():
+        selected_category = categories.filter(pk=request.GET['category']).first()
+        if selected_category is None:
+            raise Http404("No such category")
+        videos = videos.filter(instrument__category=selected_category)
+    return {
+        'categories': categories,
+        'selected_category': selected_category,
+        'showing_saved': saved is not None,
+        'featured_videos': Paginator(videos, VIDEOS_PER_PAGE).get_page(request.GET.get('page')),
+    }
+    
+def about_page_context():
+    """
+    Context of app/partials/about_page.html (public and user About pages).
+    Everything inside the page's cached fragments is lazy, so a fragment
+    cache hit runs no queries for it.
+    """
+    return {
+        'guiding_principles': SimpleLazyObject(GuidingPrinciples.objects.prefetch_related('cards').first),
+        'Offerings': Offering.objects.all(),
+        'CulturalImportances': CulturalImportance.objects.all(),
+        'TargetAudiences': TargetAudience.objects.all(),
+        'Instruments': Instrument.objects.for_card(),
+        'TeamMembers': TeamMember.objects.prefetch_related('social_links'),
+        'SocialLinks': SocialLink.objects.all(),
+        'contact': SimpleLazyObject(ContactPage.objects.first),
+        'taglines': SimpleLazyObject(Tagline.objects.first),
+        'homepages': SimpleLazyObject(HomePage.objects.first),
+        'testimonials': Testimonial.objects.filter(approved=True).select_related('user').order_by('-date_submitted')[:5],
+        'social_links': SocialMediaLink.objects.all(),
+        'footer_settings': SimpleLazyObject(FooterSettings.objects.first),
+        'mission': SimpleLazyObject(PrincipleCard.objects.filter(card_type='Mission').first),
+        'vision': SimpleLazyObject(PrincipleCard.objects.filter(card_type='Vision').first),
+    }
+
+
 class AboutPageView(TemplateView):
     template_name = 'app/login/about.html'
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Get the GuidingPrinciples instance (assuming you have one)
-        guiding_principles = GuidingPrinciples.objects.first()
-        
-        # Add to template context
-        context['guiding_principles'] = guiding_principles
-        context['Offerings'] = Offering.objects.all()
-        context['CulturalImportances'] = CulturalImportance.objects.all()
-        context['TargetAudiences'] = TargetAudience.objects.all()
-        context['Instruments'] = Instrument.objects.all()
-        context['TeamMembers'] = TeamMember.objects.all()
-        context['SocialLinks'] = SocialLink.objects.all()
-        context['contact'] = ContactPage.objects.first()
-        context['taglines'] = Tagline.objects.first()
-        context['homepages'] = HomePage.objects.first()
-        context['testimonials'] = Testimonial.objects.filter(approved=True).order_by('-date_submitted')[:5]
-        context['social_links'] = SocialMediaLink.objects.all()
-        context['footer_settings'] = FooterSettings.objects.first()
-        
-        # Alternatively, if you want to get Mission and Vision cards directly:
-        mission = PrincipleCard.objects.filter(card_type='Mission').first()
-        vision = PrincipleCard.objects.filter(card_type='Vision').first()
-        
-        context['mission'] = mission
-        context['vision'] = vision
-        
+        context.update(about_page_context())
         return context
     
 class ContactPageView(TemplateView):
@@ -2935,7 +2984,7 @@ class ContactPageView(TemplateView):
         contact_config, created = ContactPage.objects.get_or_create(pk=1)
         
         # Add instruments and contact configuration to context
-        context['Instruments'] = Instrument.objects.all()
+        context['Instruments'] = Instrument.objects.for_card()
         context['contact_config'] = contact_config
         context['subject_choices'] = ContactMessage.Subject  # Add subject choices to context
         
@@ -2982,7 +3031,11 @@ class Models3d(TemplateView):
             context['Offerings'] = Offering.objects.all()
             context['CulturalImportances'] = CulturalImportance.objects.all()
             context['TargetAudiences'] = TargetAudience.objects.all()
-            context['Instruments'] = Instrument.objects.all()
+            context['Instruments'] = (
+                Instrument.objects
+                .select_related('category', 'region', 'three_d')
+                .prefetch_related('sound_set')
+            )
             context['three_d'] = Instrument3DModel.objects.all()
             context['TeamMembers'] = TeamMember.objects.all()
             context['SocialLinks'] = SocialLink.objects.all()
@@ -3012,9 +3065,11 @@ import os
 from django.http import JsonResponse
 from django.views.decorators.http import require_GET
 
+from .health import readiness_report
+
 @require_GET
 def health_check(request):
-    """Simple health check endpoint for Render"""
+    """Liveness: the process is up and serving, no dependencies touched"""
     return JsonResponse({
         'status': 'healthy',
         'service': 'philharmonia',
@@ -3023,8 +3078,55 @@ def health_check(request):
     })
 
 
-class LoginInstrumentDetail(DetailView):
+@require_GET
+def readiness_check(request):
+    """Readiness: database, cache and (optionally) R2 answer in time, with latencies"""
+    report = readiness_report()
+    report['service'] = 'philharmonia'
+    return JsonResponse(report, status=200 if report['status'] == 'ready' else 503)
+
+
+# =====================
+# METRICS (Prometheus scrape endpoint)
+# =====================
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from .metrics import render_metrics
+
+@require_GET
+def metrics_view(request):
+    """Request, latency, query, cache and worker metrics merged across workers"""
+    if not settings.METRICS_TOKEN and settings.METRICS_REQUIRE_TOKEN:
+        raise Http404("Metrics need METRICS_TOKEN")
+    if settings.METRICS_TOKEN:
+        supplied = request.headers.get('Authorization', '').removeprefix('Bearer ')
+        if not constant_time_compare(supplied, settings.METRICS_TOKEN):
+            return HttpResponse(status=401)
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
+
+
+# =====================
+# SLOW REQUESTS (RequestProfilingMiddleware)
+# =====================
+from .middleware import slowest_requests
+
+@login_required
+def admin_slow_requests(request):
+    if request.user.role != 'admin':  # Restrict to admin users only
+        return redirect('user_home')
+
+    return render(request, 'app/admin/Profiling/admin_SlowRequests.html', {
+        'slow_requests': slowest_requests(),
+        'sample_rate': settings.REQUEST_PROFILING_SAMPLE_RATE,
+        'slow_ms': settings.REQUEST_PROFILING_SLOW_MS,
+    })
+
+
+class LoginInstrumentDetail(CachedObjectMixin, DetailView):
     model = Instrument
+    select_related = ['category', 'region']
     template_name = "app/login/login_insdetailed.html"
     context_object_name = "instrument"
 
@@ -3052,9 +3154,9 @@ class LoginInstrumentDetail(DetailView):
 
         return context  # ← Missing this line!
 
-    def get_object(self):
-        instrument = super().get_object()
+    def fetch_object(self):
+        instrument = super().fetch_object()
+        Instrument.objects.filter(pk=instrument.pk).update(views=F('views') + 1)
         instrument.views += 1
-        instrument.save()
         return instrument
     
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Warm a freshly started worker before it takes traffic: import the URLconf
+(and with it every view module), compile every project template into the
+cached template loader and open the database connection. Without this the
+first request to each page after a deploy or worker recycle pays for all
+of it. gunicorn.conf.py calls warm_worker() in each worker once the app is
+loaded; the warm_templates command runs the template part by hand (and
+doubles as a syntax check of every template).
+"""
+import logging
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.db import DatabaseError, connection
+from django.template import TemplateSyntaxError, engines
+from django.template.utils import get_app_template_dirs
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIXES = ('.html', '.txt', '.xml')
+
+
+def template_names(include_third_party=False):
+    """Names of all templates under DIRS and the app template directories"""
+    project_dir = Path(apps.get_app_config('app').path) / 'templates'
+    names = set()
+    for engine in engines.all():
+        dirs = [Path(d) for d in engine.engine.dirs]
+        app_dirs = [Path(d) for d in get_app_template_dirs('templates')]
+        dirs += app_dirs if include_third_party else [d for d in app_dirs if d == project_dir]
+        for directory in dirs:
+            for path in directory.rglob('*'):
+                if path.is_file() and path.suffix in TEMPLATE_SUFFIXES:
+                    names.add(path.relative_to(directory).as_posix())
+    return sorted(names)
+
+
+def warm_templates(include_third_party=False):
+    """
+    Load (and so compile and cache) every template. Returns
+    (compiled count, {name: error}, seconds taken).
+    """
+    start = time.perf_counter()
+    compiled = 0
+    errors = {}
+    for name in template_names(include_third_party):
+        for engine in engines.all():
+            try:
+                engine.get_template(name)
+                compiled += 1
+            except TemplateSyntaxError as e:
+                errors[name] = str(e)
+    return compiled, errors, time.perf_counter() - start
+
+
+def warm_worker():
+    start = time.perf_counter()
+    # Resolving the reverse table imports app.urls and every view module
+    get_resolver().reverse_dict
+    compiled, errors, _ = warm_templates()
+    for name, error in errors.items():
+        logger.error("Template %s does not compile: %s", name, error)
+    try:
+        connection.ensure_connection()
+    except DatabaseError:
+        # Not fatal: the first request will retry (and /health/ready/ reports it)
+        logger.warning("Could not open a database connection during warm-up", exc_info=True)
+    logger.info("Worker warmed in %.2fs (%d templates)", time.perf_counter() - start, compiled)
@@ -0,0 +1,32 @@
+# gunicorn picks this file up automatically from the working directory.
+# It points prometheus_client at a shared directory so /metrics can merge
+# the samples of every worker (see app/metrics.py), and warms each new
+# worker (URLconf, templates, DB connection) before it takes traffic.
+import os
+import shutil
+import tempfile
+
+multiproc_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "philharmonia-metrics")
+)
+
+
+def on_starting(server):
+    # Samples from a previous run would be counted again
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    # The app is loaded by now; set WARM_WORKERS=False to skip
+    if os.environ.get("WARM_WORKERS", "True") != "True":
+        return
+    from app.warmup import warm_worker
+
+    warm_worker()
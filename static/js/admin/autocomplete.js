@@ -0,0 +1,89 @@
+/*
+ * Foreign key fields of the admin forms (app/partials/autocomplete_select.html).
+ * The <select> only holds the current choice; typing in the search box
+ * above it fetches matching choices a page at a time from the autocomplete
+ * endpoint (app/autocomplete.py) and puts them in the select:
+ *   <input type="search" data-autocomplete="/autocomplete/instruments/"
+ *          data-autocomplete-field="instrument">
+ *   <select name="instrument" required>...</select>
+ * When there are more, a last "More results" option loads the next page.
+ * Forms are loaded into modals after the page, and several forms with the
+ * same field can be loaded at once, so handlers are delegated and the select
+ * is looked up by name in the search box's own form.
+ */
+(() => {
+    const DELAY = 250;
+    const timers = new WeakMap();
+    const state = new WeakMap();
+
+    function option(value, text, attributes = {}) {
+        const element = new Option(text, value);
+        Object.assign(element.dataset, attributes);
+        return element;
+    }
+
+    function fieldOf(input) {
+        return input.form.querySelector(`select[name="${input.dataset.autocompleteField}"]`);
+    }
+
+    async function load(input, offset) {
+        const select = fieldOf(input);
+        const query = input.value.trim();
+        const params = new URLSearchParams({ q: query, offset });
+        state.set(input, { query, offset });
+        const response = await fetch(`${input.dataset.autocomplete}?${params}`, {
+            headers: { Accept: "application/json" },
+        });
+        if (!response.ok || state.get(input).query !== query) {
+            return; // failed, or the user has typed on since
+        }
+        const { results, more } = await response.json();
+        const selected = select.value;
+        select.querySelector("option[data-more]")?.remove();
+        if (!offset) {
+            select.replaceChildren();
+        }
+        results.forEach((result) => select.add(option(result.id, result.text)));
+        if (more) {
+            select.add(option("", "More results…", { more: offset + results.length }));
+        }
+        if (!select.options.length) {
+            select.add(option("", "No matches"));
+        }
+        if (offset) {
+            select.selectedIndex = offset; // first of the page just loaded
+            return;
+        }
+        // Keep a choice that is still listed, else take the first match
+        select.value = selected;
+        if (select.selectedIndex < 0) {
+            select.selectedIndex = 0;
+        }
+    }
+
+    document.addEventListener("input", (e) => {
+        const input = e.target;
+        if (!input.matches("[data-autocomplete]")) {
+            return;
+        }
+        clearTimeout(timers.get(input));
+        timers.set(input, setTimeout(() => load(input, 0).catch(console.error), DELAY));
+    });
+
+    // An empty field lists the first choices as soon as its search box is used
+    document.addEventListener("focusin", (e) => {
+        const input = e.target;
+        if (input.matches("[data-autocomplete]") && !state.has(input)
+            && !fieldOf(input).value) {
+            load(input, 0).catch(console.error);
+        }
+    });
+
+    document.addEventListener("change", (e) => {
+        const more = e.target.selectedOptions?.[0]?.dataset.more;
+        const input = more && e.target.form?.querySelector(`[data-autocomplete-field="${e.target.name}"]`);
+        if (input) {
+            load(input, Number(more)).catch(console.error);
+        }
+    });
+})();
@@ -0,0 +1,102 @@
+/*
+ * Bulk moderation bars (app/partials/bulk_actions.html) of the server-side
+ * tables. Ticked rows of the table the bar names are sent to
+ * moderate/<target>/ (app/moderation.py) in one request:
+ *   <form class="bulk-actions" data-bulk="lessons" action="/moderate/lessons/">
+ *   <div data-table="lessons"> ... <input type="checkbox" data-bulk-id="7"> ...
+ * The header checkbox [data-bulk-all] ticks the rows on the current page.
+ * The table reloads afterwards, and the bar reports how many rows changed and
+ * which conflicted or were already gone.
+ */
+(() => {
+    function tableOf(form) {
+        return document.querySelector(`[data-table="${form.dataset.bulk}"]`);
+    }
+
+    function formOf(table) {
+        return document.querySelector(`.bulk-actions[data-bulk="${table.dataset.table}"]`);
+    }
+
+    function ticked(table) {
+        return [...table.querySelectorAll("[data-bulk-id]:checked")].map((box) => box.dataset.bulkId);
+    }
+
+    function showCount(table) {
+        const form = formOf(table);
+        if (!form) {
+            return;
+        }
+        const count = ticked(table).length;
+        form.querySelector("[data-bulk-count]").textContent = `${count} selected`;
+        form.querySelector('button[type="submit"]').disabled = count === 0;
+        const all = table.querySelector("[data-bulk-all]");
+        const boxes = table.querySelectorAll("[data-bulk-id]");
+        all.checked = boxes.length > 0 && count === boxes.length;
+    }
+
+    function summary(data) {
+        const outcomes = Object.values(data.results);
+        const parts = [`${data.updated} updated`];
+        const conflicts = outcomes.filter((outcome) => outcome === "conflict").length;
+        const missing = outcomes.filter((outcome) => outcome === "not_found").length;
+        if (conflicts) {
+            parts.push(`${conflicts} not accepted: the date is already taken`);
+        }
+        if (missing) {
+            parts.push(`${missing} no longer exist`);
+        }
+        return parts.join(", ");
+    }
+
+    document.addEventListener("change", (e) => {
+        const table = e.target.closest("[data-table]");
+        if (table && e.target.matches("[data-bulk-all]")) {
+            table.querySelectorAll("[data-bulk-id]").forEach((box) => {
+                box.checked = e.target.checked;
+            });
+        }
+        if (table && e.target.matches("[data-bulk-all], [data-bulk-id]")) {
+            showCount(table);
+        }
+        if (e.target.matches('.bulk-actions select[name="state"]')) {
+            const reason = e.target.form.querySelector('[name="decline_reason"]');
+            if (reason) {
+                reason.hidden = e.target.value !== "Declined";
+            }
+        }
+    });
+
+    // A new page of rows has nothing ticked
+    document.addEventListener("data-table:loaded", (e) => showCount(e.target));
+
+    document.addEventListener("submit", async (e) => {
+        const form = e.target.closest(".bulk-actions");
+        if (!form) {
+            return;
+        }
+        e.preventDefault();
+        const table = tableOf(form);
+        const body = new FormData(form);
+        ticked(table).forEach((id) => body.append("ids", id));
+        const button = form.querySelector('button[type="submit"]');
+        const result = form.querySelector("[data-bulk-result]");
+        button.disabled = true;
+        try {
+            const response = await fetch(form.action, {
+                method: "POST",
+                body,
+                headers: { Accept: "application/json", "X-CSRFToken": body.get("csrfmiddlewaretoken") },
+            });
+            const data = await response.json();
+            result.textContent = response.ok ? summary(data) : data.error;
+            if (response.ok) {
+                table.dispatchEvent(new CustomEvent("data-table:reload", { bubbles: true }));
+            }
+        } catch (error) {
+            console.error(error);
+            result.textContent = "Could not update the selected rows.";
+        } finally {
+            showCount(table);
+        }
+    });
+})();
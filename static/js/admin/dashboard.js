@@ -2,26 +2,27 @@ document.addEventListener("DOMContentLoaded", () => {
     const delmodal = document.getElementById("deleteModal");
     const closeBtn = delmodal.querySelector(".close-btn"); // Fix: use delmodal here
     const delmodalFormContainer = document.getElementById("delete-modal-form-container");
-    const delLinks = document.querySelectorAll(".delete-link");
 
-    // Handle clicking on the delete link
-    delLinks.forEach((link) => {
-        link.addEventListener("click", (e) => {
-            e.preventDefault();
-            const userId = link.getAttribute("data-user-id1");
-
-            // Load the form dynamically via fetch
-            fetch(`/delete-user/${userId}/`)
-                .then((response) => response.text())
-                .then((data) => {
-                    delmodalFormContainer.innerHTML = data;
-                    delmodal.classList.add("show"); // Show the modal
-                })
-                .catch((error) => {
-                    delmodalFormContainer.innerHTML = "<h2>Error loading form</h2>";
-                    console.error("Error:", error);
-                });
-        });
+    // Handle clicking on the delete link (user rows are loaded after the page)
+    document.addEventListener("click", (e) => {
+        const link = e.target.closest(".delete-link");
+        if (!link) {
+            return;
+        }
+        e.preventDefault();
+        const userId = link.getAttribute("data-user-id1");
+
+        // Load the form dynamically via fetch
+        fetch(`/delete-user/${userId}/`)
+            .then((response) => response.text())
+            .then((data) => {
+                delmodalFormContainer.innerHTML = data;
+                delmodal.classList.add("show"); // Show the modal
+            })
+            .catch((error) => {
+                delmodalFormContainer.innerHTML = "<h2>Error loading form</h2>";
+                console.error("Error:", error);
+            });
     });
 
     // Close modal using close button only
@@ -38,26 +39,27 @@ document.addEventListener("DOMContentLoaded", () => {
         const modal = document.getElementById("profileModal");
         const closeBtn = modal.querySelector(".close-btn");
         const modalFormContainer = document.getElementById("modal-form-container");
-        const editLinks = document.querySelectorAll(".edit-profile");
-
-        // Handle clicking on the edit link
-        editLinks.forEach((link) => {
-            link.addEventListener("click", (e) => {
-                e.preventDefault();
-                const userId = link.getAttribute("data-user-id");
-
-                // Load the form dynamically via fetch
-                fetch(`/update_profile/${userId}/`)
-                    .then((response) => response.text())
-                    .then((data) => {
-                        modalFormContainer.innerHTML = data;
-                        modal.classList.add("show"); // Show the modal
-                    })
-                    .catch((error) => {
-                        modalFormContainer.innerHTML = "<h2>Error loading form</h2>";
-                        console.error("Error:", error);
-                    });
-            });
+
+        // Handle clicking on the edit link (user rows are loaded after the page)
+        document.addEventListener("click", (e) => {
+            const link = e.target.closest(".edit-profile");
+            if (!link) {
+                return;
+            }
+            e.preventDefault();
+            const userId = link.getAttribute("data-user-id");
+
+            // Load the form dynamically via fetch
+            fetch(`/update_profile/${userId}/`)
+                .then((response) => response.text())
+                .then((data) => {
+                    modalFormContainer.innerHTML = data;
+                    modal.classList.add("show"); // Show the modal
+                })
+                .catch((error) => {
+                    modalFormContainer.innerHTML = "<h2>Error loading form</h2>";
+                    console.error("Error:", error);
+                });
         });
 
         // Close modal using close button only
@@ -69,33 +71,6 @@ document.addEventListener("DOMContentLoaded", () => {
 
 
 
-document.addEventListener("DOMContentLoaded", () => {
-    const searchInputuser = document.querySelector(".user"); // Input field
-    const userTableRows = document.querySelectorAll(".user1 tr"); // Desktop table rows
-    const userCards = document.querySelectorAll(".instrument-card"); // Mobile cards
-
-    searchInputuser.addEventListener("input", () => {
-        const query = searchInputuser.value.toLowerCase().trim();
-
-        // Search in desktop table
-        userTableRows.forEach((row) => {
-            const cells = row.querySelectorAll("td");
-            const textContent = Array.from(cells)
-                .map((cell) => cell.textContent.toLowerCase())
-                .join(" ");
-
-            row.style.display = textContent.includes(query) ? "" : "none";
-        });
-
-        // Search in mobile cards
-        userCards.forEach((card) => {
-            const textContent = card.textContent.toLowerCase();
-            card.style.display = textContent.includes(query) ? "" : "none";
-        });
-    });
-});
-
-
 document.addEventListener('DOMContentLoaded', function() {
     const statNumbers = document.querySelectorAll('.stat-card h3');
     
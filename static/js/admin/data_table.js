@@ -0,0 +1,169 @@
+/*
+ * Server-side tables of the admin panels (app/tables.py).
+ *
+ * A panel's table is an empty shell that names its endpoint; rows are fetched
+ * a page at a time the first time the panel is shown:
+ *   <div data-table="users" data-table-url="/admin_table/users/" data-sort="username">
+ *     <div data-table-part="cards"></div>          mobile cards
+ *     <th data-sort="username">Username</th>        click to sort, again to reverse
+ *     <tbody data-table-part="rows"></tbody>        desktop rows
+ *     <p data-table-empty hidden>No users</p>
+ *     app/partials/table_pager.html                 previous/next and the total
+ *   </div>
+ * The panel's search box and filter selects sit outside the shell and name
+ * their table:
+ *   <input data-table-search="users">
+ *   <select data-table-filter="users" name="role">...</select>
+ * Searching, filtering or sorting goes back to the first page. The total only
+ * changes with those, so following pages ask for count=0.
+ * Each load dispatches "data-table:loaded" on the shell; dispatching
+ * "data-table:reload" on it fetches the first page again.
+ */
+(() => {
+    const DELAY = 300;
+    const tables = new Map();
+
+    function stateOf(element) {
+        if (!tables.has(element)) {
+            tables.set(element, { total: "", request: 0, timer: null });
+        }
+        return tables.get(element);
+    }
+
+    function tableNamed(name) {
+        return document.querySelector(`[data-table="${name}"]`);
+    }
+
+    function showSort(element) {
+        const sort = element.dataset.sort;
+        element.querySelectorAll("th[data-sort]").forEach((th) => {
+            if (sort.replace(/^-/, "") === th.dataset.sort) {
+                th.setAttribute("aria-sort", sort.startsWith("-") ? "descending" : "ascending");
+            } else {
+                th.removeAttribute("aria-sort");
+            }
+        });
+    }
+
+    async function load(element, cursor = "") {
+        const state = stateOf(element);
+        const name = element.dataset.table;
+        const params = new URLSearchParams({ sort: element.dataset.sort });
+        const search = document.querySelector(`[data-table-search="${name}"]`);
+        if (search?.value.trim()) {
+            params.set("q", search.value.trim());
+        }
+        document.querySelectorAll(`[data-table-filter="${name}"]`).forEach((select) => {
+            if (select.value) {
+                params.set(select.name, select.value);
+            }
+        });
+        if (cursor) {
+            params.set("cursor", cursor);
+            params.set("count", "0");
+        }
+        const request = ++state.request;
+        element.setAttribute("aria-busy", "true");
+        const response = await fetch(`${element.dataset.tableUrl}?${params}`, {
+            headers: { Accept: "application/json" },
+        });
+        if (request !== state.request) {
+            return; // a newer search, sort or page has been asked for
+        }
+        element.removeAttribute("aria-busy");
+        if (!response.ok) {
+            throw new Error(`${response.status} loading ${element.dataset.tableUrl}`);
+        }
+        const data = await response.json();
+        Object.entries(data.parts).forEach(([part, html]) => {
+            element.querySelector(`[data-table-part="${part}"]`).innerHTML = html;
+        });
+        element.querySelector("[data-table-empty]").hidden = !data.empty;
+        if (data.total !== null) {
+            state.total = data.total_capped ? `${data.total.toLocaleString()}+` : data.total.toLocaleString();
+        }
+        const pager = element.querySelector(".table-pager");
+        pager.hidden = data.empty && !cursor;
+        pager.querySelector('[data-table-page="prev"]').disabled = !data.prev;
+        pager.querySelector('[data-table-page="next"]').disabled = !data.next;
+        pager.querySelector('[data-table-page="prev"]').dataset.cursor = data.prev ?? "";
+        pager.querySelector('[data-table-page="next"]').dataset.cursor = data.next ?? "";
+        pager.querySelector("[data-table-total]").textContent = `${state.total} total`;
+        showSort(element);
+        element.dispatchEvent(new CustomEvent("data-table:loaded", { bubbles: true }));
+    }
+
+    function reload(element) {
+        load(element).catch(console.error);
+    }
+
+    function sortBy(th) {
+        const element = th.closest("[data-table]");
+        const sort = element.dataset.sort;
+        element.dataset.sort = sort === th.dataset.sort ? `-${th.dataset.sort}` : th.dataset.sort;
+        reload(element);
+    }
+
+    // Panels are hidden until picked from the side menu; load each once it shows
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach((entry) => {
+            if (entry.isIntersecting) {
+                observer.unobserve(entry.target);
+                reload(entry.target);
+            }
+        });
+    });
+
+    document.addEventListener("DOMContentLoaded", () => {
+        document.querySelectorAll("[data-table]").forEach((element) => {
+            element.querySelectorAll("th[data-sort]").forEach((th) => {
+                th.tabIndex = 0;
+            });
+            showSort(element);
+            observer.observe(element);
+        });
+    });
+
+    document.addEventListener("click", (e) => {
+        const th = e.target.closest("[data-table] th[data-sort]");
+        if (th) {
+            sortBy(th);
+            return;
+        }
+        const button = e.target.closest("[data-table-page]");
+        if (button?.dataset.cursor) {
+            const element = button.closest("[data-table]");
+            load(element, button.dataset.cursor)
+                .then(() => element.scrollIntoView({ block: "start" }))
+                .catch(console.error);
+        }
+    });
+
+    document.addEventListener("keydown", (e) => {
+        if (e.key === "Enter" && e.target.matches("[data-table] th[data-sort]")) {
+            sortBy(e.target);
+        }
+    });
+
+    document.addEventListener("input", (e) => {
+        const element = e.target.matches("[data-table-search]") && tableNamed(e.target.dataset.tableSearch);
+        if (element) {
+            const state = stateOf(element);
+            clearTimeout(state.timer);
+            state.timer = setTimeout(() => reload(element), DELAY);
+        }
+    });
+
+    document.addEventListener("data-table:reload", (e) => {
+        if (e.target.matches?.("[data-table]")) {
+            reload(e.target);
+        }
+    });
+
+    document.addEventListener("change", (e) => {
+        const element = e.target.matches("[data-table-filter]") && tableNamed(e.target.dataset.tableFilter);
+        if (element) {
+            reload(element);
+        }
+    });
+})();
@@ -0,0 +1,34 @@
+/*
+ * Progress of the background deletes listed by app/partials/deletion_jobs.html:
+ *   <div class="deletion-job" data-deletion-job="/deletion_jobs/3/" data-status="running">
+ * Each queued or running job is polled until it finishes.
+ */
+(() => {
+    const INTERVAL = 2000;
+
+    async function poll(element) {
+        const response = await fetch(element.dataset.deletionJob, { headers: { Accept: "application/json" } });
+        if (!response.ok) {
+            throw new Error(`${response.status} loading ${element.dataset.deletionJob}`);
+        }
+        const job = await response.json();
+        const progress = element.querySelector("progress");
+        progress.max = job.total;
+        progress.value = job.deleted;
+        element.dataset.status = job.status;
+        const text = element.querySelector("[data-deletion-job-progress]");
+        if (job.status === "failed") {
+            text.textContent = `Failed: ${job.error}`;
+        } else if (job.status === "done") {
+            text.textContent = "Done";
+        } else {
+            text.textContent = `${job.deleted.toLocaleString()} of ${job.total.toLocaleString()} rows`;
+            setTimeout(() => poll(element).catch(console.error), INTERVAL);
+        }
+    }
+
+    document.addEventListener("DOMContentLoaded", () => {
+        document.querySelectorAll('[data-deletion-job][data-status="queued"], [data-deletion-job][data-status="running"]')
+            .forEach((element) => setTimeout(() => poll(element).catch(console.error), INTERVAL));
+    });
+})();
@@ -0,0 +1,91 @@
+/*
+ * Create/Edit/Delete modals and list search for the admin panels.
+ *
+ * A modal says which links open it and which form to load into it:
+ *   <div id="Edit-Tribe-Modal" data-trigger=".edit-Tribe"
+ *        data-form-url="/admin_tribe/{id}/edit/" data-id-attr="data-Tribe-id">
+ * {id} is read from the clicked link's data-id-attr attribute. Only links in
+ * the same panel (the modal's parent element) count, as some panels share
+ * link classes. The form is fetched into the modal's "...-modal-form-container"
+ * and the modal gets the "show" class. Forms are kept for the life of the
+ * page (every save reloads it), so reopening a modal does not hit the server
+ * again. A close button (class "close-btn...") inside the modal, or a click
+ * on its backdrop, hides it.
+ *
+ * A search box in a #search-section filters the rows and cards of the list
+ * that follows it by their text:
+ *   <input data-search=".Tribe1 tr, .instrument-card">
+ */
+(() => {
+    const forms = new Map();
+    let modals;
+
+    async function loadForm(url) {
+        if (!forms.has(url)) {
+            forms.set(url, fetch(url).then((response) => {
+                if (!response.ok) {
+                    throw new Error(`${response.status} loading ${url}`);
+                }
+                return response.text();
+            }));
+        }
+        try {
+            return await forms.get(url);
+        } catch (error) {
+            forms.delete(url);
+            throw error;
+        }
+    }
+
+    async function openModal(modal, url) {
+        const container = modal.querySelector('[id$="modal-form-container"]');
+        container.innerHTML = '<div class="loading-spinner"></div>';
+        modal.classList.add("show");
+        try {
+            container.innerHTML = await loadForm(url);
+        } catch (error) {
+            container.innerHTML = "<h2>Error loading form</h2>";
+            console.error("Error:", error);
+        }
+    }
+
+    function findModal(target) {
+        modals ??= document.querySelectorAll("[data-trigger][data-form-url]");
+        for (const modal of modals) {
+            const trigger = target.closest(modal.dataset.trigger);
+            if (trigger && modal.parentElement.contains(trigger)) {
+                const id = modal.dataset.idAttr ? trigger.getAttribute(modal.dataset.idAttr) : "";
+                return [modal, modal.dataset.formUrl.replace("{id}", id)];
+            }
+        }
+        return null;
+    }
+
+    document.addEventListener("click", (e) => {
+        const found = findModal(e.target);
+        if (found) {
+            e.preventDefault();
+            openModal(...found);
+            return;
+        }
+        const closeBtn = e.target.closest('[id$="-Modal"] [class^="close-btn"]');
+        if (closeBtn) {
+            closeBtn.closest('[id$="-Modal"]').classList.remove("show");
+        } else if (e.target.matches('[id$="-Modal"].show')) {
+            e.target.classList.remove("show");
+        }
+    });
+
+    document.addEventListener("input", (e) => {
+        const input = e.target;
+        if (!input.matches("[data-search]")) {
+            return;
+        }
+        // All panels share one page; only filter the list under this search box
+        const list = input.closest("#search-section")?.nextElementSibling ?? document;
+        const query = input.value.toLowerCase().trim();
+        list.querySelectorAll(input.dataset.search).forEach((item) => {
+            item.style.display = item.textContent.toLowerCase().includes(query) ? "" : "none";
+        });
+    });
+})();
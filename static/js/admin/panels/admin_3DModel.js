@@ -0,0 +1,107 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const modelViewer = document.getElementById('model-viewer');
+    const closeViewerBtn = document.getElementById('close-viewer');
+    const viewerContent = document.getElementById('viewer-content');
+    const viewerTitle = document.getElementById('viewer-title');
+    const imageControls = document.getElementById('image-controls');
+
+    // View 3D model functionality - FIXED VERSION
+    const viewButtons = document.querySelectorAll('.view-3d-btn');
+    viewButtons.forEach(button => {
+        button.addEventListener('click', function(e) {
+            e.preventDefault();
+            const modelUrl = this.getAttribute('data-model-url');
+            const modelName = this.getAttribute('data-model-name');
+
+            if (modelUrl) {
+                // Clear previous content
+                viewerContent.innerHTML = '';
+
+                // Check if it's a 3D model file
+                const is3DModel = modelUrl.toLowerCase().endsWith('.glb') || modelUrl.toLowerCase().endsWith('.gltf');
+
+                if (is3DModel) {
+                    // Create model-viewer for 3D models
+                    const modelViewerElement = document.createElement('model-viewer');
+                    modelViewerElement.src = modelUrl;
+                    modelViewerElement.alt = `3D Model: ${modelName}`;
+                    modelViewerElement.setAttribute('camera-controls', '');
+                    modelViewerElement.setAttribute('auto-rotate', '');
+                    modelViewerElement.setAttribute('style', 'width: 100%; height: 100%; max-width: 800px; max-height: 600px;');
+                    modelViewerElement.classList.add('viewer-model');
+
+                    viewerContent.appendChild(modelViewerElement);
+                    imageControls.style.display = 'none'; // Hide image controls for 3D models
+                } else {
+                    // Create image element for regular images
+                    const imgElement = document.createElement('img');
+                    imgElement.src = modelUrl;
+                    imgElement.alt = `Model: ${modelName}`;
+                    imgElement.classList.add('viewer-image');
+                    imgElement.id = 'viewer-image';
+
+                    viewerContent.appendChild(imgElement);
+                    imageControls.style.display = 'flex'; // Show image controls for images
+
+                    // Initialize image controls
+                    initImageControls();
+                }
+
+                viewerTitle.textContent = `3D Model: ${modelName}`;
+                modelViewer.style.display = 'flex';
+            }
+        });
+    });
+
+    // Close 3D model viewer
+    closeViewerBtn.addEventListener('click', function() {
+        modelViewer.style.display = 'none';
+    });
+
+    // Image controls (only for regular images)
+    function initImageControls() {
+        const viewerImage = document.getElementById('viewer-image');
+        if (!viewerImage) return;
+
+        const rotateLeftBtn = document.getElementById('rotate-left');
+        const rotateRightBtn = document.getElementById('rotate-right');
+        const zoomInBtn = document.getElementById('zoom-in');
+        const zoomOutBtn = document.getElementById('zoom-out');
+
+        let rotation = 0;
+        let scale = 1;
+
+        // Remove existing event listeners by cloning and replacing
+        const newRotateLeft = rotateLeftBtn.cloneNode(true);
+        const newRotateRight = rotateRightBtn.cloneNode(true);
+        const newZoomIn = zoomInBtn.cloneNode(true);
+        const newZoomOut = zoomOutBtn.cloneNode(true);
+
+        rotateLeftBtn.parentNode.replaceChild(newRotateLeft, rotateLeftBtn);
+        rotateRightBtn.parentNode.replaceChild(newRotateRight, rotateRightBtn);
+        zoomInBtn.parentNode.replaceChild(newZoomIn, zoomInBtn);
+        zoomOutBtn.parentNode.replaceChild(newZoomOut, zoomOutBtn);
+
+        // Add new event listeners
+        newRotateLeft.addEventListener('click', function() {
+            rotation -= 15;
+            viewerImage.style.transform = `rotate(${rotation}deg) scale(${scale})`;
+        });
+
+        newRotateRight.addEventListener('click', function() {
+            rotation += 15;
+            viewerImage.style.transform = `rotate(${rotation}deg) scale(${scale})`;
+        });
+
+        newZoomIn.addEventListener('click', function() {
+            scale *= 1.2;
+            viewerImage.style.transform = `rotate(${rotation}deg) scale(${scale})`;
+        });
+
+        newZoomOut.addEventListener('click', function() {
+            scale /= 1.2;
+            viewerImage.style.transform = `rotate(${rotation}deg) scale(${scale})`;
+        });
+    }
+
+});
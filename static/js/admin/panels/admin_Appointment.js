@@ -0,0 +1,215 @@
+function toggleDeclineReason()
+
+{
+        var statusSelect = document.getElementById('id_status');
+        var declineReasonGroup = document.getElementById('declineReasonGroup');
+
+        if (statusSelect.value === 'Declined') {
+            declineReasonGroup.style.display = 'block';
+            document.getElementById('id_decline_reason').required = true;
+        } else {
+            declineReasonGroup.style.display = 'none';
+            document.getElementById('id_decline_reason').required = false;
+        }
+    }
+
+function validateForm()
+
+{
+        var statusSelect = document.getElementById('id_status');
+        var declineReason = document.getElementById('id_decline_reason');
+
+        if (statusSelect.value === 'Declined') {
+            if (!declineReason.value.trim()) {
+                alert('Please provide a reason for declining the appointment.');
+                declineReason.focus();
+                return false;
+            }
+        }
+        return true;
+    }
+
+// Initialize on page load
+document.addEventListener('DOMContentLoaded', function() {
+    toggleDeclineReason();
+});
+
+document.addEventListener("DOMContentLoaded", () => {
+    // Handle status button clicks
+    const statusModal = document.getElementById("Performance-Status-Modal");
+    const closeBtn = statusModal.querySelector(".close-btn1");
+    const statusModalFormContainer = document.getElementById("Performance-status-modal-form-container");
+
+    // Handle clicking on status buttons (the rows are loaded after the page)
+    document.addEventListener("click", (e) => {
+        const button = e.target.closest(".edit-performance-status");
+        if (!button) {
+            return;
+        }
+        e.preventDefault();
+        const performanceId = button.getAttribute("data-performance-id3");
+
+        // Load the status form dynamically via fetch
+        fetch(`/admin_Performance/status/${performanceId}/`)
+            .then((response) => response.text())
+            .then((data) => {
+                statusModalFormContainer.innerHTML = data;
+                statusModal.classList.add("show"); // Show the modal
+
+                // Add event listener to the form submission
+                const statusForm = statusModalFormContainer.querySelector('form');
+                if (statusForm) {
+                    statusForm.addEventListener('submit', handleStatusFormSubmit);
+                }
+            })
+            .catch((error) => {
+                statusModalFormContainer.innerHTML = "<h2>Error loading status form</h2>";
+                console.error("Error:", error);
+            });
+    });
+
+    // Handle status form submission
+    function handleStatusFormSubmit(e) {
+        e.preventDefault();
+        const form = e.target;
+        const formData = new FormData(form);
+
+        fetch(form.action, {
+            method: 'POST',
+            body: formData,
+            headers: {
+                'X-Requested-With': 'XMLHttpRequest',
+            }
+        })
+        .then(response => response.text())
+        .then(data => {
+            // Close modal and reload page to see updated status
+            statusModal.classList.remove("show");
+            window.location.reload(); // Reload to see the updated status
+        })
+        .catch((error) => {
+            console.error("Error:", error);
+            statusModalFormContainer.innerHTML = "<h2>Error updating status</h2>";
+        });
+    }
+
+    // Close modal using the close button
+    closeBtn.addEventListener("click", () => {
+        statusModal.classList.remove("show");
+    });
+
+    // Close modal when clicking outside
+    window.addEventListener("click", (e) => {
+        if (e.target === statusModal) {
+            statusModal.classList.remove("show");
+        }
+    });
+});
+
+function toggleDeclineReason()
+
+{
+        var statusSelect = document.getElementById('id_status');
+        var declineReasonGroup = document.getElementById('declineReasonGroup');
+
+        if (statusSelect.value === 'Declined') {
+            declineReasonGroup.style.display = 'block';
+            document.getElementById('id_decline_reason').required = true;
+        } else {
+            declineReasonGroup.style.display = 'none';
+            document.getElementById('id_decline_reason').required = false;
+        }
+    }
+
+function validateForm()
+
+{
+        var statusSelect = document.getElementById('id_status');
+        var declineReason = document.getElementById('id_decline_reason');
+
+        if (statusSelect.value === 'Declined') {
+            if (!declineReason.value.trim()) {
+                alert('Please provide a reason for declining the appointment.');
+                declineReason.focus();
+                return false;
+            }
+        }
+        return true;
+    }
+
+// Initialize on page load
+document.addEventListener('DOMContentLoaded', function() {
+    toggleDeclineReason();
+});
+
+document.addEventListener("DOMContentLoaded", () => {
+    // Handle status button clicks
+    const statusModal = document.getElementById("Lesson-Status-Modal");
+    const closeBtn = statusModal.querySelector(".close-btn1");
+    const statusModalFormContainer = document.getElementById("Lesson-status-modal-form-container");
+
+    // Handle clicking on status buttons (the rows are loaded after the page)
+    document.addEventListener("click", (e) => {
+        const button = e.target.closest(".edit-Lesson-status");
+        if (!button) {
+            return;
+        }
+        e.preventDefault();
+        const LessonId = button.getAttribute("data-Lesson-id3");
+
+        // Load the status form dynamically via fetch
+        fetch(`/admin_Lesson/status/${LessonId}/`)
+            .then((response) => response.text())
+            .then((data) => {
+                statusModalFormContainer.innerHTML = data;
+                statusModal.classList.add("show"); // Show the modal
+
+                // Add event listener to the form submission
+                const statusForm = statusModalFormContainer.querySelector('form');
+                if (statusForm) {
+                    statusForm.addEventListener('submit', handleStatusFormSubmit);
+                }
+            })
+            .catch((error) => {
+                statusModalFormContainer.innerHTML = "<h2>Error loading status form</h2>";
+                console.error("Error:", error);
+            });
+    });
+
+    // Handle status form submission
+    function handleStatusFormSubmit(e) {
+        e.preventDefault();
+        const form = e.target;
+        const formData = new FormData(form);
+
+        fetch(form.action, {
+            method: 'POST',
+            body: formData,
+            headers: {
+                'X-Requested-With': 'XMLHttpRequest',
+            }
+        })
+        .then(response => response.text())
+        .then(data => {
+            // Close modal and reload page to see updated status
+            statusModal.classList.remove("show");
+            window.location.reload(); // Reload to see the updated status
+        })
+        .catch((error) => {
+            console.error("Error:", error);
+            statusModalFormContainer.innerHTML = "<h2>Error updating status</h2>";
+        });
+    }
+
+    // Close modal using the close button
+    closeBtn.addEventListener("click", () => {
+        statusModal.classList.remove("show");
+    });
+
+    // Close modal when clicking outside
+    window.addEventListener("click", (e) => {
+        if (e.target === statusModal) {
+            statusModal.classList.remove("show");
+        }
+    });
+});
@@ -0,0 +1,14 @@
+// Handle primary source checkbox changes
+document.addEventListener("DOMContentLoaded", () => {
+    const checkboxes = document.querySelectorAll('.primary-source-checkbox, .table-approval-checkbox');
+
+    checkboxes.forEach(checkbox => {
+        checkbox.addEventListener('change', function() {
+            // Find the closest form and submit it
+            const form = this.closest('.approval-form');
+            if (form) {
+                form.submit();
+            }
+        });
+    });
+});
@@ -0,0 +1,13 @@
+// Lazy load videos when clicked
+document.addEventListener("click", (e) => {
+    if (e.target.closest(".video-placeholder")) {
+        const placeholder = e.target.closest(".video-placeholder");
+        const videoUrl = placeholder.getAttribute("data-video-url");
+        placeholder.innerHTML = `
+            <video width="100%" controls>
+                <source src="${videoUrl}" type="video/mp4">
+                Your browser does not support the video tag.
+            </video>
+        `;
+    }
+});
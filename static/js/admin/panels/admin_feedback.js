@@ -0,0 +1,54 @@
+// Updated JavaScript with renamed classes and IDs
+document.addEventListener("DOMContentLoaded", () => {
+    const deleteAllBtn = document.querySelector(".forum-delete-all-btn");
+
+    // Delete Message Modal: the rows are paged in by data_table.js, so one
+    // modal serves them all and takes the message from the clicked link
+    document.addEventListener("click", (e) => {
+        const link = e.target.closest(".forum-btn-delete-message");
+        if (!link) {
+            return;
+        }
+        e.preventDefault();
+        const modal = document.querySelector(link.getAttribute("href"));
+        if (modal) {
+            modal.querySelector("form").action = link.dataset.action;
+            modal.querySelector("[data-message-author]").textContent = link.dataset.author;
+            modal.querySelector("[data-message-preview]").textContent = link.dataset.preview;
+            modal.classList.add("show");
+        }
+    });
+
+    // Delete All Messages Modal
+    if (deleteAllBtn) {
+        deleteAllBtn.addEventListener("click", (e) => {
+            e.preventDefault();
+            const modal = document.querySelector("#forum-delete-all-modal");
+            if (modal) {
+                modal.classList.add("show");
+            }
+        });
+    }
+
+    // Close modals
+    const closeButtons = document.querySelectorAll(".forum-close-btn, .forum-close-modal");
+    closeButtons.forEach((btn) => {
+        btn.addEventListener("click", (e) => {
+            e.preventDefault();
+            const modal = btn.closest(".forum-modal");
+            if (modal) {
+                modal.classList.remove("show");
+            }
+        });
+    });
+
+    // Close modal when clicking outside
+    const modals = document.querySelectorAll(".forum-modal");
+    modals.forEach((modal) => {
+        modal.addEventListener("click", (e) => {
+            if (e.target === modal) {
+                modal.classList.remove("show");
+            }
+        });
+    });
+});
@@ -0,0 +1,7 @@
+// Approval checkboxes submit their form; the rows are loaded after the page
+document.addEventListener("change", (e) => {
+    const checkbox = e.target.closest('[data-table="testimonials"] .approval-form input[type="checkbox"]');
+    if (checkbox) {
+        checkbox.form.submit();
+    }
+});
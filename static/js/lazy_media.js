@@ -0,0 +1,53 @@
+/*
+ * Media the server renders as placeholders. An element marked data-lazy
+ * keeps its URLs in data-src / data-srcset / data-poster (on itself or on
+ * its <source>s) and only gets them once it comes near the viewport:
+ *   <video preload="none" data-lazy data-poster="/media/posters/12.jpg">
+ * Images use the browser's own loading="lazy" instead.
+ */
+(() => {
+    const ATTRIBUTES = ["src", "srcset", "poster"];
+
+    function hydrate(element) {
+        let sourcesChanged = false;
+        for (const node of [element, ...element.querySelectorAll("source")]) {
+            for (const attribute of ATTRIBUTES) {
+                const value = node.dataset[attribute];
+                if (value === undefined) {
+                    continue;
+                }
+                node.setAttribute(attribute, value);
+                delete node.dataset[attribute];
+                sourcesChanged ||= node.tagName === "SOURCE";
+            }
+        }
+        delete element.dataset.lazy;
+        // A media element only re-reads its <source>s on load()
+        if (sourcesChanged && typeof element.load === "function") {
+            element.load();
+        }
+    }
+
+    function observe() {
+        const elements = document.querySelectorAll("[data-lazy]");
+        if (!("IntersectionObserver" in window)) {
+            elements.forEach(hydrate);
+            return;
+        }
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach((entry) => {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    hydrate(entry.target);
+                }
+            });
+        }, { rootMargin: "200px 0px" });
+        elements.forEach((element) => observer.observe(element));
+    }
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", observe);
+    } else {
+        observe();
+    }
+})();
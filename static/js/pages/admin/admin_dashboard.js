@@ -0,0 +1,60 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const adminToggleModal = document.getElementById('adminToggleModal');
+    const adminModalTitle = document.getElementById('adminModalTitle');
+    const adminModalMessage = document.getElementById('adminModalMessage');
+    const adminToggleConfirm = document.getElementById('adminToggleConfirm');
+    const adminToggleCancel = document.getElementById('adminToggleCancel');
+    let currentActionLink = null;
+
+    // Admin toggle links are in the user rows, which are loaded after the page
+    document.addEventListener('click', function(e) {
+        const link = e.target.closest('.make-admin-link, .remove-admin-link');
+        if (!link) {
+            return;
+        }
+        e.preventDefault();
+        currentActionLink = link;
+
+        if (link.classList.contains('make-admin-link')) {
+            adminModalTitle.textContent = 'Make User Admin';
+            adminModalMessage.textContent = 'You\'re about to grant admin privileges to this user. Are you sure you want to continue?';
+        } else {
+            adminModalTitle.textContent = 'Remove Admin Privileges';
+            adminModalMessage.textContent = 'You\'re about to remove admin privileges from this user. Are you sure you want to continue?';
+        }
+
+        // Update confirm button link
+        adminToggleConfirm.href = link.href;
+
+        adminToggleModal.classList.add('show');
+        document.body.style.overflow = 'hidden';
+    });
+
+    // Handle confirm button
+    adminToggleConfirm.addEventListener('click', function() {
+        adminToggleModal.classList.remove('show');
+        document.body.style.overflow = '';
+    });
+
+    // Handle cancel button
+    adminToggleCancel.addEventListener('click', function() {
+        adminToggleModal.classList.remove('show');
+        document.body.style.overflow = '';
+    });
+
+    // Close modal when clicking outside
+    window.addEventListener('click', function(e) {
+        if (e.target === adminToggleModal) {
+            adminToggleModal.classList.remove('show');
+            document.body.style.overflow = '';
+        }
+    });
+
+    // Close modal with Escape key
+    document.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape' && adminToggleModal.classList.contains('show')) {
+            adminToggleModal.classList.remove('show');
+            document.body.style.overflow = '';
+        }
+    });
+});
@@ -0,0 +1,82 @@
+fetch("/get_chart_data/")
+    .then(response => response.json())
+    .then(data => {
+        // Create the bar chart
+        new Chart(document.getElementById("viewsChart"), {
+            type: "bar",
+            data: {
+                labels: data.instrument_names,
+                datasets: [{
+                    label: "Views",
+                    data: data.instrument_views,
+                    backgroundColor: "rgba(54, 162, 235, 0.6)"
+                }]
+            }
+        });
+    });
+
+
+    fetch("/get_category_chart_data/")
+.then(response => response.json())
+.then(data => {
+    // Create the pie chart
+    new Chart(document.getElementById("categoryChart"), {
+        type: "pie",
+        data: {
+            labels: data.category_labels,
+            datasets: [{
+                label: "Instrument Categories",
+                data: data.category_counts,
+                backgroundColor: [
+                    "rgba(255, 99, 132, 0.6)",
+                    "rgba(54, 162, 235, 0.6)",
+                    "rgba(255, 206, 86, 0.6)",
+                    "rgba(75, 192, 192, 0.6)",
+                    "rgba(153, 102, 255, 0.6)",
+                    "rgba(255, 159, 64, 0.6)"
+                ]
+            }]
+        }
+    });
+});
+
+  fetch("/get_login_chart_data/")
+    .then(response => response.json())
+    .then(data => {
+        // Create the line chart
+        new Chart(document.getElementById("userLoginChart"), {
+            type: "line",
+            data: {
+                labels: data.labels,
+                datasets: [{
+                    label: "User Logins",
+                    data: data.data,
+                    backgroundColor: "rgba(75, 192, 192, 0.2)",
+                    borderColor: "rgba(75, 192, 192, 1)",
+                    borderWidth: 2
+                }]
+            }
+        });
+    });
+
+// Stat cards: the page renders the cached counters, this keeps them current
+// while the dashboard stays open (app/dashboard.py)
+(() => {
+    const statsGrid = document.getElementById("dashboard-stats");
+    const refreshSeconds = Number(statsGrid?.dataset.refreshSeconds);
+    if (!refreshSeconds) return;
+
+    setInterval(() => {
+        if (document.hidden) return;
+        fetch("/get_dashboard_stats/")
+            .then(response => response.ok ? response.json() : Promise.reject(response.status))
+            .then(stats => {
+                statsGrid.querySelectorAll("[data-stat]").forEach(card => {
+                    if (stats[card.dataset.stat] !== undefined) {
+                        card.textContent = stats[card.dataset.stat];
+                    }
+                });
+            })
+            .catch(error => console.error("Error refreshing stats:", error));
+    }, refreshSeconds * 1000);
+})();
@@ -0,0 +1,32 @@
+const video = document.getElementById('bgVideo');
+const soundBtn = document.getElementById('soundBtn');
+const soundIcon = soundBtn.querySelector('.sound-icon');
+const soundText = soundBtn.querySelector('.sound-text');
+
+function toggleSound() {
+  video.muted = !video.muted;
+  soundIcon.textContent = video.muted ? '🔇' : '🔊';
+  soundText.textContent = video.muted ? 'Unmute' : 'Mute';
+
+  // Add ripple effect
+  const ripple = document.createElement('span');
+  ripple.classList.add('ripple');
+  soundBtn.appendChild(ripple);
+  setTimeout(() => ripple.remove(), 600);
+}
+
+// Loading animation
+window.addEventListener('load', () => {
+  document.querySelector('.loading-overlay').classList.add('loaded');
+  setTimeout(() => {
+    document.querySelector('.loading-overlay').style.display = 'none';
+  }, 500);
+
+    // Extra UI: Explore button scroll (unchanged)
+const exploreBtn = document.getElementById('exploreBtn');
+if (exploreBtn) {
+  exploreBtn.addEventListener('click', function () {
+    document.querySelector('.performance-container')?.scrollIntoView({ behavior: 'smooth' });
+  });
+}
+});
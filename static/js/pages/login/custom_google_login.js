@@ -0,0 +1,25 @@
+setTimeout(function() {
+            window.location.href = "/accounts/google/login/";
+        }, 3000);
+
+        // Add to your existing JavaScript
+document.addEventListener('DOMContentLoaded', function() {
+    const googleBtn = document.querySelector('.google-login-btn');
+
+    if (googleBtn) {
+        googleBtn.addEventListener('click', function(e) {
+            // Add loading state
+            const originalText = this.innerHTML;
+            this.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Connecting to Google...';
+            this.style.opacity = '0.7';
+            this.style.pointerEvents = 'none';
+
+            // Restore after 3 seconds if still on page
+            setTimeout(() => {
+                this.innerHTML = originalText;
+                this.style.opacity = '1';
+                this.style.pointerEvents = 'auto';
+            }, 3000);
+        });
+    }
+});
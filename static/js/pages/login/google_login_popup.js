@@ -0,0 +1,74 @@
+// Google Login with Popup Confirmation
+document.addEventListener('DOMContentLoaded', function() {
+    const googlePopupModal = document.getElementById('googleLoginPopup');
+    const googlePopupClose = document.getElementById('googlePopupClose');
+    const googlePopupCancel = document.getElementById('googlePopupCancel');
+    const googlePopupConfirm = document.getElementById('googlePopupConfirm');
+    const googleLoginBtn = document.getElementById('google-login-btn');
+
+    // Show popup when Google login button is clicked
+    if (googleLoginBtn) {
+        googleLoginBtn.addEventListener('click', function(e) {
+            e.preventDefault();
+            showGooglePopup();
+        });
+    }
+
+    function showGooglePopup() {
+        googlePopupModal.style.display = 'flex';
+        document.body.style.overflow = 'hidden'; // Prevent background scrolling
+    }
+
+    function hideGooglePopup() {
+        googlePopupModal.style.display = 'none';
+        document.body.style.overflow = ''; // Restore scrolling
+    }
+
+    // Close events
+    if (googlePopupClose) googlePopupClose.addEventListener('click', hideGooglePopup);
+    if (googlePopupCancel) googlePopupCancel.addEventListener('click', hideGooglePopup);
+
+    // Close when clicking outside
+    googlePopupModal.addEventListener('click', function(e) {
+        if (e.target === googlePopupModal) {
+            hideGooglePopup();
+        }
+    });
+
+    // Handle Google login confirmation
+    if (googlePopupConfirm) {
+        googlePopupConfirm.addEventListener('click', function() {
+            // Close the popup
+            hideGooglePopup();
+
+            // Close the main login modal if it's open
+            const loginModal = document.getElementById('loginModal');
+            if (loginModal) {
+                loginModal.style.display = 'none';
+            }
+
+            // Show loading state on the Google button
+            const originalText = googleLoginBtn.innerHTML;
+            googleLoginBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Connecting to Google...';
+            googleLoginBtn.disabled = true;
+
+            // Redirect to Google OAuth after a short delay for better UX
+            setTimeout(() => {
+                window.location.href = '/accounts/google/login/';
+            }, 500);
+
+            // Restore button after 5 seconds (in case redirect fails)
+            setTimeout(() => {
+                googleLoginBtn.innerHTML = originalText;
+                googleLoginBtn.disabled = false;
+            }, 5000);
+        });
+    }
+
+    // Close popup with Escape key
+    document.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape' && googlePopupModal.style.display === 'flex') {
+            hideGooglePopup();
+        }
+    });
+});
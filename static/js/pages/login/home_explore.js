@@ -0,0 +1,20 @@
+document.addEventListener('DOMContentLoaded', function () {
+  // Explore Instruments button
+  const exploreBtn = document.getElementById('exploreBtn');
+  // Instructor button
+  const exploreInstructorBtn = document.getElementById('exploreBtnInstructor');
+
+  // Scroll to Instruments section
+  if (exploreBtn) {
+    exploreBtn.addEventListener('click', function () {
+      document.querySelector('.ins-body1')?.scrollIntoView({ behavior: 'smooth' });
+    });
+  }
+
+  // Scroll to Instructor section
+  if (exploreInstructorBtn) {
+    exploreInstructorBtn.addEventListener('click', function () {
+      document.querySelector('.instructor-section')?.scrollIntoView({ behavior: 'smooth' });
+    });
+  }
+});
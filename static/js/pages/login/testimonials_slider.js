@@ -0,0 +1,80 @@
+document.addEventListener('DOMContentLoaded', function() {
+  const container = document.querySelector('.testimonials-container');
+  const cards = document.querySelectorAll('.testimonial-card');
+  const prevBtn = document.querySelector('.slider-prev');
+  const nextBtn = document.querySelector('.slider-next');
+  const dotsContainer = document.querySelector('.slider-dots');
+
+  // Only initialize if we have testimonials and navigation
+  if (cards.length > 0 && prevBtn && nextBtn && dotsContainer) {
+    // Create dots
+    const totalSlides = Math.ceil(cards.length / getVisibleCards());
+    for (let i = 0; i < totalSlides; i++) {
+      const dot = document.createElement('div');
+      dot.classList.add('slider-dot');
+      if (i === 0) dot.classList.add('active');
+      dot.addEventListener('click', () => {
+        goToSlide(i);
+      });
+      dotsContainer.appendChild(dot);
+    }
+
+    const dots = document.querySelectorAll('.slider-dot');
+    let currentIndex = 0;
+    let cardWidth = cards[0].offsetWidth + 30;
+    let visibleCards = getVisibleCards();
+
+    function getVisibleCards() {
+      if (window.innerWidth >= 992) return 3;
+      if (window.innerWidth >= 768) return 2;
+      return 1;
+    }
+
+    function updateSlider() {
+      visibleCards = getVisibleCards();
+      cardWidth = cards[0].offsetWidth + 30;
+      if (prevBtn) prevBtn.disabled = currentIndex === 0;
+      if (nextBtn) nextBtn.disabled = currentIndex >= Math.ceil(cards.length / visibleCards) - 1;
+      updateDots();
+    }
+
+    function goToSlide(index) {
+      currentIndex = index;
+      container.scrollTo({
+        left: index * (cardWidth * visibleCards + 30), // Added gap calculation
+        behavior: 'smooth'
+      });
+      updateSlider();
+    }
+
+    function updateDots() {
+      dots.forEach((dot, index) => {
+        dot.classList.toggle('active', index === currentIndex);
+      });
+    }
+
+    function nextSlide() {
+      if (currentIndex < Math.ceil(cards.length / visibleCards) - 1) {
+        currentIndex++;
+        goToSlide(currentIndex);
+      }
+    }
+
+    function prevSlide() {
+      if (currentIndex > 0) {
+        currentIndex--;
+        goToSlide(currentIndex);
+      }
+    }
+
+    prevBtn.addEventListener('click', prevSlide);
+    nextBtn.addEventListener('click', nextSlide);
+
+    window.addEventListener('resize', function() {
+      updateSlider();
+      goToSlide(currentIndex);
+    });
+
+    updateSlider();
+  }
+});
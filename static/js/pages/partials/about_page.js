@@ -0,0 +1,180 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Generic Carousel Function
+    function initializeCarousel(carouselId, itemsPerPage = 3) {
+        const container = document.getElementById(carouselId + 'Container');
+        const prevBtn = document.getElementById(carouselId + 'Prev');
+        const nextBtn = document.getElementById(carouselId + 'Next');
+        const dotsContainer = document.getElementById(carouselId + 'Dots');
+
+        const items = container.querySelectorAll('.about-carousel-item');
+        const totalItems = items.length;
+        let currentPage = 0;
+
+        // Calculate items per page based on screen size
+        function getItemsPerPage() {
+            const width = window.innerWidth;
+            if (width <= 768) {
+                return 1; // 1 item on mobile
+            } else if (width <= 992) {
+                return 2; // 2 items on tablet
+            } else {
+                return 3; // 3 items on desktop
+            }
+        }
+
+        let currentItemsPerPage = getItemsPerPage();
+        let totalPages = Math.ceil(totalItems / currentItemsPerPage);
+
+        // Generate dots
+        function generateDots() {
+            dotsContainer.innerHTML = '';
+            for (let i = 0; i < totalPages; i++) {
+                const dot = document.createElement('div');
+                dot.classList.add('about-carousel-dot');
+                if (i === 0) dot.classList.add('active');
+                dot.addEventListener('click', () => goToPage(i));
+                dotsContainer.appendChild(dot);
+            }
+        }
+
+        // Update item widths based on current items per page
+        function updateItemWidths() {
+            const percentage = 100 / currentItemsPerPage;
+            items.forEach(item => {
+                item.style.flex = `0 0 ${percentage}%`;
+                item.style.maxWidth = `${percentage}%`;
+            });
+        }
+
+        // Update navigation buttons
+        function updateNavigation() {
+            prevBtn.disabled = currentPage === 0;
+            nextBtn.disabled = currentPage === totalPages - 1;
+
+            // Update dots
+            const dots = dotsContainer.querySelectorAll('.about-carousel-dot');
+            dots.forEach((dot, index) => {
+                dot.classList.toggle('active', index === currentPage);
+            });
+        }
+
+        // Go to specific page
+        function goToPage(page) {
+            currentPage = page;
+            const translateX = -currentPage * 100;
+            container.style.transform = `translateX(${translateX}%)`;
+            updateNavigation();
+        }
+
+        // Handle window resize
+        function handleResize() {
+            const newItemsPerPage = getItemsPerPage();
+            if (newItemsPerPage !== currentItemsPerPage) {
+                currentItemsPerPage = newItemsPerPage;
+                totalPages = Math.ceil(totalItems / currentItemsPerPage);
+
+                // Adjust current page if it's out of bounds
+                if (currentPage >= totalPages) {
+                    currentPage = totalPages - 1;
+                }
+
+                updateItemWidths();
+                generateDots();
+                goToPage(currentPage);
+            }
+        }
+
+        // Initialize
+        updateItemWidths();
+        generateDots();
+        updateNavigation();
+
+        // Event listeners for navigation
+        prevBtn.addEventListener('click', () => {
+            if (currentPage > 0) {
+                goToPage(currentPage - 1);
+            }
+        });
+
+        nextBtn.addEventListener('click', () => {
+            if (currentPage < totalPages - 1) {
+                goToPage(currentPage + 1);
+            }
+        });
+
+        window.addEventListener('resize', handleResize);
+    }
+
+    // Initialize all carousels
+    initializeCarousel('cultural');
+    initializeCarousel('audience');
+    initializeCarousel('team');
+
+    // Back to top button
+    const backToTopButton = document.querySelector('.about-back-to-top');
+
+    window.addEventListener('scroll', function() {
+        if (window.pageYOffset > 300) {
+            backToTopButton.classList.add('active');
+        } else {
+            backToTopButton.classList.remove('active');
+        }
+    });
+
+    backToTopButton.addEventListener('click', function() {
+        window.scrollTo({
+            top: 0,
+            behavior: 'smooth'
+        });
+    });
+
+    // Smooth scroll for navigation links
+    document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+        anchor.addEventListener('click', function(e) {
+            e.preventDefault();
+
+            const targetId = this.getAttribute('href');
+            if (targetId === '#') return;
+
+            const targetElement = document.querySelector(targetId);
+            if (targetElement) {
+                targetElement.scrollIntoView({
+                    behavior: 'smooth'
+                });
+            }
+        });
+    });
+
+    // Animate elements when they come into view
+    const animateOnScroll = function() {
+        const elements = document.querySelectorAll('.about-card, .about-team-member, .about-testimonial-card, .about-audience-item, .about-offering-item');
+
+        elements.forEach(element => {
+            const elementPosition = element.getBoundingClientRect().top;
+            const windowHeight = window.innerHeight;
+
+            if (elementPosition < windowHeight - 100) {
+                element.style.opacity = '1';
+                element.style.transform = 'translateY(0)';
+            }
+        });
+    };
+
+    // Set initial state
+    document.querySelectorAll('.about-card, .about-team-member, .about-testimonial-card, .about-audience-item, .about-offering-item').forEach(element => {
+        element.style.opacity = '0';
+        element.style.transform = 'translateY(20px)';
+        element.style.transition = 'all 0.6s ease';
+    });
+
+    window.addEventListener('scroll', animateOnScroll);
+    window.addEventListener('load', animateOnScroll);
+});
+
+// Loading animation
+window.addEventListener('load', () => {
+    document.querySelector('.loading-overlay').classList.add('loaded');
+    setTimeout(() => {
+        document.querySelector('.loading-overlay').style.display = 'none';
+    }, 500);
+});
@@ -0,0 +1,73 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const contactForm = document.getElementById('contactForm');
+    const modal = document.getElementById('successModal');
+    const modalMessage = document.getElementById('modalMessage');
+    const closeModal = document.querySelector('.close-modal');
+    const modalButton = document.querySelector('.modal-button');
+
+    // Form submission handler
+    contactForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+
+        // Get form values
+        const formData = new FormData(contactForm);
+
+        // AJAX request
+        fetch(contactForm.action, {
+            method: 'POST',
+            body: formData,
+            headers: {
+                'X-Requested-With': 'XMLHttpRequest',
+                'X-CSRFToken': formData.get('csrfmiddlewaretoken')
+            }
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                // Show success message in modal
+                modalMessage.innerHTML = `
+                    Thank you, <strong>${data.name}</strong>!<br>
+                    Your message about <strong>${data.subject}</strong> has been received.<br>
+                    We'll respond to you at <strong>${data.email}</strong> soon.
+                `;
+                modal.style.display = "block";
+                contactForm.reset();
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            // Fallback for non-AJAX submission
+            contactForm.submit();
+        });
+    });
+
+    // Close modal handlers
+    closeModal.addEventListener('click', function() {
+        modal.style.display = "none";
+    });
+
+    modalButton.addEventListener('click', function() {
+        modal.style.display = "none";
+    });
+
+    // Close when clicking outside modal
+    window.addEventListener('click', function(event) {
+        if (event.target == modal) {
+            modal.style.display = "none";
+        }
+    });
+
+    // Add floating animation to instrument icons
+    const icons = document.querySelectorAll('.instrument-icons img');
+    icons.forEach((icon, index) => {
+        icon.style.animation = `float ${3 + index * 0.5}s infinite ease-in-out`;
+    });
+});
+
+    // Loading animation
+window.addEventListener('load', () => {
+    document.querySelector('.loading-overlay').classList.add('loaded');
+    setTimeout(() => {
+    document.querySelector('.loading-overlay').style.display = 'none';
+    }, 500);
+});
@@ -0,0 +1,64 @@
+let currentViewAudio = document.getElementById('instrument-view-audio');
+let currentlyPlayingView = null;
+
+function toggleSound(soundUrl, buttonElement, buttonType) {
+  // If clicking the currently playing button
+  if (currentlyPlayingView === buttonElement) {
+    if (!currentViewAudio.paused) {
+      currentViewAudio.pause();
+      updateViewButtonState(buttonElement, buttonType, false);
+      currentlyPlayingView = null;
+      return;
+    }
+  }
+
+  // If a different sound is already playing
+  if (currentlyPlayingView && currentlyPlayingView !== buttonElement) {
+    currentViewAudio.pause();
+    updateViewButtonState(currentlyPlayingView, 
+                     currentlyPlayingView.classList.contains('audio-view-btn') ? 'featured' : 'list', 
+                     false);
+  }
+
+  // Play new sound or resume paused sound
+  if (currentViewAudio.src !== soundUrl) {
+    currentViewAudio.src = soundUrl;
+    currentViewAudio.load();
+  }
+
+  currentViewAudio.play()
+    .then(() => {
+      currentlyPlayingView = buttonElement;
+      updateViewButtonState(buttonElement, buttonType, true);
+    })
+    .catch(error => {
+      console.error("Audio playback failed:", error);
+      updateViewButtonState(buttonElement, buttonType, false);
+    });
+
+  // Handle when audio ends naturally
+  currentViewAudio.onended = function() {
+    updateViewButtonState(buttonElement, buttonType, false);
+    currentlyPlayingView = null;
+  };
+}
+
+function updateViewButtonState(button, type, isPlaying) {
+  if (type === 'featured') {
+    if (isPlaying) {
+      button.innerHTML = '<i class="fas fa-pause"></i> Playing...';
+      button.classList.add('playing');
+    } else {
+      button.innerHTML = '<i class="fas fa-volume-up"></i> Hear It';
+      button.classList.remove('playing');
+    }
+  } else {
+    if (isPlaying) {
+      button.innerHTML = '<i class="fas fa-pause"></i> Playing';
+      button.classList.add('playing');
+    } else {
+      button.innerHTML = '<i class="fas fa-volume-up"></i> Play';
+      button.classList.remove('playing');
+    }
+  }
+}
@@ -0,0 +1,224 @@
+// Pagination functionality
+const threeDInstrumentsPerPage = 6;
+let threeDCurrentPage = 1;
+let threeDTotalPages = 1;
+
+// Initialize pagination
+document.addEventListener('DOMContentLoaded', function() {
+    const threeDInstrumentCards = document.querySelectorAll('.threeD-instrument-card');
+    threeDTotalPages = Math.ceil(threeDInstrumentCards.length / threeDInstrumentsPerPage);
+
+    // Show first page initially
+    showThreeDPage(1);
+    updateThreeDPaginationControls();
+
+    // Add event listeners to pagination buttons
+    document.getElementById('threeD-prev-btn').addEventListener('click', goToThreeDPrevPage);
+    document.getElementById('threeD-next-btn').addEventListener('click', goToThreeDNextPage);
+});
+
+// Show specific page
+function showThreeDPage(pageNumber) {
+    const threeDInstrumentCards = document.querySelectorAll('.threeD-instrument-card');
+    const threeDStartIndex = (pageNumber - 1) * threeDInstrumentsPerPage;
+    const threeDEndIndex = threeDStartIndex + threeDInstrumentsPerPage;
+
+    // Hide all instruments
+    threeDInstrumentCards.forEach(card => {
+        card.style.display = 'none';
+    });
+
+    // Show instruments for current page
+    for (let i = threeDStartIndex; i < threeDEndIndex && i < threeDInstrumentCards.length; i++) {
+        threeDInstrumentCards[i].style.display = 'block';
+    }
+
+    threeDCurrentPage = pageNumber;
+    updateThreeDPaginationControls();
+}
+
+// Go to previous page
+function goToThreeDPrevPage() {
+    if (threeDCurrentPage > 1) {
+        showThreeDPage(threeDCurrentPage - 1);
+        // Scroll to top of gallery
+        document.getElementById('threeD-gallery').scrollIntoView({ behavior: 'smooth' });
+    }
+}
+
+// Go to next page
+function goToThreeDNextPage() {
+    if (threeDCurrentPage < threeDTotalPages) {
+        showThreeDPage(threeDCurrentPage + 1);
+        // Scroll to top of gallery
+        document.getElementById('threeD-gallery').scrollIntoView({ behavior: 'smooth' });
+    }
+}
+
+// Update pagination controls
+function updateThreeDPaginationControls() {
+    const threeDPrevBtn = document.getElementById('threeD-prev-btn');
+    const threeDNextBtn = document.getElementById('threeD-next-btn');
+    const threeDPageIndicator = document.getElementById('threeD-page-indicator');
+
+    // Update button states
+    threeDPrevBtn.disabled = threeDCurrentPage === 1;
+    threeDNextBtn.disabled = threeDCurrentPage === threeDTotalPages;
+
+    // Update page indicator
+    threeDPageIndicator.textContent = `Page ${threeDCurrentPage} of ${threeDTotalPages}`;
+}
+
+// Simple JavaScript for modal and view switching
+let threeDCurrentAudio = null;
+
+function openThreeDModal(threeDModalId) {
+    const threeDModal = document.getElementById(threeDModalId);
+    if (threeDModal) {
+        threeDModal.style.display = "block";
+        document.body.style.overflow = "hidden";
+
+        // Reset any playing audio
+        if (threeDCurrentAudio) {
+            threeDCurrentAudio.pause();
+            threeDCurrentAudio.currentTime = 0;
+            const threeDPlayingBtns = document.querySelectorAll('.threeD-modal-sound-btn.playing');
+            threeDPlayingBtns.forEach(btn => {
+                btn.classList.remove('playing');
+                btn.innerHTML = '<span>Play Sample</span><i class="fas fa-play"></i>';
+            });
+            threeDCurrentAudio = null;
+        }
+    }
+}
+
+function closeThreeDModal() {
+    const threeDModals = document.querySelectorAll('.threeD-modal');
+    threeDModals.forEach(modal => {
+        modal.style.display = "none";
+    });
+
+    // Stop any playing audio
+    if (threeDCurrentAudio) {
+        threeDCurrentAudio.pause();
+        threeDCurrentAudio.currentTime = 0;
+        threeDCurrentAudio = null;
+    }
+
+    document.body.style.overflow = "auto";
+}
+
+function switchThreeDView(threeDShowId, threeDHideId, threeDClickedBtn) {
+    const threeDShowElement = document.getElementById(threeDShowId);
+    const threeDHideElement = document.getElementById(threeDHideId);
+    const threeDButtons = threeDClickedBtn.parentElement.querySelectorAll('.threeD-view-toggle-btn');
+
+    if (threeDShowElement && threeDHideElement) {
+        threeDShowElement.style.display = 'block';
+        threeDHideElement.style.display = 'none';
+        loadThreeDModel(threeDShowElement.querySelector('model-viewer'));
+
+        // Update button states
+        threeDButtons.forEach(btn => {
+            btn.classList.remove('active');
+        });
+        threeDClickedBtn.classList.add('active');
+    }
+}
+
+// Models are only downloaded once the 3D view is opened: the low-poly
+// LOD first when there is one, then the full model replaces it
+function loadThreeDModel(threeDViewer) {
+    if (!threeDViewer || threeDViewer.getAttribute('src')) {
+        return;
+    }
+    const threeDFullSrc = threeDViewer.dataset.src;
+    if (threeDViewer.dataset.lod) {
+        threeDViewer.addEventListener('load', function () {
+            threeDViewer.src = threeDFullSrc;
+        }, { once: true });
+        threeDViewer.src = threeDViewer.dataset.lod;
+    } else {
+        threeDViewer.src = threeDFullSrc;
+    }
+}
+
+// Toggle modal info section - MODIFIED to completely hide/show
+function toggleThreeDInfo(threeDInfoId, threeDButton) {
+    const threeDInfoElement = document.getElementById(threeDInfoId);
+    const threeDIcon = threeDButton.querySelector('i');
+
+    if (threeDInfoElement.classList.contains('hidden')) {
+        // Show info
+        threeDInfoElement.classList.remove('hidden');
+        threeDInfoElement.classList.remove('collapsed');
+        threeDIcon.className = 'fa-solid fa-chevron-down';
+    } else {
+        // Hide info completely
+        threeDInfoElement.classList.add('hidden');
+        threeDIcon.className = 'fa-solid fa-chevron-up';
+    }
+}
+
+// Prefer the compressed Opus build where the browser supports it
+const threeDCanPlayOpus = !!document.createElement('audio').canPlayType('audio/webm; codecs="opus"');
+
+function playThreeDSound(threeDButton, threeDSoundUrl) {
+    if (threeDButton.dataset.opus && threeDCanPlayOpus) {
+        threeDSoundUrl = threeDButton.dataset.opus;
+    } else if (threeDButton.dataset.aac) {
+        threeDSoundUrl = threeDButton.dataset.aac;
+    }
+
+    // Stop current audio if playing
+    if (threeDCurrentAudio) {
+        threeDCurrentAudio.pause();
+        threeDCurrentAudio.currentTime = 0;
+        const threeDPlayingBtns = document.querySelectorAll('.threeD-modal-sound-btn.playing');
+        threeDPlayingBtns.forEach(btn => {
+            btn.classList.remove('playing');
+            btn.innerHTML = '<span>Play Sample</span><i class="fas fa-play"></i>';
+        });
+    }
+
+    // Create new audio element if needed
+    if (!threeDCurrentAudio || threeDCurrentAudio.src !== threeDSoundUrl) {
+        threeDCurrentAudio = new Audio(threeDSoundUrl);
+
+        threeDCurrentAudio.onended = function() {
+            threeDButton.classList.remove('playing');
+            threeDButton.innerHTML = '<span>Play Sample</span><i class="fas fa-play"></i>';
+            threeDCurrentAudio = null;
+        };
+    }
+
+    if (threeDCurrentAudio.paused) {
+        threeDCurrentAudio.play();
+        threeDButton.classList.add('playing');
+        threeDButton.innerHTML = '<span>Playing</span><i class="fas fa-pause"></i>';
+    } else {
+        threeDCurrentAudio.pause();
+        threeDCurrentAudio.currentTime = 0;
+        threeDButton.classList.remove('playing');
+        threeDButton.innerHTML = '<span>Play Sample</span><i class="fas fa-play"></i>';
+        threeDCurrentAudio = null;
+    }
+}
+
+// Close modal when clicking outside content
+window.onclick = function(event) {
+    if (event.target.classList.contains('threeD-modal')) {
+        closeThreeDModal();
+    }
+}
+
+// Smooth scrolling for anchor links
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        e.preventDefault();
+
+        document.querySelector(this.getAttribute('href')).scrollIntoView({
+            behavior: 'smooth'
+        });
+    });
+});
@@ -0,0 +1,89 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const loader = document.getElementById('loader5');
+    const progressBar = document.getElementById('progress5');
+    const logo = document.getElementById('logo5');
+    const particlesContainer = document.getElementById('particles5');
+    const instrumentsContainer = document.getElementById('instruments5');
+
+    const filipinoInstruments = [
+        { name: 'Kulintang', icon: '🎵' },
+        { name: 'Rondalla', icon: '🎸' },
+        { name: 'Angklung', icon: '🎶' },
+        { name: 'Kudyapi', icon: '🪕' },
+        { name: 'Gabbang', icon: '🎼' }
+    ];
+
+    function createParticles() {
+        const particleCount = 40;
+        const particleTypes = ['banig5', 'sarimanok5', 'leaf5'];
+
+        for (let i = 0; i < particleCount; i++) {
+            const particle = document.createElement('div');
+            const type = particleTypes[Math.floor(Math.random() * particleTypes.length)];
+            particle.classList.add('particle5', type);
+
+            const size = Math.random() * 30 + 10;
+            const posX = Math.random() * 100;
+            const duration = Math.random() * 20 + 10;
+            const delay = Math.random() * 10;
+            const opacity = Math.random() * 0.5 + 0.3;
+            const rotation = Math.random() * 360;
+
+            particle.style.width = `${size}px`;
+            particle.style.height = `${size}px`;
+            particle.style.left = `${posX}%`;
+            particle.style.bottom = `-${size}px`;
+            particle.style.animationDuration = `${duration}s`;
+            particle.style.animationDelay = `${delay}s`;
+            particle.style.opacity = opacity;
+            particle.style.transform = `rotate(${rotation}deg)`;
+
+            particlesContainer.appendChild(particle);
+        }
+    }
+
+    function showInstruments() {
+        filipinoInstruments.forEach((instrument, index) => {
+            setTimeout(() => {
+                const icon = document.createElement('div');
+                icon.className = 'instrument-icon5';
+                icon.style.backgroundImage = `url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><text x="50%" y="50%" font-size="60" text-anchor="middle" dominant-baseline="middle" fill="%235C3317">${instrument.icon}</text></svg>')`;
+                icon.style.animationDelay = `${index * 0.3}s`;
+                instrumentsContainer.appendChild(icon);
+            }, index * 500);
+        });
+    }
+
+    function animateProgressBar(duration) {
+        const startTime = performance.now();
+
+        function updateProgress(now) {
+            const elapsed = now - startTime;
+            const progress = Math.min(elapsed / duration, 1);
+            progressBar.style.width = `${progress * 100}%`;
+
+            if (progress < 1) {
+                requestAnimationFrame(updateProgress);
+            }
+        }
+
+        requestAnimationFrame(updateProgress);
+    }
+
+    function completeLoading() {
+        loader.classList.add('fade-out5');
+        setTimeout(() => {
+            loader.style.display = 'none';
+        }, 800);
+    }
+
+    const instrumentAnimations = ['kulintangPulse5', 'rondallaStrum5'];
+    const randomAnim = instrumentAnimations[Math.floor(Math.random() * instrumentAnimations.length)];
+    logo.style.animationName = randomAnim;
+
+    createParticles();
+    showInstruments();
+    animateProgressBar(5000); // 5 seconds
+
+    setTimeout(completeLoading, 5000);
+});
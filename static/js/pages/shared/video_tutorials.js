@@ -0,0 +1,315 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Track currently playing video
+    let currentlyPlaying = null;
+
+    // Initialize saved videos from local storage
+    let savedVideos = JSON.parse(localStorage.getItem('savedVideos')) || [];
+
+    // Set up Intersection Observer to pause videos when not visible
+    const videoObserver = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            const video = entry.target;
+            if (!entry.isIntersecting && !video.paused) {
+                video.pause();
+                const overlay = video.closest('.video-wrapper').querySelector('.video-overlay');
+                overlay.style.opacity = '1';
+                overlay.style.pointerEvents = 'auto';
+                overlay.querySelector('.play-button i').className = 'fas fa-play';
+
+                if (currentlyPlaying === video) {
+                    currentlyPlaying = null;
+                }
+            }
+        });
+    }, {
+        threshold: 0.5 // Trigger when 50% of the video is visible
+    });
+
+    // Observe all videos
+    document.querySelectorAll('.video').forEach(video => {
+        videoObserver.observe(video);
+    });
+
+    // Browsers without native HLS get the adaptive stream through hls.js,
+    // attached only on first play so nothing is fetched before that
+    function attachStream(video) {
+        const manifest = video.dataset.hls;
+        if (!manifest || video.dataset.streamAttached) return;
+        video.dataset.streamAttached = 'true';
+        if (!video.canPlayType('application/vnd.apple.mpegurl') && window.Hls && Hls.isSupported()) {
+            const hls = new Hls();
+            hls.loadSource(manifest);
+            hls.attachMedia(video);
+        }
+    }
+
+    // Play/Pause button functionality
+    document.querySelectorAll('.play-button').forEach(button => {
+        button.addEventListener('click', function() {
+            const videoWrapper = this.closest('.video-wrapper');
+            const video = videoWrapper.querySelector('.video');
+            const overlay = videoWrapper.querySelector('.video-overlay');
+            const playButtonIcon = this.querySelector('i');
+            const videoCard = videoWrapper.closest('.video-card');
+            const videoId = videoCard.dataset.videoId;
+
+            // Pause any currently playing video
+            if (currentlyPlaying && currentlyPlaying !== video) {
+                currentlyPlaying.pause();
+                const otherOverlay = currentlyPlaying.closest('.video-wrapper').querySelector('.video-overlay');
+                otherOverlay.style.opacity = '1';
+                otherOverlay.style.pointerEvents = 'auto';
+                otherOverlay.querySelector('.play-button i').className = 'fas fa-play';
+            }
+
+            // Toggle play/pause
+            if (video.paused) {
+                attachStream(video);
+                video.play();
+                playButtonIcon.className = 'fas fa-pause';
+                currentlyPlaying = video;
+                overlay.style.opacity = '0';
+                overlay.style.pointerEvents = 'none';
+
+                // COUNT VIEW WHEN VIDEO STARTS PLAYING
+                // Simulate view count increment (replace with actual fetch call)
+                const viewsElement = videoCard.querySelector('.views');
+                if (viewsElement) {
+                    const currentViews = parseInt(viewsElement.textContent.replace(/\D/g, ''));
+                    viewsElement.innerHTML = `<i class="fas fa-eye"></i> ${currentViews + 1} views`;
+                }
+
+            } else {
+                video.pause();
+                playButtonIcon.className = 'fas fa-play';
+                currentlyPlaying = null;
+                overlay.style.opacity = '1';
+                overlay.style.pointerEvents = 'auto';
+            }
+        });
+    });
+
+    // Click on video to pause
+    document.querySelectorAll('.video').forEach(video => {
+        video.addEventListener('click', function() {
+            if (!this.paused) {
+                this.pause();
+                const overlay = this.closest('.video-wrapper').querySelector('.video-overlay');
+                overlay.style.opacity = '1';
+                overlay.style.pointerEvents = 'auto';
+                overlay.querySelector('.play-button i').className = 'fas fa-play';
+                currentlyPlaying = null;
+            }
+        });
+    });
+
+    // Fullscreen button functionality
+    document.querySelectorAll('.control-btn').forEach(button => {
+        button.addEventListener('click', function(e) {
+            e.stopPropagation();
+
+            if (this.querySelector('.fa-expand')) {
+                const videoWrapper = this.closest('.video-wrapper');
+                const video = videoWrapper.querySelector('.video');
+
+                if (video.requestFullscreen) {
+                    video.requestFullscreen();
+                } else if (video.webkitRequestFullscreen) {
+                    video.webkitRequestFullscreen();
+                } else if (video.msRequestFullscreen) {
+                    video.msRequestFullscreen();
+                }
+            } else if (this.querySelector('.fa-volume-up, .fa-volume-mute')) {
+                // Toggle mute
+                const video = this.closest('.video-wrapper').querySelector('.video');
+                video.muted = !video.muted;
+                this.querySelector('i').className = video.muted ? 'fas fa-volume-mute' : 'fas fa-volume-up';
+            }
+        });
+    });
+
+    // Handle fullscreen changes
+    document.addEventListener('fullscreenchange', handleFullscreenChange);
+    document.addEventListener('webkitfullscreenchange', handleFullscreenChange);
+    document.addEventListener('mozfullscreenchange', handleFullscreenChange);
+    document.addEventListener('MSFullscreenChange', handleFullscreenChange);
+
+    function handleFullscreenChange() {
+        const fullscreenElement = document.fullscreenElement || 
+                                 document.webkitFullscreenElement || 
+                                 document.mozFullScreenElement || 
+                                 document.msFullscreenElement;
+
+        // If a video entered fullscreen, pause other videos
+        if (fullscreenElement && fullscreenElement.tagName === 'VIDEO') {
+            // Pause any currently playing video that's not the fullscreen one
+            if (currentlyPlaying && currentlyPlaying !== fullscreenElement) {
+                currentlyPlaying.pause();
+                const otherOverlay = currentlyPlaying.closest('.video-wrapper').querySelector('.video-overlay');
+                otherOverlay.style.opacity = '1';
+                otherOverlay.style.pointerEvents = 'auto';
+                otherOverlay.querySelector('.play-button i').className = 'fas fa-play';
+            }
+
+            // Set the fullscreen video as currently playing
+            currentlyPlaying = fullscreenElement;
+        }
+
+        // If exiting fullscreen, update the play button
+        if (!fullscreenElement && currentlyPlaying) {
+            const overlay = currentlyPlaying.closest('.video-wrapper').querySelector('.video-overlay');
+            if (overlay && !currentlyPlaying.paused) {
+                overlay.querySelector('.play-button i').className = 'fas fa-pause';
+            }
+        }
+    }
+
+    // Video ended event to show overlay again
+    document.querySelectorAll('.video').forEach(video => {
+        video.addEventListener('ended', function() {
+            const overlay = this.closest('.video-wrapper').querySelector('.video-overlay');
+            overlay.style.opacity = '1';
+            overlay.style.pointerEvents = 'auto';
+            overlay.querySelector('.play-button i').className = 'fas fa-play';
+            currentlyPlaying = null;
+        });
+
+        // Pause event to handle when user manually pauses
+        video.addEventListener('pause', function() {
+            if (currentlyPlaying === this) {
+                const overlay = this.closest('.video-wrapper').querySelector('.video-overlay');
+                overlay.style.opacity = '1';
+                overlay.style.pointerEvents = 'auto';
+                overlay.querySelector('.play-button i').className = 'fas fa-play';
+                currentlyPlaying = null;
+            }
+        });
+    });
+
+    // Save button functionality
+    document.querySelectorAll('.save-btn').forEach(button => {
+        const videoCard = button.closest('.video-card');
+        const videoId = videoCard.dataset.videoId;
+
+        // Set initial saved state
+        if (savedVideos.includes(videoId)) {
+            button.innerHTML = '<i class="fas fa-bookmark"></i> Saved';
+            button.classList.add('saved');
+        }
+
+        button.addEventListener('click', function(e) {
+            e.stopPropagation();
+            const videoId = this.closest('.video-card').dataset.videoId;
+            const index = savedVideos.indexOf(videoId);
+
+            if (index === -1) {
+                // Save video
+                savedVideos.push(videoId);
+                this.innerHTML = '<i class="fas fa-bookmark"></i> Saved';
+                this.classList.add('saved');
+
+                // Show feedback
+                showSaveFeedback('Video saved!');
+            } else {
+                // Unsave video
+                savedVideos.splice(index, 1);
+                this.innerHTML = '<i class="far fa-bookmark"></i> Save';
+                this.classList.remove('saved');
+
+                // Show feedback
+                showSaveFeedback('Video removed!');
+
+                // If we're on the saved page, hide the video
+                const currentTab = document.querySelector('.sidenav-menu li.active a');
+                if (currentTab && currentTab.hasAttribute('data-saved-videos')) {
+                    this.closest('.video-card').style.display = 'none';
+
+                    // Check if there are no more saved videos
+                    const remainingSavedVideos = document.querySelectorAll('.video-card:not([style*="display: none"])').length;
+                    if (remainingSavedVideos === 0) {
+                        document.querySelector('.section-header').innerHTML = `
+                            <h2><i class="fas fa-bookmark"></i> No Saved Performances</h2>
+                            <p>Save performances by clicking the "Save" button on videos</p>
+                        `;
+                    }
+                }
+            }
+
+            // Update local storage
+            localStorage.setItem('savedVideos', JSON.stringify(savedVideos));
+        });
+    });
+
+    // Featured and the categories are filtered by the server (?category=);
+    // Saved lives in local storage, so its link sends the saved ids along
+    const savedLink = document.querySelector('.sidenav-menu a[data-saved-videos]');
+    if (savedLink) {
+        savedLink.addEventListener('click', function(e) {
+            e.preventDefault();
+            window.location.search = '?saved=' + savedVideos.map(encodeURIComponent).join(',');
+        });
+    }
+
+    // Helper function to show save feedback
+    function showSaveFeedback(message) {
+        const feedback = document.createElement('div');
+        feedback.className = 'save-feedback';
+        feedback.textContent = message;
+        document.body.appendChild(feedback);
+
+        setTimeout(() => {
+            feedback.classList.add('show');
+        }, 10);
+
+        setTimeout(() => {
+            feedback.classList.remove('show');
+            setTimeout(() => {
+                document.body.removeChild(feedback);
+            }, 300);
+        }, 2000);
+    }
+
+    // Side navigation scroll functionality
+    const sidenavMenu = document.querySelector('.sidenav-menu');
+    const prevButton = document.querySelector('.prev-button');
+    const nextButton = document.querySelector('.next-button');
+
+    function updateNavButtons() {
+        const scrollLeft = sidenavMenu.scrollLeft;
+        const maxScroll = sidenavMenu.scrollWidth - sidenavMenu.clientWidth;
+
+        prevButton.disabled = scrollLeft <= 10;
+        nextButton.disabled = scrollLeft >= maxScroll - 10;
+    }
+
+    if (prevButton && nextButton) {
+        prevButton.addEventListener('click', () => {
+            sidenavMenu.scrollBy({
+                left: -200,
+                behavior: 'smooth'
+            });
+        });
+
+        nextButton.addEventListener('click', () => {
+            sidenavMenu.scrollBy({
+                left: 200,
+                behavior: 'smooth'
+            });
+        });
+
+        sidenavMenu.addEventListener('scroll', updateNavButtons);
+
+        // Initialize button states
+        updateNavButtons();
+
+        // Hide buttons when not scrollable
+        const observer = new ResizeObserver(() => {
+            const isScrollable = sidenavMenu.scrollWidth > sidenavMenu.clientWidth;
+            prevButton.style.display = isScrollable ? 'flex' : 'none';
+            nextButton.style.display = isScrollable ? 'flex' : 'none';
+            updateNavButtons();
+        });
+
+        observer.observe(sidenavMenu);
+    }
+});
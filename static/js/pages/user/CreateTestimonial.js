@@ -0,0 +1,61 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const starRatings = document.querySelectorAll('.star-rating');
+    const form = document.getElementById('testimonial-form');
+    const submitBtn = document.getElementById('submit-btn');
+    const btnText = submitBtn.querySelector('.btn-text');
+    const errorContainer = document.getElementById('error-message-container');
+
+    // Star rating functionality
+    starRatings.forEach(rating => {
+        const inputs = rating.querySelectorAll('input[type="radio"]');
+
+        inputs.forEach(input => {
+            input.addEventListener('change', function() {
+                rating.setAttribute('data-rating', this.value);
+            });
+
+            input.addEventListener('click', function() {
+                const value = this.value;
+                inputs.forEach(star => star.checked = false);
+                inputs.forEach(star => {
+                    if (star.value >= value) {
+                        star.checked = true;
+                    }
+                });
+            });
+        });
+    });
+
+    // Form submission handling
+    form.addEventListener('submit', function(e) {
+        // Basic validation
+        const message = document.getElementById('id_message').value.trim();
+        const rating = document.querySelector('input[name="rating"]:checked');
+
+        if (!message) {
+            e.preventDefault();
+            showError('Please enter a testimonial message.');
+            return;
+        }
+
+        if (!rating) {
+            e.preventDefault();
+            showError('Please select a rating.');
+            return;
+        }
+
+        // Show loading state
+        submitBtn.classList.add('btn-loading');
+        btnText.textContent = 'Submitting...';
+    });
+
+    function showError(message) {
+        errorContainer.textContent = message;
+        errorContainer.style.display = 'block';
+
+        // Auto-hide error after 5 seconds
+        setTimeout(() => {
+            errorContainer.style.display = 'none';
+        }, 5000);
+    }
+});
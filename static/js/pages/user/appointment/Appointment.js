@@ -0,0 +1,34 @@
+// Add some interactive animations
+document.addEventListener('DOMContentLoaded', function() {
+  // Add animation to form sections when switching tabs
+  const tabInputs = document.querySelectorAll('input[name="appoint-tab"]');
+
+  tabInputs.forEach(input => {
+    input.addEventListener('change', function() {
+      // Add a subtle animation to the active form
+      const activeForm = document.querySelector('.appoint-form-section[style*="display: block"]');
+      if (activeForm) {
+        activeForm.style.animation = 'none';
+        setTimeout(() => {
+          activeForm.style.animation = 'fadeIn 0.4s ease forwards';
+        }, 10);
+      }
+    });
+  });
+
+  // Add success animation to submit buttons
+  const submitButtons = document.querySelectorAll('.appoint-btn-primary');
+
+  submitButtons.forEach(button => {
+    button.addEventListener('click', function(e) {
+      // Only add animation if form is valid
+      const form = this.closest('form');
+      if (form.checkValidity()) {
+        this.classList.add('success');
+        setTimeout(() => {
+          this.classList.remove('success');
+        }, 800);
+      }
+    });
+  });
+});
@@ -0,0 +1,120 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+    const navbar = document.querySelector('.navbar');
+    const header = document.querySelector('.header-navbar');
+    const logoutBtn = document.getElementById('logoutBtn');
+    const logoutModal = document.getElementById('logoutModal');
+    const confirmLogoutBtn = document.getElementById('confirmLogout');
+    const cancelLogoutBtn = document.getElementById('cancelLogout');
+    let logoutHref = '';
+
+    // Mobile menu functionality
+    mobileMenuBtn.addEventListener('click', function() {
+        const isExpanded = this.getAttribute('aria-expanded') === 'true';
+        this.classList.toggle('active');
+        navbar.classList.toggle('active');
+        this.setAttribute('aria-expanded', !isExpanded);
+
+        // Toggle body scroll when menu is open
+        document.body.style.overflow = !isExpanded ? 'hidden' : '';
+    });
+
+    // Close mobile menu when clicking a link
+    document.addEventListener('click', function(e) {
+        if (window.innerWidth <= 768 && e.target.closest('.navbar a')) {
+            if (!e.target.closest('.dropdown-content a')) {
+                mobileMenuBtn.classList.remove('active');
+                navbar.classList.remove('active');
+                mobileMenuBtn.setAttribute('aria-expanded', 'false');
+                document.body.style.overflow = '';
+            }
+        }
+    });
+
+    // Improved scroll behavior
+    let lastScrollPosition = window.pageYOffset || document.documentElement.scrollTop;
+    let isHidden = false;
+    const scrollThreshold = 50;
+    const navbarHeight = header.offsetHeight;
+    let scrollTimeout;
+
+    function handleScroll() {
+        const currentScrollPosition = window.pageYOffset || document.documentElement.scrollTop;
+
+        if (currentScrollPosition > 10) {
+            header.classList.add('scrolled');
+        } else {
+            header.classList.remove('scrolled');
+        }
+
+        if (Math.abs(currentScrollPosition - lastScrollPosition) > scrollThreshold) {
+            if (currentScrollPosition > lastScrollPosition && currentScrollPosition > navbarHeight) {
+                if (!isHidden && !navbar.classList.contains('active')) {
+                    header.classList.add('hide');
+                    isHidden = true;
+                }
+            } else {
+                if (isHidden) {
+                    header.classList.remove('hide');
+                    header.style.animation = 'none';
+                    void header.offsetWidth;
+                    header.style.animation = 'navbarSlideIn 0.4s cubic-bezier(0.25, 0.8, 0.5, 1)';
+                    isHidden = false;
+                }
+            }
+
+            lastScrollPosition = currentScrollPosition;
+        }
+
+    }
+
+    window.addEventListener('scroll', function() {
+        requestAnimationFrame(handleScroll);
+    });
+
+    header.addEventListener('mouseenter', function() {
+        if (isHidden) {
+            header.classList.remove('hide');
+            isHidden = false;
+            clearTimeout(scrollTimeout);
+        }
+    });
+
+    // Custom logout modal
+    logoutBtn.addEventListener('click', function(e) {
+        e.preventDefault();
+        logoutHref = this.getAttribute('href');
+        logoutModal.classList.add('show');
+    });
+
+    confirmLogoutBtn.addEventListener('click', function() {
+        logoutModal.classList.remove('show');
+        window.location.href = logoutHref;
+    });
+
+    cancelLogoutBtn.addEventListener('click', function() {
+        logoutModal.classList.remove('show');
+    });
+
+    // Close modal when clicking outside
+    window.addEventListener('click', function(e) {
+        if (e.target === logoutModal) {
+            logoutModal.classList.remove('show');
+        }
+    });
+
+    function handleResize() {
+        if (window.innerWidth > 768) {
+            mobileMenuBtn.classList.remove('active');
+            navbar.classList.remove('active');
+            mobileMenuBtn.setAttribute('aria-expanded', 'false');
+            document.body.style.overflow = '';
+        }
+    }
+
+    let resizeTimeout;
+    window.addEventListener('resize', function() {
+        clearTimeout(resizeTimeout);
+        resizeTimeout = setTimeout(handleResize, 250);
+    });
+});